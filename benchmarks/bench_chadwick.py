@@ -0,0 +1,41 @@
+"""Benchmark the Chadwick-style flat event export.
+
+Usage:
+    python benchmarks/bench_chadwick.py --year 2022 --data-dir ~/.pyretrosheet/data
+
+The year's games are loaded once, after which the rows per second of writing their events to a CSV file are reported
+for several chunk sizes.
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pyretrosheet import load
+from pyretrosheet.export import chadwick
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--data-dir", type=Path, default=load.DEFAULT_DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    games = list(load.iter_games(args.year, args.data_dir))
+    print(f"{'chunk size':>12}{'rows':>10}{'write s':>10}{'rows/s':>12}")
+    for chunk_size in [1, 1_000, chadwick.DEFAULT_CHUNK_SIZE]:
+        timings = []
+        num_rows = 0
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as tmp_dir, (Path(tmp_dir) / "events.csv").open("w", newline="") as f:
+                start = time.perf_counter()
+                num_rows = chadwick.write_events(games, f, chunk_size=chunk_size)
+                timings.append(time.perf_counter() - start)
+        seconds = min(timings)
+        print(f"{chunk_size:>12}{num_rows:>10}{seconds:>10.3f}{num_rows / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark loading play-by-play files stored with each compression codec.
+
+Usage:
+    python benchmarks/bench_compression.py --year 2022 --data-dir ~/.pyretrosheet/data
+
+The year's plain play-by-play files are copied into a temporary directory per codec, after which the size on disk,
+the time to stream the raw lines and the time to fully load the games are reported.
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pyretrosheet import load, retrosheet
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--data-dir", type=Path, default=load.DEFAULT_DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    plain_files = retrosheet.retrieve_years_play_by_play_files(args.year, args.data_dir)
+    print(f"{'codec':<8}{'MB on disk':>12}{'read s':>10}{'read MB/s':>12}{'load s':>10}{'games/s':>10}")
+    for compression in [None, *retrosheet.Compression]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = [_store(file, Path(tmp_dir), compression) for file in plain_files]
+            size_mb = sum(file.stat().st_size for file in files) / 1e6
+            raw_mb = sum(file.stat().st_size for file in plain_files) / 1e6
+
+            read_seconds = _best_of(args.repeat, lambda files=files: _read_lines(files))
+            load_seconds = _best_of(args.repeat, lambda files=files: _load_games(files))
+            num_games = _load_games(files)
+            codec = compression.name if compression else "NONE"
+            print(
+                f"{codec:<8}{size_mb:>12.2f}{read_seconds:>10.3f}{raw_mb / read_seconds:>12.1f}"
+                f"{load_seconds:>10.3f}{num_games / load_seconds:>10.0f}"
+            )
+
+
+def _store(file: Path, target_dir: Path, compression: retrosheet.Compression | None) -> Path:
+    if compression is None:
+        return Path(shutil.copy(file, target_dir))
+
+    target = target_dir / f"{file.name}{compression.suffix}"
+    with file.open("rb") as source, compression.open(target, "wb") as compressed:
+        shutil.copyfileobj(source, compressed)
+    return target
+
+
+def _read_lines(files: list[Path]) -> None:
+    for file in files:
+        with retrosheet.open_play_by_play_file(file) as lines:
+            for _ in lines:
+                pass
+
+
+def _load_games(files: list[Path]) -> int:
+    return sum(len(load._get_games_from_play_by_play_file(file)) for file in files)
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    main()
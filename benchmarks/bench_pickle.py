@@ -0,0 +1,83 @@
+"""Benchmark pickling games with the models' compact `__reduce__` against default dataclass pickling.
+
+Usage:
+    python benchmarks/bench_pickle.py --year 2022 --data-dir ~/.pyretrosheet/data
+
+Reports the pickled bytes per game and the microseconds per game to pickle and unpickle the year's games. The garbage
+collector is disabled while timing (as `timeit` does), since its pauses otherwise dominate unpickling many objects.
+"""
+import argparse
+import gc
+import pickle
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from pyretrosheet import load
+from pyretrosheet.models.game import Game
+from pyretrosheet.models.game_id import GameID
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.play.advance import Advance
+from pyretrosheet.models.play.description import Description
+from pyretrosheet.models.play.event import Event
+from pyretrosheet.models.play.modifier import Modifier
+from pyretrosheet.models.player import Player
+
+MODELS = [Game, GameID, Play, Event, Description, Modifier, Advance, Player]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--year", type=int, default=2022)
+    parser.add_argument("--data-dir", type=Path, default=load.DEFAULT_DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    games = list(load.iter_games(args.year, args.data_dir))
+    print(f"{'pickling':<10}{'bytes/game':>12}{'dump us/game':>14}{'load us/game':>14}")
+    with _default_pickling():
+        _report("default", games, args.repeat)
+    _report("compact", games, args.repeat)
+
+
+def _report(name: str, games: list[Game], repeat: int) -> None:
+    data = pickle.dumps(games, pickle.HIGHEST_PROTOCOL)
+    dump_seconds = _best_of(repeat, lambda: pickle.dumps(games, pickle.HIGHEST_PROTOCOL))
+    load_seconds = _best_of(repeat, lambda: pickle.loads(data))
+    num_games = len(games)
+    print(
+        f"{name:<10}{len(data) / num_games:>12.0f}"
+        f"{dump_seconds / num_games * 1e6:>14.1f}{load_seconds / num_games * 1e6:>14.1f}"
+    )
+
+
+@contextmanager
+def _default_pickling() -> Iterator[None]:
+    """Temporarily pickle the models as attribute dicts, as dataclasses are pickled by default."""
+    reducers = {model: model.__dict__["__reduce__"] for model in MODELS}
+    for model in MODELS:
+        model.__reduce__ = object.__reduce__  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        for model, reducer in reducers.items():
+            model.__reduce__ = reducer  # type: ignore[method-assign]
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark scanning years for one record type with the push parser against loading games.
+
+Usage:
+    python benchmarks/bench_records.py --years 2021 2022 --data-dir ~/.pyretrosheet/data
+
+Reports the seconds taken to collect every `data,er` record by reading the raw lines, by the push parser and by
+loading every game.
+"""
+import argparse
+import time
+from pathlib import Path
+
+from pyretrosheet import load, records, retrosheet
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, nargs="+", default=[2022])
+    parser.add_argument("--data-dir", type=Path, default=load.DEFAULT_DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    files = [file for year in args.years for file in retrosheet.retrieve_years_play_by_play_files(year, args.data_dir)]
+
+    def read_lines() -> int:
+        num_lines = 0
+        for file in files:
+            with retrosheet.open_play_by_play_file(file) as lines:
+                num_lines += sum(1 for _ in lines)
+        return num_lines
+
+    def push_parse() -> int:
+        data_records: list[records.Record] = []
+        record_parser = records.RecordParser()
+        record_parser.on_data(data_records.append)
+        for file in files:
+            record_parser.parse_file(file)
+        return len(data_records)
+
+    def load_games() -> int:
+        return sum(len(game.earned_runs) for year in args.years for game in load.iter_games(year, args.data_dir))
+
+    print(f"{'method':>12}{'results':>10}{'seconds':>10}")
+    for name, method in [("read lines", read_lines), ("push parse", push_parse), ("load games", load_games)]:
+        timings = []
+        num_results = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            num_results = method()
+            timings.append(time.perf_counter() - start)
+        print(f"{name:>12}{num_results:>10}{min(timings):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark computing batting stats per batter with the vectorized engine against looping over plays.
+
+Usage:
+    python benchmarks/bench_stats.py --years 2021 2022 --data-dir ~/.pyretrosheet/data
+
+Reports the seconds taken to count every batter's at bats, hits, walks and total bases over the loaded plays, by
+looping over the plays' predicates and by `BattingStats.from_table` (which excludes building the play table).
+"""
+import argparse
+import time
+from collections import Counter
+from pathlib import Path
+
+from pyretrosheet import load
+from pyretrosheet.models.play import Play
+from pyretrosheet.stats import BattingStats
+from pyretrosheet.table import PlayTable
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, nargs="+", default=[2022])
+    parser.add_argument("--data-dir", type=Path, default=load.DEFAULT_DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    games = [game for year in args.years for game in load.load_games(year, args.data_dir)]
+    plays = [event for game in games for event in game.chronological_events if isinstance(event, Play)]
+    play_table = PlayTable.from_games(games)
+
+    def loop() -> int:
+        at_bats: Counter[str] = Counter()
+        hits: Counter[str] = Counter()
+        walks: Counter[str] = Counter()
+        total_bases: Counter[str] = Counter()
+        for play in plays:
+            at_bats[play.batter_id] += play.is_an_at_bat()
+            hits[play.batter_id] += play.is_hit()
+            walks[play.batter_id] += play.is_walk()
+            total_bases[play.batter_id] += (
+                play.is_single() + 2 * play.is_double() + 3 * play.is_triple() + 4 * play.is_home_run()
+            )
+        return len(at_bats)
+
+    def vectorized() -> int:
+        return len(BattingStats.from_table(play_table).total_bases)
+
+    print(f"{'method':>12}{'batters':>10}{'seconds':>10}")
+    for name, method in [("loop", loop), ("vectorized", vectorized)]:
+        timings = []
+        num_batters = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            num_batters = method()
+            timings.append(time.perf_counter() - start)
+        print(f"{name:>12}{num_batters:>10}{min(timings):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,4 @@
 """Load and analyze retrosheet.org MLB data."""
-from pyretrosheet.load import load_games  # noqa: F401
+from pyretrosheet.collection import GameCollection  # noqa: F401
+from pyretrosheet.load import aload_games, astream_games, iter_games, iter_games_by_year, load_games  # noqa: F401
+from pyretrosheet.retrosheet import Compression  # noqa: F401
@@ -0,0 +1,290 @@
+"""A persisted index of every player's career, for loading only the games a player appeared in.
+
+The index is a SQLite database (`<data_dir>/career_index.sqlite3`) mapping each player id to their appearances: the
+year, play-by-play file and offset (within the file) of each game they appeared in, along with the positions in the
+game's chronological events of their plays as a batter and of their lineup (start and sub) records.
+
+Files are indexed with the push parser (see `pyretrosheet.records`) without building any models, once: building the
+index again only indexes years not indexed yet, and a refresh re-indexes the files it changed (see `refresh_target`).
+Loading a player's games then parses only those games, so its cost scales with the length of the player's career
+rather than with the amount of history.
+"""
+import json
+import sqlite3
+from collections import defaultdict
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.collection import GameCollection
+from pyretrosheet.records import Record, RecordParser
+from pyretrosheet.refresh import RefreshResult, RefreshTarget
+
+INDEX_FILE_NAME = "career_index.sqlite3"
+
+
+@dataclass
+class CareerAppearance:
+    """A player's appearance in a game.
+
+    Args:
+        player_id: the player's id
+        year: the year of the game
+        file_name: the name of the game's play-by-play file, without any compression suffix
+        game_offset: the game's offset within the file (0 for the file's first game)
+        game_id: the game's id, e.g. 'WAS202204070'
+        play_positions: the positions of the player's plays as a batter in the game's chronological events
+        lineup_positions: the positions of the player's start and sub records in the game's chronological events
+    """
+
+    player_id: str
+    year: int
+    file_name: str
+    game_offset: int
+    game_id: str
+    play_positions: list[int]
+    lineup_positions: list[int]
+
+
+def build(
+    years: Iterable[int],
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    force_download: bool = False,
+    compression: retrosheet.Compression | None = None,
+) -> Path:
+    """Add years to the index, creating it if needed. Years already indexed are skipped.
+
+    Args:
+        years: the years to index
+        data_dir: dir where Retrosheet data (and the index) will be stored (defaults to '~/.pyretrosheet/data')
+        force_download: force a fresh download of the data even if it already exists
+        compression: store play-by-play files compressed with the given codec
+
+    Returns:
+        the path of the index
+    """
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    index_path = data_dir / INDEX_FILE_NAME
+    with closing(_connect(index_path)) as connection:
+        indexed_years = {year for (year,) in connection.execute("SELECT DISTINCT year FROM indexed_files")}
+        for year in years:
+            if year in indexed_years:
+                continue
+
+            files = retrosheet.retrieve_years_play_by_play_files(
+                year, data_dir, force_download=force_download, compression=compression
+            )
+            with retrosheet.data_dir_lock(data_dir, str(year)):
+                _index_files(connection, year, files)
+    return index_path
+
+
+def refresh_target(
+    data_dir: Path | str = load.DEFAULT_DATA_DIR, compression: retrosheet.Compression | None = None
+) -> RefreshTarget:
+    """Get a `refresh.refresh` target re-indexing the files changed by a refresh, creating the index if needed.
+
+    Args:
+        data_dir: dir where Retrosheet data (and the index) is stored (defaults to '~/.pyretrosheet/data')
+        compression: the codec the play-by-play files are stored with
+    """
+    data_dir = Path(data_dir)
+
+    def apply(result: RefreshResult) -> None:
+        if not result.changed_files:
+            return
+
+        files = retrosheet.retrieve_years_play_by_play_files(result.year, data_dir, compression=compression)
+        changed_files = [file for file in files if retrosheet.get_play_by_play_file_name(file) in result.changed_files]
+        removed_file_names = set(result.changed_files) - {
+            retrosheet.get_play_by_play_file_name(file) for file in changed_files
+        }
+        index_path = data_dir / INDEX_FILE_NAME
+        with retrosheet.data_dir_lock(data_dir, str(result.year)), closing(_connect(index_path)) as connection:
+            _index_files(connection, result.year, changed_files, removed_file_names)
+
+    return apply
+
+
+def get_appearances(player_id: str, data_dir: Path | str = load.DEFAULT_DATA_DIR) -> list[CareerAppearance]:
+    """Get a player's appearances, in order of year, file and game offset.
+
+    Args:
+        player_id: the player's id
+        data_dir: dir where Retrosheet data (and the index) is stored (defaults to '~/.pyretrosheet/data')
+    """
+    with closing(_connect(Path(data_dir) / INDEX_FILE_NAME)) as connection:
+        rows = connection.execute(
+            "SELECT year, file_name, game_offset, game_id, play_positions, lineup_positions FROM appearances"
+            " WHERE player_id = ? ORDER BY year, file_name, game_offset",
+            (player_id,),
+        ).fetchall()
+    return [
+        CareerAppearance(
+            player_id=player_id,
+            year=year,
+            file_name=file_name,
+            game_offset=game_offset,
+            game_id=game_id,
+            play_positions=json.loads(play_positions),
+            lineup_positions=json.loads(lineup_positions),
+        )
+        for year, file_name, game_offset, game_id, play_positions, lineup_positions in rows
+    ]
+
+
+def load_career_games(
+    player_id: str,
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    compression: retrosheet.Compression | None = None,
+) -> GameCollection:
+    """Load the games a player appeared in, parsing only those games.
+
+    Each file holding an appearance is read up to the player's last game within it; other games are skipped unparsed.
+
+    Args:
+        player_id: the player's id
+        data_dir: dir where Retrosheet data (and the index) is stored (defaults to '~/.pyretrosheet/data')
+        compression: the codec the play-by-play files are stored with
+    """
+    data_dir = Path(data_dir)
+    game_offsets: dict[int, dict[str, set[int]]] = defaultdict(lambda: defaultdict(set))
+    for appearance in get_appearances(player_id, data_dir):
+        game_offsets[appearance.year][appearance.file_name].add(appearance.game_offset)
+
+    games = GameCollection()
+    for year, file_game_offsets in game_offsets.items():
+        files = {
+            retrosheet.get_play_by_play_file_name(file): file
+            for file in retrosheet.retrieve_years_play_by_play_files(year, data_dir, compression=compression)
+        }
+        for file_name in sorted(file_game_offsets):
+            games.extend(_load_file_games(files[file_name], file_game_offsets[file_name]))
+    return games
+
+
+def _load_file_games(file: Path, game_offsets: set[int]) -> GameCollection:
+    """Load the games at offsets within a play-by-play file.
+
+    Args:
+        file: the play-by-play file
+        game_offsets: the offsets of the games to load
+    """
+    games = GameCollection()
+    last_game_offset = max(game_offsets)
+    with retrosheet.open_play_by_play_file(file) as lines:
+        for game_offset, game_lines in enumerate(load.iter_game_lines(line.rstrip("\r\n") for line in lines)):
+            if game_offset in game_offsets:
+                games.extend(load.iter_games_from_lines(game_lines, file.as_posix()))
+            if game_offset == last_game_offset:
+                break
+    return games
+
+
+def _index_files(
+    connection: sqlite3.Connection, year: int, files: Iterable[Path], removed_file_names: Iterable[str] = ()
+) -> None:
+    """Index play-by-play files, replacing any previous index of them, in a single transaction.
+
+    Callers hold the year's data dir lock (see `retrosheet.data_dir_lock`), so that a concurrent download does not
+    replace the files while they are read. The lock is taken after retrieving the files, as retrieval takes it too.
+
+    Args:
+        connection: connection to the index
+        year: the year of the files
+        files: the play-by-play files
+        removed_file_names: the names of play-by-play files that no longer exist, whose index is deleted
+    """
+    with connection:
+        for file_name in removed_file_names:
+            connection.execute("DELETE FROM appearances WHERE file_name = ?", (file_name,))
+            connection.execute("DELETE FROM indexed_files WHERE file_name = ?", (file_name,))
+        for file in files:
+            file_name = retrosheet.get_play_by_play_file_name(file)
+            connection.execute("DELETE FROM appearances WHERE file_name = ?", (file_name,))
+            indexer = _FileIndexer(year, file_name)
+            indexer.parser.parse_file(file)
+            indexer.end_game()
+            connection.executemany("INSERT INTO appearances VALUES (?, ?, ?, ?, ?, ?, ?)", indexer.rows)
+            connection.execute("INSERT OR REPLACE INTO indexed_files VALUES (?, ?)", (file_name, year))
+
+
+class _FileIndexer:
+    """Collects the appearances of every player in a play-by-play file from its records."""
+
+    def __init__(self, year: int, file_name: str):
+        self.year = year
+        self.file_name = file_name
+        self.rows: list[tuple[str, int, str, int, str, str, str]] = []
+        self.game_offset = -1
+        self.game_id = ""
+        self.position = 0
+        # map of player id to the positions of their plays and lineup records within the current game
+        self.positions: dict[str, tuple[list[int], list[int]]] = {}
+        self.parser = RecordParser()
+        self.parser.on_id(self.on_id)
+        self.parser.on_start(self.on_lineup)
+        self.parser.on_sub(self.on_lineup)
+        self.parser.on_play(self.on_play)
+        self.parser.on_radj(self.on_radj)
+
+    def on_id(self, record: Record) -> None:
+        self.end_game()
+        self.game_offset += 1
+        self.game_id = record.game_id or ""
+        self.position = 0
+
+    def on_lineup(self, record: Record) -> None:
+        self._get_positions(record.values[0])[1].append(self.position)
+        self.position += 1
+
+    def on_play(self, record: Record) -> None:
+        self._get_positions(record.values[2])[0].append(self.position)
+        self.position += 1
+
+    def on_radj(self, record: Record) -> None:
+        self.position += 1
+
+    def end_game(self) -> None:
+        self.rows.extend(
+            (
+                player_id,
+                self.year,
+                self.file_name,
+                self.game_offset,
+                self.game_id,
+                json.dumps(play_positions),
+                json.dumps(lineup_positions),
+            )
+            for player_id, (play_positions, lineup_positions) in self.positions.items()
+        )
+        self.positions = {}
+
+    def _get_positions(self, player_id: str) -> tuple[list[int], list[int]]:
+        if player_id not in self.positions:
+            self.positions[player_id] = ([], [])
+        return self.positions[player_id]
+
+
+def _connect(index_path: Path) -> sqlite3.Connection:
+    """Connect to the index, creating its schema if needed.
+
+    Args:
+        index_path: the path of the index
+    """
+    connection = sqlite3.connect(index_path)
+    with connection:
+        connection.execute("CREATE TABLE IF NOT EXISTS indexed_files (file_name TEXT PRIMARY KEY, year INTEGER)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS appearances (player_id TEXT NOT NULL, year INTEGER NOT NULL,"
+            " file_name TEXT NOT NULL, game_offset INTEGER NOT NULL, game_id TEXT NOT NULL,"
+            " play_positions TEXT NOT NULL, lineup_positions TEXT NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS appearances_player_id ON appearances (player_id, year, file_name, game_offset)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS appearances_file_name ON appearances (file_name)")
+    return connection
@@ -0,0 +1,195 @@
+"""A list of games with indexes for cross-game lookups."""
+import bisect
+import datetime as dt
+from collections.abc import Iterable
+from typing import Any, SupportsIndex
+
+from pyretrosheet import views
+from pyretrosheet.models.game import Game
+from pyretrosheet.models.player import Player
+
+
+class GameCollection(list[Game]):
+    """A list of games, as returned by the loaders, with hash indexes of its games.
+
+    Indexes map game ids, teams, dates and players to games and are each built on first use, so lookups take constant
+    (or, for date ranges, logarithmic) time plus the size of the result rather than a scan of every game. Mutating the
+    collection discards the indexes, which are rebuilt on the next lookup. Lookups return new lists, in the order of
+    the games in the collection.
+    """
+
+    _games_by_id: dict[str, Game] | None
+    _team_games: dict[str, list[Game]] | None
+    _date_games: dict[dt.date, list[Game]] | None
+    _dates: list[dt.date]
+    # map of player id to the games they appeared in, and to their appearances
+    _player_index: tuple[dict[str, list[Game]], dict[str, list[tuple[Game, Player]]]] | None
+
+    def __init__(self, games: Iterable[Game] = ()):
+        """Initialize the collection.
+
+        Args:
+            games: the games of the collection
+        """
+        super().__init__(games)
+        self._invalidate()
+
+    def __reduce__(self) -> tuple[type["GameCollection"], tuple[Any, ...]]:
+        """Pickle as the list of games, leaving out the indexes."""
+        return (self.__class__, (list(self),))
+
+    def get_game(self, raw_game_id: str) -> Game:
+        """Get a game by its id.
+
+        Args:
+            raw_game_id: the raw value of the game's id, e.g. 'id,WAS202204070'
+
+        Raises:
+            KeyError: if the collection has no game with the id
+        """
+        if self._games_by_id is None:
+            self._games_by_id = {game.id.raw: game for game in self}
+        return self._games_by_id[raw_game_id]
+
+    def get_team_games(self, team_id: str) -> list[Game]:
+        """Get the games a team played in, home or away.
+
+        Args:
+            team_id: the Retrosheet team id, e.g. 'WAS'
+        """
+        if self._team_games is None:
+            self._team_games = {}
+            for game in self:
+                self._team_games.setdefault(game.home_team_id, []).append(game)
+                self._team_games.setdefault(game.visiting_team_id, []).append(game)
+        return list(self._team_games.get(team_id, []))
+
+    def get_date_games(self, date: dt.date) -> list[Game]:
+        """Get the games played on a date.
+
+        Args:
+            date: the date
+        """
+        return list(self._get_date_games().get(date, []))
+
+    def get_games_between(self, start_date: dt.date, end_date: dt.date) -> list[Game]:
+        """Get the games played between two dates, inclusive, ordered by date.
+
+        Args:
+            start_date: the first date
+            end_date: the last date
+        """
+        date_games = self._get_date_games()
+        start = bisect.bisect_left(self._dates, start_date)
+        end = bisect.bisect_right(self._dates, end_date)
+        return [game for date in self._dates[start:end] for game in date_games[date]]
+
+    def get_player_games(self, player_id: str) -> list[Game]:
+        """Get the games a player appeared in, as a starter or a sub.
+
+        Args:
+            player_id: the player's id
+        """
+        player_games, _ = self._get_player_index()
+        return list(player_games.get(player_id, []))
+
+    def get_player_appearances(self, player_id: str) -> list[tuple[Game, Player]]:
+        """Get a player's appearances (start and sub lines) and the games they appeared in.
+
+        Args:
+            player_id: the player's id
+        """
+        _, player_appearances = self._get_player_index()
+        return list(player_appearances.get(player_id, []))
+
+    def get_team_players(self, team_id: str) -> list[Player]:
+        """Get the players for a team among the games of the collection, see `views.get_team_players`.
+
+        Unlike `views.get_team_players`, games not involving the team are skipped rather than raising.
+
+        Args:
+            team_id: the Retrosheet team id, e.g. 'WAS'
+        """
+        return views.get_team_players(self.get_team_games(team_id), team_id)
+
+    def _get_date_games(self) -> dict[dt.date, list[Game]]:
+        if self._date_games is None:
+            self._date_games = {}
+            for game in self:
+                self._date_games.setdefault(game.id.date, []).append(game)
+            self._dates = sorted(self._date_games)
+        return self._date_games
+
+    def _get_player_index(self) -> tuple[dict[str, list[Game]], dict[str, list[tuple[Game, Player]]]]:
+        if self._player_index is None:
+            games_by_player: dict[str, list[Game]] = {}
+            appearances_by_player: dict[str, list[tuple[Game, Player]]] = {}
+            for game in self:
+                for player in game.index.players[None]:
+                    appearances_by_player.setdefault(player.id, []).append((game, player))
+                    player_games = games_by_player.setdefault(player.id, [])
+                    if not player_games or player_games[-1] is not game:
+                        player_games.append(game)
+            self._player_index = games_by_player, appearances_by_player
+        return self._player_index
+
+    def _invalidate(self) -> None:
+        """Discard the indexes, after the games of the collection changed."""
+        self._games_by_id = None
+        self._team_games = None
+        self._date_games = None
+        self._dates = []
+        self._player_index = None
+
+    # mutating methods of list, which discard the indexes
+
+    def __setitem__(self, index: Any, value: Any) -> None:  # noqa: D105
+        super().__setitem__(index, value)
+        self._invalidate()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:  # noqa: D105
+        super().__delitem__(index)
+        self._invalidate()
+
+    def __iadd__(self, games: Iterable[Game]) -> "GameCollection":  # type: ignore[override, misc]  # noqa: D105
+        super().__iadd__(games)
+        self._invalidate()
+        return self
+
+    def __imul__(self, value: SupportsIndex) -> "GameCollection":  # noqa: D105
+        super().__imul__(value)
+        self._invalidate()
+        return self
+
+    def append(self, game: Game) -> None:  # noqa: D102
+        super().append(game)
+        self._invalidate()
+
+    def extend(self, games: Iterable[Game]) -> None:  # noqa: D102
+        super().extend(games)
+        self._invalidate()
+
+    def insert(self, index: SupportsIndex, game: Game) -> None:  # noqa: D102
+        super().insert(index, game)
+        self._invalidate()
+
+    def pop(self, index: SupportsIndex = -1) -> Game:  # noqa: D102
+        game = super().pop(index)
+        self._invalidate()
+        return game
+
+    def remove(self, game: Game) -> None:  # noqa: D102
+        super().remove(game)
+        self._invalidate()
+
+    def clear(self) -> None:  # noqa: D102
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:  # noqa: D102
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self) -> None:  # noqa: D102
+        super().reverse()
+        self._invalidate()
@@ -0,0 +1,29 @@
+"""Handle optional dependencies."""
+from importlib import import_module
+from types import ModuleType
+
+
+class OptionalDependencyError(ImportError):
+    """Raise when an optional dependency required by a feature is not installed."""
+
+    def __init__(self, module_name: str, extra: str):
+        """Initialize the exception.
+
+        Args:
+            module_name: the name of the missing module
+            extra: the pyretrosheet extra that installs the module
+        """
+        super().__init__(f"'{module_name}' is required for this feature: pip install 'pyretrosheet[{extra}]'")
+
+
+def import_optional(module_name: str, extra: str) -> ModuleType:
+    """Import an optional dependency, raising a helpful error if it is not installed.
+
+    Args:
+        module_name: the name of the module to import
+        extra: the pyretrosheet extra that installs the module
+    """
+    try:
+        return import_module(module_name)
+    except ImportError as e:
+        raise OptionalDependencyError(module_name, extra) from e
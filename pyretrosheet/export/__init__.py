@@ -0,0 +1 @@
+"""Export Retrosheet data to other formats."""
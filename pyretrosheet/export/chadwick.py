@@ -0,0 +1,330 @@
+"""Export Retrosheet data as Chadwick `cwevent`-style flat event rows (one row per play).
+
+Fields follow `cwevent`'s standard field names and encodings (e.g. `EVENT_CD` event type codes and
+`T`/`F` flags), derived from each play and its base-out-score state (`Game.states`). No-play ('NP') events,
+which `cwevent` does not output, are skipped.
+"""
+import csv
+import io
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TextIO
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.export import rows
+from pyretrosheet.models.base import Base
+from pyretrosheet.models.game import Game
+from pyretrosheet.models.game_state import FIRST, SECOND, THIRD, PlayState
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.play.advance import Advance
+from pyretrosheet.models.play.description import BatterEvent, RunnerEvent
+from pyretrosheet.models.play.flags import PlayFlag
+
+FIELDS = [
+    "GAME_ID",
+    "AWAY_TEAM_ID",
+    "INN_CT",
+    "BAT_HOME_ID",
+    "OUTS_CT",
+    "BALLS_CT",
+    "STRIKES_CT",
+    "PITCH_SEQ_TX",
+    "AWAY_SCORE_CT",
+    "HOME_SCORE_CT",
+    "BAT_ID",
+    "BASE1_RUN_ID",
+    "BASE2_RUN_ID",
+    "BASE3_RUN_ID",
+    "EVENT_TX",
+    "EVENT_CD",
+    "BAT_EVENT_FL",
+    "AB_FL",
+    "H_CD",
+    "SH_FL",
+    "SF_FL",
+    "EVENT_OUTS_CT",
+    "DP_FL",
+    "TP_FL",
+    "RBI_CT",
+    "BAT_DEST_ID",
+    "RUN1_DEST_ID",
+    "RUN2_DEST_ID",
+    "RUN3_DEST_ID",
+    "PO1_FLD_CD",
+    "PO2_FLD_CD",
+    "PO3_FLD_CD",
+    "ASS1_FLD_CD",
+    "ASS2_FLD_CD",
+    "ASS3_FLD_CD",
+    "ASS4_FLD_CD",
+    "ASS5_FLD_CD",
+    "ERR1_FLD_CD",
+    "ERR2_FLD_CD",
+    "ERR3_FLD_CD",
+    "EVENT_ID",
+]
+# number of rows buffered in memory before being written to the file
+DEFAULT_CHUNK_SIZE = 10_000
+# destination codes of runners in the `*_DEST_ID` fields
+DEST_NONE_OR_OUT = 0
+DEST_SCORED = 4
+
+# cwevent `EVENT_CD` codes
+EVENT_CD_UNKNOWN = 0
+EVENT_CD_GENERIC_OUT = 2
+EVENT_CD_STRIKEOUT = 3
+BATTER_EVENT_CODES = {
+    BatterEvent.UNASSISTED_FIELDED_OUT: EVENT_CD_GENERIC_OUT,
+    BatterEvent.ASSISTED_FIELDED_OUT: EVENT_CD_GENERIC_OUT,
+    BatterEvent.GROUNDED_INTO_DOUBLE_PLAY: EVENT_CD_GENERIC_OUT,
+    BatterEvent.LINED_INTO_DOUBLE_PLAY: EVENT_CD_GENERIC_OUT,
+    BatterEvent.GROUNDED_INTO_TRIPLE_PLAY: EVENT_CD_GENERIC_OUT,
+    BatterEvent.LINED_INTO_TRIPLE_PLAY: EVENT_CD_GENERIC_OUT,
+    BatterEvent.STRIKEOUT: EVENT_CD_STRIKEOUT,
+    BatterEvent.ERROR_ON_FOUL_FLY_BALL: 13,
+    BatterEvent.WALK: 14,
+    BatterEvent.INTENTIONAL_WALK: 15,
+    BatterEvent.HIT_BY_PITCH: 16,
+    BatterEvent.CATCHER_INTERFERENCE: 17,
+    BatterEvent.ERROR: 18,
+    BatterEvent.FIELDERS_CHOICE: 19,
+    BatterEvent.SINGLE: 20,
+    BatterEvent.DOUBLE: 21,
+    BatterEvent.GROUND_RULE_DOUBLE: 21,
+    BatterEvent.TRIPLE: 22,
+    BatterEvent.HOME_RUN_LEAVING_PARK: 23,
+    BatterEvent.HOME_RUN_INSIDE_PARK: 23,
+}
+RUNNER_EVENT_CODES = {
+    RunnerEvent.STOLEN_BASE: 4,
+    RunnerEvent.DEFENSIVE_INDIFFERENCE: 5,
+    RunnerEvent.CAUGHT_STEALING: 6,
+    RunnerEvent.PICKED_OFF: 8,
+    RunnerEvent.PICKED_OFF_CAUGHT_STEALING: 6,
+    RunnerEvent.WILD_PITCH: 9,
+    RunnerEvent.PASSED_BALL: 10,
+    RunnerEvent.BALK: 11,
+    RunnerEvent.OTHER_ADVANCE: 12,
+}
+_BASE_NUMBERS = {Base.FIRST_BASE: 1, Base.SECOND_BASE: 2, Base.THIRD_BASE: 3}
+_BASE_BITS = [FIRST, SECOND, THIRD]
+
+
+def export_years(
+    years: Iterable[int],
+    path: Path | str,
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    compression: retrosheet.Compression | None = None,
+    header: bool = True,
+) -> int:
+    """Load years of Retrosheet data and write their events to a CSV file, streaming game by game.
+
+    Args:
+        years: the years to export
+        path: the path of the CSV file
+        data_dir: dir where Retrosheet data will be stored (defaults to '~/.pyretrosheet/data')
+        compression: store play-by-play files compressed with the given codec
+        header: write a header row of field names
+
+    Returns:
+        the number of event rows written
+    """
+    games = (game for year in years for game in load.iter_games(year, data_dir, compression=compression))
+    with Path(path).open("w", newline="") as f:
+        return write_events(games, f, header=header)
+
+
+def write_events(games: Iterable[Game], file: TextIO, header: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Write the events of games as CSV rows.
+
+    Rows are formatted into an in-memory buffer that is written to the file every `chunk_size` rows,
+    so only a chunk of rows (and the game being exported) is held in memory.
+
+    Args:
+        games: the games to write the events of
+        file: the text file to write to (opened with `newline=''`)
+        header: write a header row of field names
+        chunk_size: the number of rows buffered before writing to the file
+
+    Returns:
+        the number of event rows written
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(FIELDS)
+
+    num_rows = 0
+    num_buffered_rows = 0
+    for game in games:
+        for row in iter_event_rows(game):
+            writer.writerow(row)
+            num_rows += 1
+            num_buffered_rows += 1
+            if num_buffered_rows >= chunk_size:
+                file.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+                num_buffered_rows = 0
+
+    file.write(buffer.getvalue())
+    return num_rows
+
+
+def iter_event_rows(game: Game) -> Iterator[list[str | int]]:
+    """Iterate the event rows of a game, ordered as `FIELDS`.
+
+    Args:
+        game: the game to get the event rows of
+    """
+    game_id = rows.get_game_key(game)
+    states = game.states
+    event_id = 0
+    for row, play in enumerate(game.index.plays[None]):
+        if play.event.description.raw == "NP":
+            continue
+
+        event_id += 1
+        yield _get_event_row(game, game_id, play, states[row], event_id)
+
+
+def _get_event_row(game: Game, game_id: str, play: Play, state: PlayState, event_id: int) -> list[str | int]:
+    """Get the event row of a play.
+
+    Args:
+        game: the game of the play
+        game_id: the game's key
+        play: the play
+        state: the base-out-score state of the game before and after the play
+        event_id: the 1-based index of the event within the game
+    """
+    advances = play.get_advances()
+    destinations = [
+        DEST_NONE_OR_OUT,
+        *(base if state.before.bases & bit else DEST_NONE_OR_OUT for base, bit in enumerate(_BASE_BITS, 1)),
+    ]
+    for advance in advances:
+        from_base = _BASE_NUMBERS.get(advance.from_base, 0)
+        if advance.is_out:
+            destinations[from_base] = DEST_NONE_OR_OUT
+        elif advance.to_base == Base.HOME:
+            destinations[from_base] = DEST_SCORED
+        else:
+            destinations[from_base] = _BASE_NUMBERS[advance.to_base]
+
+    num_outs_on_play = state.after.outs - state.before.outs
+    put_outs, assists, errors = _get_fielders(play, advances)
+    # cwevent counts an error on a foul fly as a pitch of the plate appearance rather than its end
+    is_batter_event = play.event.description.batter_event != BatterEvent.ERROR_ON_FOUL_FLY_BALL and any(
+        advance.from_base == Base.BATTER_AT_HOME for advance in advances
+    )
+    balls, strikes = (play.count[0], play.count[1]) if re.fullmatch(r"\d\d", play.count) else ("", "")
+    return [
+        game_id,
+        game.visiting_team_id,
+        play.inning,
+        play.team_location.value,
+        state.before.outs,
+        balls,
+        strikes,
+        play.pitches,
+        state.before.visiting_score,
+        state.before.home_score,
+        play.batter_id,
+        *(runner or "" for runner in state.before.runners),
+        play.event.raw,
+        _get_event_code(play, num_outs_on_play),
+        _flag(is_batter_event),
+        # unlike `Play.is_an_at_bat`, cwevent does not count sacrifice hits as at bats
+        _flag(is_batter_event and play.is_an_at_bat() and not play.flags & PlayFlag.SACRIFICE_HIT),
+        _get_hit_code(play),
+        _flag(bool(play.flags & PlayFlag.SACRIFICE_HIT)),
+        _flag(play.is_sacrifice_fly()),
+        num_outs_on_play,
+        _flag(num_outs_on_play == 2),  # noqa: PLR2004
+        _flag(num_outs_on_play == 3),  # noqa: PLR2004
+        play.num_rbis(),
+        *destinations,
+        *_pad(put_outs, 3),
+        *_pad(assists, 5),
+        *_pad(errors, 3),
+        event_id,
+    ]
+
+
+def _get_event_code(play: Play, num_outs_on_play: int) -> int:
+    """Get the `cwevent` event type code of a play.
+
+    Args:
+        play: the play
+        num_outs_on_play: the number of outs made on the play
+    """
+    description = play.event.description
+    if description.raw.startswith("K"):
+        return EVENT_CD_STRIKEOUT
+
+    if description.batter_event:
+        return BATTER_EVENT_CODES.get(description.batter_event, EVENT_CD_UNKNOWN)
+
+    if description.runner_event:
+        return RUNNER_EVENT_CODES.get(description.runner_event, EVENT_CD_UNKNOWN)
+
+    if num_outs_on_play:
+        return EVENT_CD_GENERIC_OUT
+
+    return EVENT_CD_UNKNOWN
+
+
+def _get_hit_code(play: Play) -> int:
+    """Get the `cwevent` hit code of a play: 0 for no hit, otherwise the number of bases of the hit.
+
+    Args:
+        play: the play
+    """
+    for bases, is_hit in enumerate(
+        [play.is_single, lambda: play.is_double() or _is_ground_rule_double(play), play.is_triple, play.is_home_run],
+        1,
+    ):
+        if is_hit():
+            return bases
+    return 0
+
+
+def _is_ground_rule_double(play: Play) -> bool:
+    return play.event.description.batter_event == BatterEvent.GROUND_RULE_DOUBLE
+
+
+def _get_fielders(play: Play, advances: list[Advance]) -> tuple[list[int], list[int], list[int]]:
+    """Get the positions of the fielders credited with put outs, assists and errors on a play.
+
+    Strikeouts credit the catcher with the put out, unless the fielders are given (e.g. 'K23').
+
+    Args:
+        play: the play
+        advances: all advances of the play, including implied ones
+    """
+    description = play.event.description
+    put_outs = [position for position, count in description.fielder_put_outs.items() for _ in range(count)]
+    assists = [position for position, count in description.fielder_assists.items() for _ in range(count)]
+    errors = [position for position, count in description.fielder_errors.items() for _ in range(count)]
+    for advance in play.event.advances:
+        if advance.fielder_put_out is not None:
+            put_outs.append(advance.fielder_put_out)
+        assists.extend(advance.fielder_assists)
+        errors.extend(advance.fielder_errors)
+
+    is_batter_out = any(advance.from_base == Base.BATTER_AT_HOME and advance.is_out for advance in advances)
+    if is_batter_out and (match := re.match(r"K(\d*)", description.raw)):
+        strikeout_fielders = [int(position) for position in match.group(1) or "2"]
+        put_outs.insert(0, strikeout_fielders[-1])
+        assists[:0] = strikeout_fielders[:-1]
+    return put_outs, assists, errors
+
+
+def _pad(positions: list[int], size: int) -> list[int]:
+    return (positions + [0] * size)[:size]
+
+
+def _flag(value: bool) -> str:
+    return "T" if value else "F"
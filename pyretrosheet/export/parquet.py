@@ -0,0 +1,275 @@
+"""Export Retrosheet data to a Parquet dataset partitioned by year and home team.
+
+Requires the `parquet` extra.
+
+Layout (hive partitioned):
+    <dataset_dir>/<table>/year=<year>/home_team_id=<team>/<file>.parquet
+
+Every table carries the game's `game_id`, `date`, `home_team_id` and `visiting_team_id` so that readers can filter
+any table by year, team or date without joining the games table. Rows are sorted by date within each partition,
+which keeps the date statistics of row groups tight for row group pruning.
+"""
+import datetime as dt
+import shutil
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.dependencies import import_optional
+from pyretrosheet.export import rows
+from pyretrosheet.models.game import Game
+from pyretrosheet.refresh import RefreshResult, RefreshTarget
+
+PARTITION_COLUMNS = ["year", "home_team_id"]
+TABLE_ROWS: dict[str, Callable[[Game], Iterable[rows.Row]]] = {
+    "games": lambda game: [rows.get_game_row(game)],
+    "players": rows.iter_player_rows,
+    "plays": rows.iter_play_rows,
+    "modifiers": rows.iter_modifier_rows,
+    "advances": rows.iter_advance_rows,
+}
+DEFAULT_MAX_ROWS_PER_GROUP = 64 * 1024
+
+
+def write_dataset(
+    games: Iterable[Game], dataset_dir: Path | str, max_rows_per_group: int = DEFAULT_MAX_ROWS_PER_GROUP
+) -> None:
+    """Write games to the dataset, replacing the partitions (year and home team) they belong to.
+
+    All games are buffered in row form before writing; use `write_years` to bound memory to a single year.
+
+    Args:
+        games: the games to write
+        dataset_dir: the root dir of the dataset
+        max_rows_per_group: the maximum number of rows per Parquet row group
+    """
+    pa = import_optional("pyarrow", extra="parquet")
+    dataset_dir = Path(dataset_dir)
+    for table_name, table_rows in _get_table_rows(games).items():
+        _write_table(dataset_dir / table_name, pa.Table.from_pylist(table_rows), max_rows_per_group)
+
+
+def replace_games(
+    games: Iterable[Game],
+    dataset_dir: Path | str,
+    removed_game_ids: Iterable[str] = (),
+    max_rows_per_group: int = DEFAULT_MAX_ROWS_PER_GROUP,
+) -> None:
+    """Replace individual games in the dataset and delete removed games.
+
+    Only the partitions (year and home team) of the affected games are read and rewritten: their existing rows are
+    scanned with the rows of the replaced and removed games filtered out in Arrow, and the rows of the given games
+    added.
+
+    Args:
+        games: the games to write, replacing any existing games with the same ids
+        dataset_dir: the root dir of the dataset
+        removed_game_ids: the ids of games to delete
+        max_rows_per_group: the maximum number of rows per Parquet row group
+    """
+    pa = import_optional("pyarrow", extra="parquet")
+    pa_dataset = import_optional("pyarrow.dataset", extra="parquet")
+    dataset_dir = Path(dataset_dir)
+    games = list(games)
+    game_ids = {rows.get_game_key(game) for game in games} | set(removed_game_ids)
+    if not game_ids:
+        return
+
+    # game ids start with the home team's id and the year, e.g. 'WAS202204070'
+    partitions = {(int(game_id[3:7]), game_id[:3]) for game_id in game_ids}
+    kept_rows_filter = ~pa_dataset.field("game_id").isin(sorted(game_ids))
+    for table_name, table_rows in _get_table_rows(games).items():
+        table_dir = dataset_dir / table_name
+        table = pa.Table.from_pylist(table_rows)
+        if partition_files := _get_partition_files(table_dir, partitions):
+            dataset = pa_dataset.dataset(
+                partition_files, format="parquet", partitioning="hive", partition_base_dir=table_dir.as_posix()
+            )
+            # partition values are read back as the narrowest type, e.g. int32 years
+            table = pa.concat_tables([table, dataset.to_table(filter=kept_rows_filter)], promote_options="permissive")
+
+        _write_table(table_dir, table, max_rows_per_group)
+        written_partitions = {
+            (partition["year"], partition["home_team_id"])
+            for partition in table.group_by(PARTITION_COLUMNS).aggregate([]).to_pylist()
+        }
+        for year, home_team_id in partitions - written_partitions:
+            shutil.rmtree(table_dir / f"year={year}" / f"home_team_id={home_team_id}", ignore_errors=True)
+
+
+def refresh_target(dataset_dir: Path | str, max_rows_per_group: int = DEFAULT_MAX_ROWS_PER_GROUP) -> RefreshTarget:
+    """Get a `refresh.refresh` target replacing the refreshed games in the dataset.
+
+    Args:
+        dataset_dir: the root dir of the dataset
+        max_rows_per_group: the maximum number of rows per Parquet row group
+    """
+
+    def apply(result: RefreshResult) -> None:
+        if result.has_changes:
+            replace_games(result.updated_games, dataset_dir, result.removed_game_ids, max_rows_per_group)
+
+    return apply
+
+
+def write_years(
+    years: Iterable[int],
+    dataset_dir: Path | str,
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    compression: retrosheet.Compression | None = None,
+) -> None:
+    """Load and write years of Retrosheet data to the dataset, one year at a time.
+
+    Args:
+        years: the years to write
+        dataset_dir: the root dir of the dataset
+        data_dir: dir where Retrosheet data will be stored (defaults to '~/.pyretrosheet/data')
+        compression: store play-by-play files compressed with the given codec
+    """
+    for year in years:
+        write_dataset(load.iter_games(year, data_dir, compression=compression), dataset_dir)
+
+
+def read_table(  # noqa: PLR0913
+    dataset_dir: Path | str,
+    table_name: str,
+    years: Iterable[int] | None = None,
+    team_ids: Iterable[str] | None = None,
+    start_date: dt.date | None = None,
+    end_date: dt.date | None = None,
+    batter_ids: Iterable[str] | None = None,
+    columns: list[str] | None = None,
+    home_team_ids: Iterable[str] | None = None,
+) -> Any:
+    """Read a table of the dataset as a `pyarrow.Table`, pushing filters down to the scan.
+
+    Year and home team (`home_team_ids`) filters prune partitions, while date and batter filters prune row groups via
+    their statistics before the remaining rows are filtered. Team filters (`team_ids`) match home or visiting teams,
+    and as visiting teams are not partitioned, scan every partition of the selected years; prefer `home_team_ids`
+    when only home games are needed.
+
+    Args:
+        dataset_dir: the root dir of the dataset
+        table_name: the table to read, one of `TABLE_ROWS`
+        years: only read rows of games played in these years
+        team_ids: only read rows of games these teams (home or visiting) played in
+        start_date: only read rows of games played on or after this date
+        end_date: only read rows of games played on or before this date
+        batter_ids: only read rows of plays by these batters (plays table only)
+        columns: the columns to read, defaults to all columns
+        home_team_ids: only read rows of games these teams played at home
+    """
+    pa_dataset = import_optional("pyarrow.dataset", extra="parquet")
+    if table_name not in TABLE_ROWS:
+        raise ValueError(f"Unknown table '{table_name}', expected one of {list(TABLE_ROWS)}")  # noqa: TRY003
+
+    dataset = pa_dataset.dataset(Path(dataset_dir) / table_name, format="parquet", partitioning="hive")
+    filters = list(_iter_filters(pa_dataset.field, years, team_ids, home_team_ids, start_date, end_date, batter_ids))
+    expression = None
+    for filter_ in filters:
+        expression = filter_ if expression is None else expression & filter_
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def _get_table_rows(games: Iterable[Game]) -> dict[str, list[rows.Row]]:
+    """Get the rows of every table for games, each row carrying the game columns.
+
+    Args:
+        games: the games
+    """
+    table_rows: dict[str, list[rows.Row]] = {table_name: [] for table_name in TABLE_ROWS}
+    for game in games:
+        game_columns = _get_game_columns(game)
+        for table_name, get_rows in TABLE_ROWS.items():
+            table_rows[table_name].extend({**game_columns, **row} for row in get_rows(game))
+    return table_rows
+
+
+def _write_table(table_dir: Path, table: Any, max_rows_per_group: int) -> None:
+    """Write rows to a table of the dataset, replacing the partitions they belong to.
+
+    Args:
+        table_dir: the dir of the table
+        table: the rows to write, as a `pyarrow.Table`
+        max_rows_per_group: the maximum number of rows per Parquet row group
+    """
+    if not table.num_rows:
+        return
+
+    pa_dataset = import_optional("pyarrow.dataset", extra="parquet")
+    pa_dataset.write_dataset(
+        table.sort_by([(column, "ascending") for column in (*PARTITION_COLUMNS, "date", "game_id")]),
+        table_dir,
+        format="parquet",
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor="hive",
+        existing_data_behavior="delete_matching",
+        max_rows_per_group=max_rows_per_group,
+        min_rows_per_group=min(max_rows_per_group, table.num_rows),
+        basename_template="part-{i}.parquet",
+    )
+
+
+def _get_game_columns(game: Game) -> rows.Row:
+    """Get the game columns every table carries.
+
+    Args:
+        game: the game
+    """
+    return {
+        "game_id": rows.get_game_key(game),
+        "year": game.id.date.year,
+        "date": game.id.date,
+        "home_team_id": game.home_team_id,
+        "visiting_team_id": game.visiting_team_id,
+    }
+
+
+def _iter_filters(  # noqa: PLR0913
+    field: Callable[[str], Any],
+    years: Iterable[int] | None,
+    team_ids: Iterable[str] | None,
+    home_team_ids: Iterable[str] | None,
+    start_date: dt.date | None,
+    end_date: dt.date | None,
+    batter_ids: Iterable[str] | None,
+) -> Iterator[Any]:
+    """Iterate the filter expressions of a read.
+
+    Args:
+        field: creates a field reference expression
+        years: only read rows of games played in these years
+        team_ids: only read rows of games these teams played in
+        home_team_ids: only read rows of games these teams played at home
+        start_date: only read rows of games played on or after this date
+        end_date: only read rows of games played on or before this date
+        batter_ids: only read rows of plays by these batters
+    """
+    if years is not None:
+        yield field("year").isin(list(years))
+    if team_ids is not None:
+        team_ids = list(team_ids)
+        yield field("home_team_id").isin(team_ids) | field("visiting_team_id").isin(team_ids)
+    if home_team_ids is not None:
+        yield field("home_team_id").isin(list(home_team_ids))
+    if start_date is not None:
+        yield field("date") >= start_date
+    if end_date is not None:
+        yield field("date") <= end_date
+    if batter_ids is not None:
+        yield field("batter_id").isin(list(batter_ids))
+
+
+def _get_partition_files(table_dir: Path, partitions: Iterable[tuple[int, str]]) -> list[str]:
+    """Get the files of partitions of a table, without listing the table's other partitions.
+
+    Args:
+        table_dir: the dir of the table
+        partitions: the partitions, as years and home team ids
+    """
+    return [
+        file.as_posix()
+        for year, home_team_id in sorted(partitions)
+        for file in sorted((table_dir / f"year={year}" / f"home_team_id={home_team_id}").glob("*.parquet"))
+    ]
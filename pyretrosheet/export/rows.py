@@ -0,0 +1,159 @@
+"""Flatten models into rows of normalized tables, shared by exporters.
+
+Every row carries the game's key (`game_id`, e.g. 'WAS202204070') and child rows are ordered by
+`event_index`, the index of their event in `Game.chronological_events`.
+"""
+from collections.abc import Iterator
+from typing import Any
+
+from pyretrosheet.models.game import Game
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+
+Row = dict[str, Any]
+
+
+def get_game_key(game: Game) -> str:
+    """Get the key of a game used in exported rows, e.g. 'WAS202204070'.
+
+    Args:
+        game: the game to get the key of
+    """
+    return game.id.raw.partition(",")[2]
+
+
+def get_game_row(game: Game) -> Row:
+    """Get the row of a game.
+
+    Args:
+        game: the game
+    """
+    return {
+        "game_id": get_game_key(game),
+        "year": game.id.date.year,
+        "date": game.id.date,
+        "game_number": game.id.game_number,
+        "home_team_id": game.home_team_id,
+        "visiting_team_id": game.visiting_team_id,
+    }
+
+
+def iter_info_rows(game: Game) -> Iterator[Row]:
+    """Iterate the rows of a game's info.
+
+    Args:
+        game: the game
+    """
+    game_id = get_game_key(game)
+    for key, value in game.info.items():
+        yield {"game_id": game_id, "key": key, "value": value}
+
+
+def iter_player_rows(game: Game) -> Iterator[Row]:
+    """Iterate the rows of a game's starting and substituted players.
+
+    Args:
+        game: the game
+    """
+    game_id = get_game_key(game)
+    for event_index, event in enumerate(game.chronological_events):
+        if isinstance(event, Player):
+            yield {
+                "game_id": game_id,
+                "event_index": event_index,
+                "player_id": event.id,
+                "name": event.name,
+                "team_location": event.team_location.value,
+                "batting_order_position": event.batting_order_position,
+                "fielding_position": event.fielding_position,
+                "is_sub": event.is_sub,
+            }
+
+
+def iter_play_rows(game: Game) -> Iterator[Row]:
+    """Iterate the rows of a game's plays.
+
+    Args:
+        game: the game
+    """
+    game_id = get_game_key(game)
+    for event_index, play in _iter_plays(game):
+        description = play.event.description
+        yield {
+            "game_id": game_id,
+            "event_index": event_index,
+            "inning": play.inning,
+            "team_location": play.team_location.value,
+            "batter_id": play.batter_id,
+            "count": play.count,
+            "pitches": play.pitches,
+            "event": play.event.raw,
+            "batter_event": description.batter_event.name if description.batter_event else None,
+            "runner_event": description.runner_event.name if description.runner_event else None,
+            "outs_on_play": play.num_outs_on_play(),
+            "runs": play.num_runs(),
+            "rbi": play.num_rbis(),
+        }
+
+
+def iter_modifier_rows(game: Game) -> Iterator[Row]:
+    """Iterate the rows of the modifiers of a game's plays.
+
+    Args:
+        game: the game
+    """
+    game_id = get_game_key(game)
+    for event_index, play in _iter_plays(game):
+        for modifier_index, modifier in enumerate(play.event.modifiers):
+            yield {
+                "game_id": game_id,
+                "event_index": event_index,
+                "modifier_index": modifier_index,
+                "type": modifier.type.name,
+                "hit_location": modifier.hit_location,
+                "fielder_positions": "".join(str(position) for position in modifier.fielder_positions),
+                "base": modifier.base.value if modifier.base else None,
+            }
+
+
+def iter_advance_rows(game: Game) -> Iterator[Row]:
+    """Iterate the rows of the (explicit) advances of a game's plays.
+
+    Args:
+        game: the game
+    """
+    game_id = get_game_key(game)
+    for event_index, play in _iter_plays(game):
+        for advance_index, advance in enumerate(play.event.advances):
+            yield {
+                "game_id": game_id,
+                "event_index": event_index,
+                "advance_index": advance_index,
+                "from_base": advance.from_base.value,
+                "to_base": advance.to_base.value,
+                "is_out": advance.is_out,
+                "fielder_put_out": advance.fielder_put_out,
+                "fielder_assists": "".join(str(position) for position in advance.fielder_assists),
+                "fielder_errors": "".join(str(position) for position in advance.fielder_errors),
+                "is_unearned_run_explicit": advance.is_unearned_run_explicit,
+                "is_rbi_credited_explicit": advance.is_rbi_credited_explicit,
+                "is_rbi_not_credited_explicit": advance.is_rbi_not_credited_explicit,
+                "is_team_unearned_run_explicit": advance.is_team_unearned_run_explicit,
+            }
+
+
+def iter_earned_run_rows(game: Game) -> Iterator[Row]:
+    """Iterate the rows of a game's earned runs per pitcher.
+
+    Args:
+        game: the game
+    """
+    game_id = get_game_key(game)
+    for player_id, earned_runs in game.earned_runs.items():
+        yield {"game_id": game_id, "player_id": player_id, "earned_runs": earned_runs}
+
+
+def _iter_plays(game: Game) -> Iterator[tuple[int, Play]]:
+    for event_index, event in enumerate(game.chronological_events):
+        if isinstance(event, Play):
+            yield event_index, event
@@ -0,0 +1,306 @@
+"""Export Retrosheet data to a normalized SQLite database.
+
+Tables (child tables reference `games.game_id`, ordered by `event_index` within a game):
+    games, info, lineups, plays, modifiers, advances, earned_runs
+
+Rows are inserted with batched `executemany` calls inside one transaction per year, and the indexes of the child
+tables are created once the bulk load is done. Years are upserted: re-exporting a year replaces its games.
+Individual games can be replaced by a refresh, see `refresh_target`.
+"""
+import sqlite3
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.export import rows
+from pyretrosheet.models.game import Game
+from pyretrosheet.refresh import RefreshResult, RefreshTarget
+
+DEFAULT_BATCH_SIZE = 10_000
+
+TABLE_COLUMNS: dict[str, dict[str, str]] = {
+    "games": {
+        "game_id": "TEXT PRIMARY KEY",
+        "year": "INTEGER NOT NULL",
+        "date": "TEXT NOT NULL",
+        "game_number": "INTEGER NOT NULL",
+        "home_team_id": "TEXT NOT NULL",
+        "visiting_team_id": "TEXT NOT NULL",
+    },
+    "info": {
+        "game_id": "TEXT NOT NULL",
+        "key": "TEXT NOT NULL",
+        "value": "TEXT",
+    },
+    "lineups": {
+        "game_id": "TEXT NOT NULL",
+        "event_index": "INTEGER NOT NULL",
+        "player_id": "TEXT NOT NULL",
+        "name": "TEXT",
+        "team_location": "INTEGER NOT NULL",
+        "batting_order_position": "INTEGER NOT NULL",
+        "fielding_position": "INTEGER NOT NULL",
+        "is_sub": "INTEGER NOT NULL",
+    },
+    "plays": {
+        "game_id": "TEXT NOT NULL",
+        "event_index": "INTEGER NOT NULL",
+        "inning": "INTEGER NOT NULL",
+        "team_location": "INTEGER NOT NULL",
+        "batter_id": "TEXT NOT NULL",
+        "count": "TEXT",
+        "pitches": "TEXT",
+        "event": "TEXT NOT NULL",
+        "batter_event": "TEXT",
+        "runner_event": "TEXT",
+        "outs_on_play": "INTEGER NOT NULL",
+        "runs": "INTEGER NOT NULL",
+        "rbi": "INTEGER NOT NULL",
+    },
+    "modifiers": {
+        "game_id": "TEXT NOT NULL",
+        "event_index": "INTEGER NOT NULL",
+        "modifier_index": "INTEGER NOT NULL",
+        "type": "TEXT NOT NULL",
+        "hit_location": "TEXT",
+        "fielder_positions": "TEXT",
+        "base": "TEXT",
+    },
+    "advances": {
+        "game_id": "TEXT NOT NULL",
+        "event_index": "INTEGER NOT NULL",
+        "advance_index": "INTEGER NOT NULL",
+        "from_base": "TEXT NOT NULL",
+        "to_base": "TEXT NOT NULL",
+        "is_out": "INTEGER NOT NULL",
+        "fielder_put_out": "INTEGER",
+        "fielder_assists": "TEXT",
+        "fielder_errors": "TEXT",
+        "is_unearned_run_explicit": "INTEGER NOT NULL",
+        "is_rbi_credited_explicit": "INTEGER NOT NULL",
+        "is_rbi_not_credited_explicit": "INTEGER NOT NULL",
+        "is_team_unearned_run_explicit": "INTEGER NOT NULL",
+    },
+    "earned_runs": {
+        "game_id": "TEXT NOT NULL",
+        "player_id": "TEXT NOT NULL",
+        "earned_runs": "INTEGER NOT NULL",
+    },
+}
+TABLE_ROWS: dict[str, Callable[[Game], Iterable[rows.Row]]] = {
+    "games": lambda game: [{**rows.get_game_row(game), "date": game.id.date.isoformat()}],
+    "info": rows.iter_info_rows,
+    "lineups": rows.iter_player_rows,
+    "plays": rows.iter_play_rows,
+    "modifiers": rows.iter_modifier_rows,
+    "advances": rows.iter_advance_rows,
+    "earned_runs": rows.iter_earned_run_rows,
+}
+# indexes created after bulk loading, games' indexes always exist as the table is small and used for upserts
+INDEXES: dict[str, tuple[str, list[str]]] = {
+    "info_game_id": ("info", ["game_id"]),
+    "lineups_game_id": ("lineups", ["game_id", "event_index"]),
+    "lineups_player_id": ("lineups", ["player_id"]),
+    "plays_game_id": ("plays", ["game_id", "event_index"]),
+    "plays_batter_id": ("plays", ["batter_id"]),
+    "modifiers_game_id": ("modifiers", ["game_id", "event_index"]),
+    "advances_game_id": ("advances", ["game_id", "event_index"]),
+    "earned_runs_game_id": ("earned_runs", ["game_id"]),
+    "earned_runs_player_id": ("earned_runs", ["player_id"]),
+}
+
+
+def export_years(  # noqa: PLR0913
+    years: Iterable[int],
+    database_path: Path | str,
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    compression: retrosheet.Compression | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    bulk: bool = True,
+) -> None:
+    """Load years of Retrosheet data and upsert them into a SQLite database, creating it if needed.
+
+    Args:
+        years: the years to export
+        database_path: the path of the SQLite database
+        data_dir: dir where Retrosheet data will be stored (defaults to '~/.pyretrosheet/data')
+        compression: store play-by-play files compressed with the given codec
+        batch_size: the number of rows inserted per `executemany` call
+        bulk: drop the child tables' indexes while loading and recreate them afterwards,
+            which is faster when exporting many years but slower when exporting a single year into a large database
+    """
+    connection = sqlite3.connect(database_path)
+    try:
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        create_schema(connection)
+        if bulk:
+            drop_indexes(connection)
+
+        for year in years:
+            upsert_year(connection, year, load.iter_games(year, data_dir, compression=compression), batch_size)
+
+        create_indexes(connection)
+    finally:
+        connection.close()
+
+
+def upsert_year(
+    connection: sqlite3.Connection, year: int, games: Iterable[Game], batch_size: int = DEFAULT_BATCH_SIZE
+) -> None:
+    """Replace a year's games in the database, in a single transaction.
+
+    Args:
+        connection: connection to a database with the schema created
+        year: the year of the games
+        games: all games of the year
+        batch_size: the number of rows inserted per `executemany` call
+    """
+    with connection:
+        delete_year(connection, year)
+        insert_games(connection, games, batch_size)
+
+
+def insert_games(connection: sqlite3.Connection, games: Iterable[Game], batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    """Insert games into the database.
+
+    Rows are buffered per table and flushed with `executemany` once a table's buffer reaches `batch_size` rows.
+    The caller controls the transaction.
+
+    Args:
+        connection: connection to a database with the schema created
+        games: the games to insert
+        batch_size: the number of rows inserted per `executemany` call
+    """
+    buffers: dict[str, list[rows.Row]] = {table_name: [] for table_name in TABLE_ROWS}
+    for game in games:
+        for table_name, get_rows in TABLE_ROWS.items():
+            buffer = buffers[table_name]
+            buffer.extend(get_rows(game))
+            if len(buffer) >= batch_size:
+                _insert_rows(connection, table_name, buffer)
+                buffer.clear()
+
+    for table_name, buffer in buffers.items():
+        _insert_rows(connection, table_name, buffer)
+
+
+def replace_games(
+    connection: sqlite3.Connection,
+    games: Iterable[Game],
+    removed_game_ids: Iterable[str] = (),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """Replace individual games in the database and delete removed games, in a single transaction.
+
+    Args:
+        connection: connection to a database with the schema created
+        games: the games to insert, replacing any existing games with the same ids
+        removed_game_ids: the ids of games to delete
+        batch_size: the number of rows inserted per `executemany` call
+    """
+    games = list(games)
+    with connection:
+        delete_games(connection, [*(rows.get_game_key(game) for game in games), *removed_game_ids])
+        insert_games(connection, games, batch_size)
+
+
+def refresh_target(database_path: Path | str, batch_size: int = DEFAULT_BATCH_SIZE) -> RefreshTarget:
+    """Get a `refresh.refresh` target replacing the refreshed games in a database, creating it if needed.
+
+    Args:
+        database_path: the path of the SQLite database
+        batch_size: the number of rows inserted per `executemany` call
+    """
+
+    def apply(result: RefreshResult) -> None:
+        if not result.has_changes:
+            return
+
+        connection = sqlite3.connect(database_path)
+        try:
+            create_schema(connection)
+            create_indexes(connection)
+            replace_games(connection, result.updated_games, result.removed_game_ids, batch_size)
+        finally:
+            connection.close()
+
+    return apply
+
+
+def delete_games(connection: sqlite3.Connection, game_ids: Iterable[str]) -> None:
+    """Delete games from the database. The caller controls the transaction.
+
+    Args:
+        connection: connection to a database with the schema created
+        game_ids: the ids of the games to delete
+    """
+    parameters = [(game_id,) for game_id in game_ids]
+    for table_name in TABLE_COLUMNS:
+        connection.executemany(f"DELETE FROM {table_name} WHERE game_id = ?", parameters)
+
+
+def delete_year(connection: sqlite3.Connection, year: int) -> None:
+    """Delete a year's games from the database. The caller controls the transaction.
+
+    Args:
+        connection: connection to a database with the schema created
+        year: the year to delete
+    """
+    if connection.execute("SELECT 1 FROM games WHERE year = ? LIMIT 1", (year,)).fetchone() is None:
+        return
+
+    for table_name in TABLE_COLUMNS:
+        if table_name != "games":
+            connection.execute(
+                f"DELETE FROM {table_name} WHERE game_id IN (SELECT game_id FROM games WHERE year = ?)",
+                (year,),
+            )
+    connection.execute("DELETE FROM games WHERE year = ?", (year,))
+
+
+def create_schema(connection: sqlite3.Connection) -> None:
+    """Create the tables (and the games table's indexes) if they do not exist.
+
+    Args:
+        connection: connection to a database
+    """
+    with connection:
+        for table_name, columns in TABLE_COLUMNS.items():
+            column_definitions = ", ".join(f"{name} {definition}" for name, definition in columns.items())
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({column_definitions})")
+        connection.execute("CREATE INDEX IF NOT EXISTS games_year ON games (year)")
+        connection.execute("CREATE INDEX IF NOT EXISTS games_date ON games (date)")
+
+
+def create_indexes(connection: sqlite3.Connection) -> None:
+    """Create the child tables' indexes if they do not exist.
+
+    Args:
+        connection: connection to a database with the schema created
+    """
+    with connection:
+        for index_name, (table_name, columns) in INDEXES.items():
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({', '.join(columns)})")
+
+
+def drop_indexes(connection: sqlite3.Connection) -> None:
+    """Drop the child tables' indexes, if they exist.
+
+    Args:
+        connection: connection to a database
+    """
+    with connection:
+        for index_name in INDEXES:
+            connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def _insert_rows(connection: sqlite3.Connection, table_name: str, table_rows: list[rows.Row]) -> None:
+    if not table_rows:
+        return
+
+    columns = list(TABLE_COLUMNS[table_name])
+    statement = (
+        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(f':{column}' for column in columns)})"
+    )
+    connection.executemany(statement, table_rows)
@@ -1,24 +1,42 @@
 """Load raw Retrosheet data into models."""
-from collections.abc import Iterator
+import asyncio
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 from functools import cache
 from pathlib import Path
+from typing import Generic, TypeVar
 
 from pyretrosheet import retrosheet
+from pyretrosheet.collection import GameCollection
 from pyretrosheet.models.exceptions import ParseError
 from pyretrosheet.models.game import Game
+from pyretrosheet.models.projection import Projection
 
 PYRETROSHEET_DIR = Path.home() / ".pyretrosheet"
 DEFAULT_DATA_DIR = PYRETROSHEET_DIR / "data"
 
+_Key = TypeVar("_Key")
+_Result = TypeVar("_Result")
 
-@cache
-def load_games(
-    year: int, data_dir: Path | str = DEFAULT_DATA_DIR, force_download: bool = False, basic_info_only: bool = False
-) -> list[Game]:
+
+def load_games(  # noqa: PLR0913
+    year: int,
+    data_dir: Path | str = DEFAULT_DATA_DIR,
+    force_download: bool = False,
+    basic_info_only: bool = False,
+    compression: retrosheet.Compression | None = None,
+    fields: Iterable[str] | None = None,
+) -> GameCollection:
     """Load Retrosheet games for a given year.
 
     Results are cached since data should not differ between executions.
+    Concurrent calls with the same arguments are coalesced: the first caller loads the games while the others wait
+    for, and share, its result.
 
     Args:
         year: the year to load Retrosheet data for
@@ -26,38 +44,493 @@ def load_games(
         force_download: force a fresh download of the data even if it already exists
         basic_info_only: only populate basic info (game id and participating teams)
             useful for quick game discovery due to less overhead in parsing entire game data
+        compression: store play-by-play files compressed with the given codec, decompressing them on the fly
+            when loading (reduces disk usage and bytes read at the cost of CPU)
+        fields: only load these model fields (e.g. `{"description.batter_event", "advance.to_base"}`), skipping the
+            parsing of the others, see `pyretrosheet.models.projection`
     """
+    load_args = _LoadArgs.normalize(year, data_dir, force_download, basic_info_only, compression, fields)
+    return _load_games_single_flight.do(load_args, lambda: _load_games_cached(load_args))
+
+
+def clear_cache() -> None:
+    """Clear the games cached by `load_games`, e.g. after the underlying data changed."""
+    _load_games_cached.cache_clear()
+
+
+@dataclass(frozen=True)
+class _LoadArgs:
+    """Normalized arguments of a load, identifying the games loaded."""
+
+    year: int
+    data_dir: Path
+    force_download: bool
+    basic_info_only: bool
+    compression: retrosheet.Compression | None
+    projection: Projection | None
+
+    @classmethod
+    def normalize(  # noqa: PLR0913
+        cls,
+        year: int,
+        data_dir: Path | str,
+        force_download: bool,
+        basic_info_only: bool,
+        compression: retrosheet.Compression | None,
+        fields: Iterable[str] | None,
+    ) -> "_LoadArgs":
+        """Normalize load arguments such that equivalent loads are equal.
+
+        Args:
+            year: the year to load Retrosheet data for
+            data_dir: dir where data will be stored
+            force_download: force a fresh download of the data even if it already exists
+            basic_info_only: only populate basic info (game id and participating teams)
+            compression: store play-by-play files compressed with the given codec
+            fields: only load these model fields
+        """
+        return cls(
+            year=int(year),
+            data_dir=Path(data_dir).expanduser().resolve(),
+            force_download=bool(force_download),
+            basic_info_only=bool(basic_info_only),
+            compression=compression,
+            projection=None if fields is None else Projection.from_fields(fields),
+        )
+
+
+class _SingleFlight(Generic[_Key, _Result]):
+    """Coalesces concurrent calls with equal keys into a single call whose result is shared by all callers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[_Key, Future[_Result]] = {}
+
+    def do(self, key: _Key, func: Callable[[], _Result]) -> _Result:
+        """Call `func`, or wait for the result of the in-flight call for the key if there is one.
+
+        Args:
+            key: identifies the call
+            func: the call to make when there is no call in flight for the key
+        """
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                future: Future[_Result] = Future()
+                self._in_flight[key] = future
+
+        if in_flight is not None:
+            return in_flight.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+_load_games_single_flight: _SingleFlight[_LoadArgs, GameCollection] = _SingleFlight()
+
+
+@cache
+def _load_games_cached(load_args: _LoadArgs) -> GameCollection:
+    """Load Retrosheet games for a given year, caching the results.
+
+    Args:
+        load_args: normalized arguments of the load
+    """
+    return GameCollection(
+        game
+        for play_by_play_file in _retrieve_years_play_by_play_files(
+            load_args.year, load_args.data_dir, load_args.force_download, load_args.compression
+        )
+        for game in _iter_games_from_play_by_play_file(
+            play_by_play_file, load_args.basic_info_only, load_args.projection
+        )
+    )
+
+
+def iter_games(  # noqa: PLR0913
+    year: int,
+    data_dir: Path | str = DEFAULT_DATA_DIR,
+    force_download: bool = False,
+    basic_info_only: bool = False,
+    compression: retrosheet.Compression | None = None,
+    fields: Iterable[str] | None = None,
+) -> Iterator[Game]:
+    """Iterate Retrosheet games for a given year, one game at a time.
+
+    Unlike `load_games`, results are not cached and only the game being iterated is held in memory, which suits
+    consumers that convert games into another representation (tables, exports, indexes).
+
+    Args:
+        year: the year to load Retrosheet data for
+        data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+        force_download: force a fresh download of the data even if it already exists
+        basic_info_only: only populate basic info (game id and participating teams)
+        compression: store play-by-play files compressed with the given codec
+        fields: only load these model fields (e.g. `{"description.batter_event", "advance.to_base"}`), skipping the
+            parsing of the others, see `pyretrosheet.models.projection`
+    """
+    projection = None if fields is None else Projection.from_fields(fields)
+    for play_by_play_file in _retrieve_years_play_by_play_files(year, Path(data_dir), force_download, compression):
+        yield from _iter_games_from_play_by_play_file(play_by_play_file, basic_info_only, projection)
+
+
+def iter_games_by_year(  # noqa: PLR0913
+    years: Iterable[int],
+    data_dir: Path | str = DEFAULT_DATA_DIR,
+    force_download: bool = False,
+    basic_info_only: bool = False,
+    compression: retrosheet.Compression | None = None,
+    max_fetch_workers: int = 4,
+    max_parse_workers: int | None = None,
+    max_years_ahead: int = 4,
+    fields: Iterable[str] | None = None,
+) -> Iterator[tuple[int, GameCollection]]:
+    """Load Retrosheet games for many years, pipelining retrieval, reading and parsing across years.
+
+    Retrieving (downloading and extracting) and reading a year's files happens in a thread pool while previously
+    read files are parsed in a process pool, so a cold load takes roughly as long as its slowest stage rather than
+    the sum of all stages. While the consumer holds a year, exactly `max_years_ahead` later years are in flight (or
+    fewer near the end), and the next year is only submitted once the consumer advances, bounding memory use when the
+    consumer is slower than the pipeline.
+
+    Results are not cached, unlike `load_games`.
+
+    Args:
+        years: the years to load Retrosheet data for, yielded in the given order
+        data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+        force_download: force a fresh download of the data even if it already exists
+        basic_info_only: only populate basic info (game id and participating teams)
+        compression: store play-by-play files compressed with the given codec
+        max_fetch_workers: the number of threads retrieving and reading years' files
+        max_parse_workers: the number of processes parsing files (defaults to the number of processors)
+        max_years_ahead: the number of years retrieved, read and parsed ahead of the year being yielded
+        fields: only load these model fields (e.g. `{"description.batter_event", "advance.to_base"}`), skipping the
+            parsing of the others, see `pyretrosheet.models.projection`
+    """
+    projection = None if fields is None else Projection.from_fields(fields)
     data_dir = data_dir if isinstance(data_dir, Path) else Path(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
-    return [
-        game
-        for play_by_play_file in retrosheet.retrieve_years_play_by_play_files(
-            year=year,
-            data_dir=Path(data_dir) or DEFAULT_DATA_DIR,
-            force_download=force_download,
+    years_to_load = iter(years)
+    in_flight: deque[tuple[int, Future[list[Future[list[Game]]]]]] = deque()
+    with (
+        ThreadPoolExecutor(max_workers=max_fetch_workers) as fetch_executor,
+        ProcessPoolExecutor(max_workers=max_parse_workers) as parse_executor,
+    ):
+
+        def submit_next_year() -> None:
+            year = next(years_to_load, None)
+            if year is None:
+                return
+
+            future = fetch_executor.submit(
+                _retrieve_and_read_year,
+                year,
+                data_dir,
+                force_download,
+                compression,
+                lambda text, file_path: parse_executor.submit(
+                    _get_games_from_play_by_play_text, text, file_path, basic_info_only, projection
+                ),
+            )
+            in_flight.append((year, future))
+
+        try:
+            for _ in range(max_years_ahead + 1):
+                submit_next_year()
+
+            while in_flight:
+                year, parse_futures_future = in_flight.popleft()
+                games = GameCollection(
+                    game for parse_future in parse_futures_future.result() for game in parse_future.result()
+                )
+                yield year, games
+                submit_next_year()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            # years still being retrieved submit their files for parsing, so they finish before the parse pool stops
+            fetch_executor.shutdown(wait=True, cancel_futures=True)
+            parse_executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _retrieve_and_read_year(
+    year: int,
+    data_dir: Path,
+    force_download: bool,
+    compression: retrosheet.Compression | None,
+    submit_parse: Callable[[str, str], Future[list[Game]]],
+) -> list[Future[list[Game]]]:
+    """Retrieve and read a year's files, handing each file's text off for parsing as soon as it is read.
+
+    Args:
+        year: the year to retrieve files for
+        data_dir: dir where data will be stored
+        force_download: force a fresh download of the data even if it already exists
+        compression: store play-by-play files compressed with the given codec
+        submit_parse: submits a file's text (and path) for parsing, returning the future of its games
+    """
+    parse_futures = []
+    for play_by_play_file in retrosheet.retrieve_years_play_by_play_files(
+        year=year, data_dir=data_dir, force_download=force_download, compression=compression
+    ):
+        text = read_play_by_play_file(play_by_play_file)
+        parse_futures.append(submit_parse(text, play_by_play_file.as_posix()))
+
+    return parse_futures
+
+
+async def aload_games(  # noqa: PLR0913
+    year: int,
+    data_dir: Path | str = DEFAULT_DATA_DIR,
+    force_download: bool = False,
+    basic_info_only: bool = False,
+    compression: retrosheet.Compression | None = None,
+    io_executor: Executor | None = None,
+    parse_executor: Executor | None = None,
+    fields: Iterable[str] | None = None,
+) -> GameCollection:
+    """Load Retrosheet games for a given year without blocking the event loop.
+
+    Retrieving and reading files runs in `io_executor` and parsing runs in `parse_executor`. Both default to the
+    event loop's default executor; pass a `ProcessPoolExecutor` as `parse_executor` to parse outside of the GIL.
+
+    Concurrent calls on the same event loop with the same arguments (other than the executors) are coalesced: the
+    first call loads the games while the others await, and share, its result. Cancelling a waiting call does not
+    cancel the shared load unless every caller is cancelled.
+
+    Args:
+        year: the year to load Retrosheet data for
+        data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+        force_download: force a fresh download of the data even if it already exists
+        basic_info_only: only populate basic info (game id and participating teams)
+        compression: store play-by-play files compressed with the given codec
+        io_executor: executor retrieving and reading files
+        parse_executor: executor parsing files
+        fields: only load these model fields (e.g. `{"description.batter_event", "advance.to_base"}`), skipping the
+            parsing of the others, see `pyretrosheet.models.projection`
+    """
+    load_args = _LoadArgs.normalize(year, data_dir, force_download, basic_info_only, compression, fields)
+    loop = asyncio.get_running_loop()
+    in_flight_key = (loop, load_args)
+    task = _aload_games_in_flight.get(in_flight_key)
+    if task is None:
+        task = loop.create_task(_aload_games(load_args, io_executor, parse_executor))
+        _aload_games_in_flight[in_flight_key] = task
+        task.add_done_callback(lambda _: _aload_games_in_flight.pop(in_flight_key, None))
+
+    _aload_games_waiters[task] = _aload_games_waiters.get(task, 0) + 1
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if _aload_games_waiters[task] == 1:
+            task.cancel()
+        raise
+    finally:
+        _aload_games_waiters[task] -= 1
+        if not _aload_games_waiters[task]:
+            del _aload_games_waiters[task]
+
+
+_aload_games_in_flight: dict[tuple[asyncio.AbstractEventLoop, _LoadArgs], "asyncio.Task[GameCollection]"] = {}
+_aload_games_waiters: dict["asyncio.Task[GameCollection]", int] = {}
+
+
+async def _aload_games(
+    load_args: _LoadArgs, io_executor: Executor | None, parse_executor: Executor | None
+) -> GameCollection:
+    """Load Retrosheet games for a given year without blocking the event loop.
+
+    Args:
+        load_args: normalized arguments of the load
+        io_executor: executor retrieving and reading files
+        parse_executor: executor parsing files
+    """
+    loop = asyncio.get_running_loop()
+    basic_info_only = load_args.basic_info_only
+    play_by_play_files = await loop.run_in_executor(
+        io_executor,
+        _retrieve_years_play_by_play_files,
+        load_args.year,
+        load_args.data_dir,
+        load_args.force_download,
+        load_args.compression,
+    )
+
+    async def load_file(play_by_play_file: Path) -> list[Game]:
+        text = await loop.run_in_executor(io_executor, read_play_by_play_file, play_by_play_file)
+        return await loop.run_in_executor(
+            parse_executor,
+            _get_games_from_play_by_play_text,
+            text,
+            play_by_play_file.as_posix(),
+            basic_info_only,
+            load_args.projection,
         )
-        for game in _get_games_from_play_by_play_file(play_by_play_file, basic_info_only=basic_info_only)
-    ]
 
+    games_per_file = await asyncio.gather(*(load_file(file) for file in play_by_play_files))
+    return GameCollection(game for games in games_per_file for game in games)
+
+
+async def astream_games(  # noqa: PLR0913
+    years: Iterable[int],
+    data_dir: Path | str = DEFAULT_DATA_DIR,
+    force_download: bool = False,
+    basic_info_only: bool = False,
+    compression: retrosheet.Compression | None = None,
+    io_executor: Executor | None = None,
+    parse_executor: Executor | None = None,
+    max_buffered_games: int = 5000,
+    fields: Iterable[str] | None = None,
+) -> AsyncIterator[Game]:
+    """Stream Retrosheet games for many years, in year order, without blocking the event loop.
+
+    Years are loaded (as in `aload_games`) by a background task that pauses once `max_buffered_games` games are
+    waiting to be consumed. Closing or cancelling the iteration cancels the background task.
+
+    Args:
+        years: the years to load Retrosheet data for, streamed in the given order
+        data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+        force_download: force a fresh download of the data even if it already exists
+        basic_info_only: only populate basic info (game id and participating teams)
+        compression: store play-by-play files compressed with the given codec
+        io_executor: executor retrieving and reading files
+        parse_executor: executor parsing files
+        max_buffered_games: the number of loaded games buffered ahead of the consumer
+        fields: only load these model fields (e.g. `{"description.batter_event", "advance.to_base"}`), skipping the
+            parsing of the others, see `pyretrosheet.models.projection`
+    """
+    queue: asyncio.Queue[Game | _StreamEnd] = asyncio.Queue(maxsize=max_buffered_games)
+
+    async def produce() -> None:
+        try:
+            for year in years:
+                for game in await aload_games(
+                    year, data_dir, force_download, basic_info_only, compression, io_executor, parse_executor, fields
+                ):
+                    await queue.put(game)
+        except Exception as e:
+            await queue.put(_StreamEnd(e))
+        else:
+            await queue.put(_StreamEnd())
+
+    producer = asyncio.create_task(produce())
+    try:
+        while not isinstance(item := await queue.get(), _StreamEnd):
+            yield item
+
+        if item.error:
+            raise item.error
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
+
+
+class _StreamEnd:
+    """Marks the end of a stream of games, optionally due to an error."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+
+def _retrieve_years_play_by_play_files(
+    year: int, data_dir: Path, force_download: bool, compression: retrosheet.Compression | None
+) -> list[Path]:
+    """Retrieve a year's play-by-play files, creating the data dir if needed.
+
+    Args:
+        year: the year to retrieve files for
+        data_dir: dir where data will be stored
+        force_download: force a fresh download of the data even if it already exists
+        compression: store play-by-play files compressed with the given codec
+    """
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return retrosheet.retrieve_years_play_by_play_files(
+        year=year, data_dir=data_dir, force_download=force_download, compression=compression
+    )
+
+
+def read_play_by_play_file(file: Path) -> str:
+    """Read the full text of a play-by-play file.
+
+    Args:
+        file: the file path to the play by play file
+    """
+    with retrosheet.open_play_by_play_file(file) as f:
+        return f.read()
 
-def _get_games_from_play_by_play_file(file: Path, basic_info_only: bool = False) -> list[Game]:
+
+def _get_games_from_play_by_play_file(
+    file: Path, basic_info_only: bool = False, projection: Projection | None = None
+) -> list[Game]:
     """Get games loaded from a play by play file.
 
     Args:
         file: the file path to the play by play file
         basic_info_only: only populate basic info (game id and participating teams)
+        projection: only load the fields selected by the projection
+    """
+    return list(_iter_games_from_play_by_play_file(file, basic_info_only, projection))
+
+
+def _iter_games_from_play_by_play_file(
+    file: Path, basic_info_only: bool = False, projection: Projection | None = None
+) -> Iterator[Game]:
+    """Iterate games loaded from a play by play file, streaming the file's lines.
+
+    Args:
+        file: the file path to the play by play file
+        basic_info_only: only populate basic info (game id and participating teams)
+        projection: only load the fields selected by the projection
+    """
+    with retrosheet.open_play_by_play_file(file) as lines:
+        yield from iter_games_from_lines(
+            (line.rstrip("\r\n") for line in lines), file.as_posix(), basic_info_only, projection
+        )
+
+
+def _get_games_from_play_by_play_text(
+    text: str, file_path: str, basic_info_only: bool = False, projection: Projection | None = None
+) -> list[Game]:
+    """Get games loaded from the text of a play by play file.
+
+    Args:
+        text: the full text of the play by play file
+        file_path: the path of the play by play file, used in error messages
+        basic_info_only: only populate basic info (game id and participating teams)
+        projection: only load the fields selected by the projection
     """
-    loaded_games = []
-    for games_lines in _iter_game_lines(file.read_text().splitlines()):
+    return list(iter_games_from_lines(text.splitlines(), file_path, basic_info_only, projection))
+
+
+def iter_games_from_lines(
+    lines: Iterable[str], file_path: str, basic_info_only: bool = False, projection: Projection | None = None
+) -> Iterator[Game]:
+    """Iterate games loaded from the lines of a play by play file.
+
+    Args:
+        lines: lines of a play-by-play file (includes multiple games in a single file)
+        file_path: the path of the play by play file, used in error messages
+        basic_info_only: only populate basic info (game id and participating teams)
+        projection: only load the fields selected by the projection
+    """
+    for games_lines in iter_game_lines(lines):
         try:
-            loaded_games.append(Game.from_game_lines(games_lines, basic_info_only=basic_info_only))
+            yield Game.from_game_lines(games_lines, basic_info_only=basic_info_only, projection=projection)
         except ParseError as e:
-            raise ParseError(e.looking_for_value, e.raw_value, e.game_line, file.as_posix()) from e
-
-    return loaded_games
+            raise ParseError(e.looking_for_value, e.raw_value, e.game_line, file_path) from e
 
 
-def _iter_game_lines(lines: list[str]) -> Iterator[list[str]]:
+def iter_game_lines(lines: Iterable[str]) -> Iterator[list[str]]:
     """Iterate the lines corresponding to each game in a Retrosheet play-by-play file.
 
     Args:
@@ -1,13 +1,21 @@
 """Encapsulates Retrosheet game data."""
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
 from pyretrosheet.models.exceptions import ParseError
+from pyretrosheet.models.game_checkpoints import GameCheckpoints
 from pyretrosheet.models.game_id import GameID
+from pyretrosheet.models.game_index import GameIndex
+from pyretrosheet.models.game_lineups import GameLineups
+from pyretrosheet.models.game_state import GameStates
 from pyretrosheet.models.play import Play
 from pyretrosheet.models.player import Player
+from pyretrosheet.models.projection import Projection, reduce_partial
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
 
-ChronologicalEvent = Player | Play
+ChronologicalEvent = Player | Play | RunnerAdjustment
 ChronologicalEvents = Sequence[ChronologicalEvent]
 
 
@@ -30,7 +38,8 @@ class Game:
     Args:
         id: the game's id
         info: miscellaneous encoded information like temperature, attendance, umpire names, etc.
-        chronological_events: the chronological order of events occurring
+        chronological_events: the chronological order of events occurring: starts and subs (`Player`), plays and
+            runner adjustments
         earned_runs: map of player id to earned runs
     """
 
@@ -52,14 +61,34 @@ class Game:
         ]
         return "\n".join(lines)
 
+    def __reduce__(self) -> tuple[type["Game"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments.
+
+        Default dataclass pickling stores an attribute dict per object, repeating attribute names throughout a game's
+        events; positional arguments are smaller and faster to unpickle. Nested models are pickled the same way, events
+        along with their flags so that unpickling does not classify their plays again.
+        """
+        try:
+            return (self.__class__, (self.id, self.info, self.chronological_events, self.earned_runs))
+        except AttributeError:
+            # projected instances lack the attributes that were not loaded
+            return reduce_partial(self)
+
     @classmethod
-    def from_game_lines(cls, game_lines: list[str], basic_info_only: bool = False) -> "Game":
+    def from_game_lines(
+        cls, game_lines: list[str], basic_info_only: bool = False, projection: Projection | None = None
+    ) -> "Game":
         """Load a game from game lines.
 
         Args:
             game_lines: game lines from a game
             basic_info_only: only populate basic info (game id and participating teams)
+            projection: only load the fields selected by the projection, skipping the parsing of the others
         """
+        load_players = projection is None or projection.loads("player")
+        load_plays = projection is None or projection.loads("play")
+        load_comments = projection is None or projection.includes("play.comments")
+        load_runner_adjustments = projection is None or projection.loads("runner_adjustment")
         id_ = None
         info = {}
         chronological_events: ChronologicalEvents = []
@@ -79,14 +108,23 @@ class Game:
                         if basic_info_only:
                             break
 
-                        chronological_events.append(Player.from_start_or_sub_line(line, is_sub=False))
+                        if load_players:
+                            chronological_events.append(Player.from_start_or_sub_line(line, is_sub=False))
 
                     case "sub":
-                        chronological_events.append(Player.from_start_or_sub_line(line, is_sub=True))
+                        if load_players:
+                            chronological_events.append(Player.from_start_or_sub_line(line, is_sub=True))
 
                     case "play":
-                        comment_lines = list(_yield_comment_lines_following_play(i, game_lines))
-                        chronological_events.append(Play.from_play_line(line, comment_lines))
+                        if load_plays:
+                            comment_lines = (
+                                list(_yield_comment_lines_following_play(i, game_lines)) if load_comments else []
+                            )
+                            chronological_events.append(Play.from_play_line(line, comment_lines, projection))
+
+                    case "radj":
+                        if load_runner_adjustments:
+                            chronological_events.append(RunnerAdjustment.from_radj_line(line))
 
                     case "data":
                         earned_runs[parts[2]] = int(parts[3])
@@ -98,6 +136,18 @@ class Game:
         if not id_:
             raise GameIDNotFoundError(game_lines[0])
 
+        if projection is not None and not projection.is_full("game"):
+            return projection.new(
+                cls,
+                "game",
+                {
+                    "id": id_,
+                    "info": info,
+                    "chronological_events": chronological_events,
+                    "earned_runs": earned_runs,
+                },
+            )
+
         return cls(
             id=id_,
             info=info,
@@ -105,6 +155,39 @@ class Game:
             earned_runs=earned_runs,
         )
 
+    @cached_property
+    def index(self) -> GameIndex:
+        """Indexes of the game's plays and players, built on first access.
+
+        The indexes reflect the chronological events at the time of first access.
+        """
+        return GameIndex.from_chronological_events(self.chronological_events)
+
+    @cached_property
+    def states(self) -> GameStates:
+        """The base-out-score state before and after each of the game's plays, tracked on first access.
+
+        The states reflect the chronological events at the time of first access.
+        """
+        return GameStates.from_chronological_events(self.chronological_events)
+
+    @cached_property
+    def lineups(self) -> GameLineups:
+        """The lineups of both teams during each of the game's plays, tracked on first access.
+
+        The lineups reflect the chronological events at the time of first access.
+        """
+        return GameLineups.from_chronological_events(self.chronological_events)
+
+    @cached_property
+    def checkpoints(self) -> GameCheckpoints:
+        """Checkpoints of the game's state (base-out, score, hits, errors and lineups), tracked on first access.
+
+        Restore the state before any chronological event with `game.checkpoints.get_state(position)`. The checkpoints
+        reflect the chronological events at the time of first access.
+        """
+        return GameCheckpoints.from_chronological_events(self.chronological_events)
+
     @property
     def home_team_id(self) -> str:
         """The id of the home team."""
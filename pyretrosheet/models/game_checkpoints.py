@@ -0,0 +1,179 @@
+"""Checkpoints of the state of a game, for restoring its state at any point without replaying the whole game."""
+import bisect
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from pyretrosheet.models.game_lineups import NUM_TEAM_SLOTS, Lineup, decode_lineup
+from pyretrosheet.models.game_state import GameStateTracker
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
+from pyretrosheet.models.team import TeamLocation
+
+# the number of events between checkpoints, bounding the events replayed to restore a state
+DEFAULT_CHECKPOINT_INTERVAL = 32
+
+
+@dataclass
+class GameSnapshot:
+    """The state of a game before one of its chronological events.
+
+    Before a play starting a half-inning, the state is that of the new half-inning (no outs, and empty bases but for
+    the runners placed by runner adjustments). Before a play, the ball-strike count is the play's count field, the count
+    on the batter when the play occurred; it is not tracked between events, so it is None before other events.
+
+    Args:
+        position: the position of the event in the game's chronological events (their length for the end of the game)
+        inning: the inning in progress, 0 before the first play
+        team_location: the batting team's location, None before the first play
+        outs: the number of outs
+        runners: the ids of the runners on first, second and third, None for an empty base or an unknown runner
+        visiting_score: the visiting team's runs
+        home_score: the home team's runs
+        visiting_hits: the visiting team's hits
+        home_hits: the home team's hits
+        visiting_errors: the errors committed by the visiting team
+        home_errors: the errors committed by the home team
+        visiting_lineup: the visiting team's lineup
+        home_lineup: the home team's lineup
+        balls: the balls in the count on the batter, None if unknown (e.g. a count of '??') or before other events
+        strikes: the strikes in the count on the batter, None if unknown or before other events
+    """
+
+    position: int
+    inning: int
+    team_location: TeamLocation | None
+    outs: int
+    runners: tuple[str | None, str | None, str | None]
+    visiting_score: int
+    home_score: int
+    visiting_hits: int
+    home_hits: int
+    visiting_errors: int
+    home_errors: int
+    visiting_lineup: Lineup
+    home_lineup: Lineup
+    balls: int | None = None
+    strikes: int | None = None
+
+    @classmethod
+    def from_tracker(cls, tracker: GameStateTracker, play: Play | None = None) -> "GameSnapshot":
+        """Get a snapshot of a tracked state.
+
+        Args:
+            tracker: the tracked state
+            play: the play the state is before, whose count is the snapshot's
+        """
+        inning, team_location = tracker.half_inning or (0, None)
+        first, second, third = (runner or None for runner in tracker.runners)
+        balls: int | None = None
+        strikes: int | None = None
+        # the count is unknown ('??') in much of the older data
+        if play is not None and re.fullmatch(r"\d\d", play.count):
+            balls, strikes = int(play.count[0]), int(play.count[1])
+        return cls(
+            position=tracker.position,
+            inning=inning,
+            team_location=team_location,
+            outs=tracker.outs,
+            runners=(first, second, third),
+            visiting_score=tracker.score[TeamLocation.VISITING],
+            home_score=tracker.score[TeamLocation.HOME],
+            visiting_hits=tracker.hits[TeamLocation.VISITING],
+            home_hits=tracker.hits[TeamLocation.HOME],
+            visiting_errors=tracker.errors[TeamLocation.VISITING],
+            home_errors=tracker.errors[TeamLocation.HOME],
+            visiting_lineup=decode_lineup(tracker.player_ids, tracker.lineup_slots[:NUM_TEAM_SLOTS]),
+            home_lineup=decode_lineup(tracker.player_ids, tracker.lineup_slots[NUM_TEAM_SLOTS:]),
+            balls=balls,
+            strikes=strikes,
+        )
+
+
+@dataclass
+class GameCheckpoints:
+    """Checkpoints of the state of a game, every `interval` chronological events and at the start of each half-inning.
+
+    The state before any event is restored from the nearest preceding checkpoint by replaying fewer than `interval`
+    events. A game has one checkpoint per half-inning plus one for every `interval` events within a half-inning, so
+    with the default interval almost all checkpoints of a typical game are half-inning starts (e.g. 19 checkpoints
+    for a 9-inning game of 129 events) and `interval` mainly bounds the replay of long half-innings.
+
+    Args:
+        chronological_events: the game's chronological events
+        interval: the maximum number of events between checkpoints
+        positions: the position of each checkpoint in the game's chronological events, ascending
+        checkpoints: the state of the game at each checkpoint
+    """
+
+    chronological_events: Sequence[Player | Play | RunnerAdjustment]
+    interval: int
+    positions: list[int]
+    checkpoints: list[GameStateTracker]
+
+    def __len__(self) -> int:
+        """The number of checkpoints."""
+        return len(self.checkpoints)
+
+    @classmethod
+    def from_chronological_events(
+        cls,
+        chronological_events: Sequence[Player | Play | RunnerAdjustment],
+        interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> "GameCheckpoints":
+        """Track the state of a game through its chronological events, checkpointing it along the way.
+
+        Args:
+            chronological_events: the game's chronological events
+            interval: the maximum number of events between checkpoints
+
+        Raises:
+            ValueError: if the interval is not positive
+        """
+        if interval < 1:
+            raise ValueError(f"Checkpoint interval must be positive: {interval=}")  # noqa: TRY003
+
+        tracker = GameStateTracker(chronological_events)
+        checkpoints = [tracker.copy()]
+        for event in chronological_events:
+            # checkpoint the state of each new half-inning, with its bases and outs cleared
+            if isinstance(event, Play) and tracker.start_half_inning(event):
+                if checkpoints[-1].position == tracker.position:
+                    checkpoints[-1] = tracker.copy()
+                else:
+                    checkpoints.append(tracker.copy())
+            elif tracker.position - checkpoints[-1].position >= interval:
+                checkpoints.append(tracker.copy())
+            tracker.apply(event)
+        if tracker.position - checkpoints[-1].position >= interval:
+            checkpoints.append(tracker)
+        return cls(
+            chronological_events=chronological_events,
+            interval=interval,
+            positions=[checkpoint.position for checkpoint in checkpoints],
+            checkpoints=checkpoints,
+        )
+
+    def get_state(self, position: int) -> GameSnapshot:
+        """Restore the state of the game before a chronological event.
+
+        Args:
+            position: the position of the event in the game's chronological events, or their length for the state at
+                the end of the game
+
+        Raises:
+            IndexError: if the position is out of range
+        """
+        num_events = len(self.chronological_events)
+        if not 0 <= position <= num_events:
+            raise IndexError(f"Event position out of range: {position=}, {num_events=}")  # noqa: TRY003
+
+        tracker = self.checkpoints[bisect.bisect_right(self.positions, position) - 1].copy()
+        for event in self.chronological_events[tracker.position : position]:
+            tracker.apply(event)
+        play = None
+        if position < num_events and isinstance(event := self.chronological_events[position], Play):
+            play = event
+            tracker.start_half_inning(play)
+        return GameSnapshot.from_tracker(tracker, play)
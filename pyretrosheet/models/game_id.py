@@ -1,6 +1,7 @@
 """Encapsulates a Retrosheet game id."""
 import datetime as dt
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass
@@ -24,6 +25,10 @@ class GameID:
     game_number: int
     raw: str
 
+    def __reduce__(self) -> tuple[type["GameID"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments, see `Game.__reduce__`."""
+        return (self.__class__, (self.home_team_id, self.date, self.game_number, self.raw))
+
     @classmethod
     def from_id_line(cls, id_line: str) -> "GameID":
         """Load the GameID from a 'id' line.
@@ -0,0 +1,74 @@
+"""Indexes of a game's chronological events, built in a single pass."""
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
+from pyretrosheet.models.team import TeamLocation
+
+# indexes are keyed by a team's location, or by None for both teams
+Team = TeamLocation | None
+
+
+@dataclass
+class GameIndex:
+    """Indexes of a game's plays and players, per team (`TeamLocation`) and for both teams (`None`).
+
+    Every list is in chronological order.
+
+    Args:
+        plays: the plays of each team
+        play_positions: the positions of `plays` in the game's chronological events
+        players: the players (starters and subs) of each team
+        player_positions: the positions of `players` in the game's chronological events
+        batter_plays: map of batter id to their plays, for each team
+        inning_plays: map of inning to its plays, for each team (a single team's are the plays of a half-inning)
+    """
+
+    plays: dict[Team, list[Play]] = field(default_factory=dict)
+    play_positions: dict[Team, list[int]] = field(default_factory=dict)
+    players: dict[Team, list[Player]] = field(default_factory=dict)
+    player_positions: dict[Team, list[int]] = field(default_factory=dict)
+    batter_plays: dict[Team, dict[str, list[Play]]] = field(default_factory=dict)
+    inning_plays: dict[Team, dict[int, list[Play]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_chronological_events(cls, chronological_events: Sequence[Player | Play | RunnerAdjustment]) -> "GameIndex":
+        """Index a game's chronological events, skipping runner adjustments.
+
+        Args:
+            chronological_events: the game's chronological events
+        """
+        teams: list[Team] = [None, *TeamLocation]
+        index = cls(
+            plays={team: [] for team in teams},
+            play_positions={team: [] for team in teams},
+            players={team: [] for team in teams},
+            player_positions={team: [] for team in teams},
+            batter_plays={team: {} for team in teams},
+            inning_plays={team: {} for team in teams},
+        )
+        for position, event in enumerate(chronological_events):
+            if isinstance(event, RunnerAdjustment):
+                continue
+
+            for team in (None, event.team_location):
+                if isinstance(event, Play):
+                    index.plays[team].append(event)
+                    index.play_positions[team].append(position)
+                    index.batter_plays[team].setdefault(event.batter_id, []).append(event)
+                    index.inning_plays[team].setdefault(event.inning, []).append(event)
+                else:
+                    index.players[team].append(event)
+                    index.player_positions[team].append(position)
+        return index
+
+    def get_half_inning_plays(self, inning: int, team_location: TeamLocation) -> list[Play]:
+        """Get the plays of a half-inning.
+
+        Args:
+            inning: the inning
+            team_location: the batting team's location, the visiting team batting in the top half
+        """
+        return self.inning_plays[team_location].get(inning, [])
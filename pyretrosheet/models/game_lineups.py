@@ -0,0 +1,203 @@
+"""The lineups of both teams of a game around each of its plays, tracked in a single pass."""
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import DESIGNATED_HITTER_FIELDING_POSITION, Player
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
+from pyretrosheet.models.team import TeamLocation
+
+# code of an empty lineup slot in the lineup columns
+NO_PLAYER = -1
+NUM_BATTING_ORDER_POSITIONS = 9
+# defensive positions 1-9 and the designated hitter (10)
+NUM_DEFENSIVE_POSITIONS = DESIGNATED_HITTER_FIELDING_POSITION
+PITCHER_FIELDING_POSITION = 1
+# entries per team in a lineup version: the batting order followed by the defensive positions
+NUM_TEAM_SLOTS = NUM_BATTING_ORDER_POSITIONS + NUM_DEFENSIVE_POSITIONS
+NUM_VERSION_SLOTS = NUM_TEAM_SLOTS * len(TeamLocation)
+
+
+@dataclass
+class Lineup:
+    """A team's lineup at a point of a game.
+
+    Args:
+        batting_order: the ids of the players in the batting order, from the leadoff batter, None for an empty slot
+        fielders: map of defensive position (1-9, and 10 for the designated hitter) to the id of the player in it
+    """
+
+    batting_order: list[str | None]
+    fielders: dict[int, str]
+
+    @property
+    def pitcher(self) -> str | None:
+        """The id of the pitcher, if any."""
+        return self.fielders.get(PITCHER_FIELDING_POSITION)
+
+
+@dataclass
+class GameLineups:
+    """The lineups of both teams during each play of a game, as of the start and sub records preceding the play.
+
+    Lineups only change on start and sub records, so they are stored as versions, one per change, with each play
+    referencing the version in effect: `play_versions[row]` is the version of the game's `row`th play (in the order of
+    `game.index.plays[None]`). A version holds the batting order and defensive positions of the visiting team followed
+    by those of the home team, as indexes into `player_ids` (`NO_PLAYER` for an empty slot). Lookups of a player by
+    batting order or defensive position take constant time, and default to the fielding team of the play for fielders.
+
+    Args:
+        player_ids: the ids of the players in the lineups
+        versions: the lineup slots of each version, flattened
+        play_versions: the lineup version of each play
+        team_location: the value of the batting team's location of each play
+    """
+
+    player_ids: list[str] = field(default_factory=list)
+    versions: "array[int]" = field(default_factory=partial(array, "h"))
+    play_versions: "array[int]" = field(default_factory=partial(array, "H"))
+    team_location: "array[int]" = field(default_factory=partial(array, "B"))
+
+    def __len__(self) -> int:
+        """The number of plays."""
+        return len(self.play_versions)
+
+    @classmethod
+    def from_chronological_events(
+        cls, chronological_events: Sequence[Player | Play | RunnerAdjustment]
+    ) -> "GameLineups":
+        """Track the lineups of a game through its chronological events.
+
+        Players take the batting order slot and defensive position of their start or sub record, leaving any other
+        defensive position they held. Pinch hitters and runners only take a batting order slot.
+
+        Args:
+            chronological_events: the game's chronological events
+        """
+        lineups = cls()
+        player_codes: dict[str, int] = {}
+        slots = [NO_PLAYER] * NUM_VERSION_SLOTS
+        is_changed = True
+        for event in chronological_events:
+            if isinstance(event, Play):
+                if is_changed:
+                    lineups.versions.extend(slots)
+                    is_changed = False
+                lineups.play_versions.append(len(lineups.versions) // NUM_VERSION_SLOTS - 1)
+                lineups.team_location.append(event.team_location.value)
+                continue
+
+            if isinstance(event, RunnerAdjustment):
+                continue
+
+            if event.id not in player_codes:
+                player_codes[event.id] = len(lineups.player_ids)
+                lineups.player_ids.append(event.id)
+            apply_lineup_change(event, player_codes[event.id], slots)
+            is_changed = True
+        return lineups
+
+    def get_batter(self, row: int, team_location: TeamLocation, batting_order_position: int) -> str | None:
+        """Get the player in a batting order slot during a play.
+
+        Args:
+            row: the index of the play among the game's plays
+            team_location: the team's location
+            batting_order_position: the batting order position (1-9)
+        """
+        return self._get_player(row, team_location, batting_order_position - 1)
+
+    def get_fielder(self, row: int, fielding_position: int, team_location: TeamLocation | None = None) -> str | None:
+        """Get the player in a defensive position during a play.
+
+        Args:
+            row: the index of the play among the game's plays
+            fielding_position: the defensive position (1-9, and 10 for the designated hitter)
+            team_location: the team's location, defaulting to the fielding team of the play
+        """
+        team_location = self._get_fielding_team(row) if team_location is None else team_location
+        return self._get_player(row, team_location, NUM_BATTING_ORDER_POSITIONS + fielding_position - 1)
+
+    def get_pitcher(self, row: int, team_location: TeamLocation | None = None) -> str | None:
+        """Get the pitcher during a play.
+
+        Args:
+            row: the index of the play among the game's plays
+            team_location: the team's location, defaulting to the fielding team of the play
+        """
+        return self.get_fielder(row, PITCHER_FIELDING_POSITION, team_location)
+
+    def resolve_fielders(self, row: int, fielding_positions: Iterable[int]) -> list[str | None]:
+        """Resolve the fielding positions of a play (e.g. of its put outs or assists) to the ids of its fielders.
+
+        Args:
+            row: the index of the play among the game's plays
+            fielding_positions: the fielding positions, with 0 (an unknown fielder) resolving to None
+        """
+        fielding_team = self._get_fielding_team(row)
+        return [
+            self.get_fielder(row, position, fielding_team) if 0 < position <= NUM_DEFENSIVE_POSITIONS else None
+            for position in fielding_positions
+        ]
+
+    def get_lineup(self, row: int, team_location: TeamLocation) -> Lineup:
+        """Get a team's lineup during a play.
+
+        Args:
+            row: the index of the play among the game's plays
+            team_location: the team's location
+        """
+        start = self._get_team_offset(row, team_location)
+        return decode_lineup(self.player_ids, self.versions[start : start + NUM_TEAM_SLOTS])
+
+    def _get_player(self, row: int, team_location: TeamLocation, slot: int) -> str | None:
+        code = self.versions[self._get_team_offset(row, team_location) + slot]
+        return self.player_ids[code] if code != NO_PLAYER else None
+
+    def _get_fielding_team(self, row: int) -> TeamLocation:
+        return TeamLocation(1 - self.team_location[row])
+
+    def _get_team_offset(self, row: int, team_location: TeamLocation) -> int:
+        return self.play_versions[row] * NUM_VERSION_SLOTS + team_location.value * NUM_TEAM_SLOTS
+
+
+def apply_lineup_change(player: Player, code: int, slots: list[int]) -> None:
+    """Apply a start or substitution to the lineup slots of both teams (see `GameLineups` for their layout).
+
+    Args:
+        player: the starting or substituted player
+        code: the player's code
+        slots: the lineup slots of both teams
+    """
+    team_offset = player.team_location.value * NUM_TEAM_SLOTS
+    # pitchers not batting (with a designated hitter) have a batting order position of 0
+    if 0 < player.batting_order_position <= NUM_BATTING_ORDER_POSITIONS:
+        slots[team_offset + player.batting_order_position - 1] = code
+
+    if 0 < player.fielding_position <= NUM_DEFENSIVE_POSITIONS:
+        defense_offset = team_offset + NUM_BATTING_ORDER_POSITIONS
+        for slot in range(defense_offset, defense_offset + NUM_DEFENSIVE_POSITIONS):
+            if slots[slot] == code:
+                slots[slot] = NO_PLAYER
+        slots[defense_offset + player.fielding_position - 1] = code
+
+
+def decode_lineup(player_ids: Sequence[str], team_slots: Sequence[int]) -> Lineup:
+    """Decode a team's lineup slots.
+
+    Args:
+        player_ids: the player ids, indexed by code
+        team_slots: the team's batting order slots followed by its defensive positions, as player codes
+    """
+    return Lineup(
+        batting_order=[
+            player_ids[code] if code != NO_PLAYER else None for code in team_slots[:NUM_BATTING_ORDER_POSITIONS]
+        ],
+        fielders={
+            position: player_ids[code]
+            for position, code in enumerate(team_slots[NUM_BATTING_ORDER_POSITIONS:], 1)
+            if code != NO_PLAYER
+        },
+    )
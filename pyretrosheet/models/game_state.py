@@ -0,0 +1,385 @@
+"""The base-out-score state of a game around each of its plays, tracked in a single pass."""
+import copy
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+
+from pyretrosheet.models.base import Base
+from pyretrosheet.models.game_lineups import (
+    NO_PLAYER,
+    NUM_BATTING_ORDER_POSITIONS,
+    NUM_TEAM_SLOTS,
+    NUM_VERSION_SLOTS,
+    apply_lineup_change,
+)
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.play.flags import PlayFlag
+from pyretrosheet.models.player import PINCH_RUNNER_FIELDING_POSITION, Player
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
+from pyretrosheet.models.team import TeamLocation
+
+# code of an empty base, or of a runner whose id is unknown, in the runner columns
+NO_RUNNER = -1
+# number of runner entries per play in the runner columns, for first, second and third base
+NUM_BASES = 3
+# bits of the base occupancy of a state, e.g. runners on first and third are `FIRST | THIRD` (5)
+FIRST = 1 << 0
+SECOND = 1 << 1
+THIRD = 1 << 2
+
+_BASE_INDEXES = {Base.FIRST_BASE: 0, Base.SECOND_BASE: 1, Base.THIRD_BASE: 2}
+# stands in for a runner whose id is unknown while tracking runners, e.g. one whose advance has no preceding record
+_UNKNOWN_RUNNER = ""
+
+
+@dataclass
+class BaseOutState:
+    """The outs, runners on base and score at a point of a half-inning.
+
+    Args:
+        outs: the number of outs
+        bases: the occupied bases, as a combination of the `FIRST`, `SECOND` and `THIRD` bits
+        runners: the ids of the runners on first, second and third, None for an empty base or an unknown runner
+        visiting_score: the visiting team's runs
+        home_score: the home team's runs
+    """
+
+    outs: int
+    bases: int
+    runners: tuple[str | None, str | None, str | None]
+    visiting_score: int
+    home_score: int
+
+
+@dataclass
+class PlayState:
+    """The state of a game before and after a play.
+
+    Args:
+        inning: the inning of the play
+        team_location: the batting team's location
+        before: the state before the play
+        after: the state after the play
+        starts_half_inning: the play is the first of its half-inning
+        ends_half_inning: the play is the last of its half-inning
+    """
+
+    inning: int
+    team_location: TeamLocation
+    before: BaseOutState
+    after: BaseOutState
+    starts_half_inning: bool
+    ends_half_inning: bool
+
+    @property
+    def runs(self) -> int:
+        """The number of runs scored on the play."""
+        score_before = self.before.home_score + self.before.visiting_score
+        return self.after.home_score + self.after.visiting_score - score_before
+
+
+@dataclass
+class GameStates:
+    """The base-out-score state before and after each play of a game, stored as typed columns (one row per play).
+
+    Rows are in the order of the game's plays, i.e. of `game.index.plays[None]`. Runners are dictionary-coded into
+    `runner_ids`, with `NUM_BASES` entries per row for first, second and third base and `NO_RUNNER` for an empty base
+    (or a runner whose id is unknown, who still occupies the base in the base columns). Each half-inning starts with
+    no outs and empty bases, but for the runners placed by runner adjustments (e.g. on second base in extra innings
+    since 2020); scores carry over between half-innings.
+
+    Args:
+        runner_ids: the player ids of the runners in the game
+        inning: the inning of the play
+        team_location: the value of the batting team's location
+        outs_before: the number of outs before the play
+        outs_after: the number of outs after the play
+        bases_before: the bases occupied before the play (`FIRST`, `SECOND` and `THIRD` bits)
+        bases_after: the bases occupied after the play
+        runners_before: the index in `runner_ids` of the runners on base before the play
+        runners_after: the index in `runner_ids` of the runners on base after the play
+        visiting_score: the visiting team's runs before the play
+        home_score: the home team's runs before the play
+        runs: the number of runs scored on the play, by the batting team
+        starts_half_inning: whether the play is the first of its half-inning
+        ends_half_inning: whether the play is the last of its half-inning
+    """
+
+    runner_ids: list[str] = field(default_factory=list)
+    inning: "array[int]" = field(default_factory=partial(array, "B"))
+    team_location: "array[int]" = field(default_factory=partial(array, "B"))
+    outs_before: "array[int]" = field(default_factory=partial(array, "B"))
+    outs_after: "array[int]" = field(default_factory=partial(array, "B"))
+    bases_before: "array[int]" = field(default_factory=partial(array, "B"))
+    bases_after: "array[int]" = field(default_factory=partial(array, "B"))
+    runners_before: "array[int]" = field(default_factory=partial(array, "h"))
+    runners_after: "array[int]" = field(default_factory=partial(array, "h"))
+    visiting_score: "array[int]" = field(default_factory=partial(array, "H"))
+    home_score: "array[int]" = field(default_factory=partial(array, "H"))
+    runs: "array[int]" = field(default_factory=partial(array, "B"))
+    starts_half_inning: "array[int]" = field(default_factory=partial(array, "B"))
+    ends_half_inning: "array[int]" = field(default_factory=partial(array, "B"))
+
+    def __len__(self) -> int:
+        """The number of plays."""
+        return len(self.inning)
+
+    def __getitem__(self, row: int) -> PlayState:
+        """Get the state around a play.
+
+        Args:
+            row: the index of the play among the game's plays
+        """
+        if row < 0:
+            row += len(self)
+        # raises an IndexError for rows out of range
+        team_location = TeamLocation(self.team_location[row])
+        visiting_score, home_score = self.visiting_score[row], self.home_score[row]
+        runs = self.runs[row]
+        return PlayState(
+            inning=self.inning[row],
+            team_location=team_location,
+            before=BaseOutState(
+                outs=self.outs_before[row],
+                bases=self.bases_before[row],
+                runners=self._get_runners(self.runners_before, row),
+                visiting_score=visiting_score,
+                home_score=home_score,
+            ),
+            after=BaseOutState(
+                outs=self.outs_after[row],
+                bases=self.bases_after[row],
+                runners=self._get_runners(self.runners_after, row),
+                visiting_score=visiting_score + (runs if team_location == TeamLocation.VISITING else 0),
+                home_score=home_score + (runs if team_location == TeamLocation.HOME else 0),
+            ),
+            starts_half_inning=bool(self.starts_half_inning[row]),
+            ends_half_inning=bool(self.ends_half_inning[row]),
+        )
+
+    def __iter__(self) -> Iterator[PlayState]:
+        """Iterate the states around each play."""
+        for row in range(len(self)):
+            yield self[row]
+
+    @classmethod
+    def from_chronological_events(
+        cls, chronological_events: Sequence[Player | Play | RunnerAdjustment]
+    ) -> "GameStates":
+        """Track the state of a game through its chronological events.
+
+        The state is tracked by a `GameStateTracker`, see `GameStateTracker.apply` for how events change it.
+
+        Args:
+            chronological_events: the game's chronological events
+        """
+        states = cls()
+        runner_codes: dict[str, int] = {}
+        tracker = GameStateTracker(chronological_events)
+        for event in chronological_events:
+            if not isinstance(event, Play):
+                tracker.apply(event)
+                continue
+
+            play = event
+            starts_half_inning = tracker.start_half_inning(play)
+            if starts_half_inning and states:
+                states.ends_half_inning[-1] = True
+            # plays replace the tracker's runners rather than moving them in place
+            runners, outs, score = tracker.runners, tracker.outs, tracker.score[play.team_location]
+            states.visiting_score.append(tracker.score[TeamLocation.VISITING])
+            states.home_score.append(tracker.score[TeamLocation.HOME])
+            tracker.apply(play)
+            states.inning.append(play.inning)
+            states.team_location.append(play.team_location.value)
+            states.outs_before.append(outs)
+            states.outs_after.append(tracker.outs)
+            states.bases_before.append(_get_bases(runners))
+            states.bases_after.append(_get_bases(tracker.runners))
+            states.runners_before.extend(_get_runner_code(runner_codes, states.runner_ids, r) for r in runners)
+            states.runners_after.extend(_get_runner_code(runner_codes, states.runner_ids, r) for r in tracker.runners)
+            states.runs.append(tracker.score[play.team_location] - score)
+            states.starts_half_inning.append(starts_half_inning)
+            states.ends_half_inning.append(False)
+        if states:
+            states.ends_half_inning[-1] = True
+        return states
+
+    def _get_runners(self, runner_column: "array[int]", row: int) -> tuple[str | None, str | None, str | None]:
+        first, second, third = (
+            self.runner_ids[code] if code != NO_RUNNER else None
+            for code in runner_column[row * NUM_BASES : (row + 1) * NUM_BASES]
+        )
+        return first, second, third
+
+
+class GameStateTracker:
+    """The state of a game (outs, runners, score, hits, errors and lineups) as its chronological events are applied.
+
+    The single source of a game's tracked state: `GameStates` records it around each play and
+    `game_checkpoints.GameCheckpoints` copies it at checkpoints.
+
+    Args:
+        player_ids: the ids of the game's players, shared by (and never modified through) copies
+        player_codes: map of player id to its index in `player_ids`, the code of the player in the lineup slots
+        position: the number of chronological events applied
+        half_inning: the inning and batting team of the half-inning in progress, None before the first play
+        outs: the number of outs
+        runners: the ids of the runners on first, second and third, None for an empty base or `_UNKNOWN_RUNNER` for an
+            unknown runner
+        adjusted_runners: the ids of the runners placed on first, second and third by runner adjustments, who take
+            their base when the next half-inning starts
+        lineup_slots: the lineup slots of both teams, see `game_lineups.GameLineups` for their layout
+        score: each team's runs
+        hits: each team's hits
+        errors: the errors committed by each team
+    """
+
+    def __init__(self, chronological_events: Sequence[Player | Play | RunnerAdjustment]):
+        """Initialize the state at the start of a game.
+
+        Args:
+            chronological_events: the game's chronological events
+        """
+        self.player_ids = list(dict.fromkeys(event.id for event in chronological_events if isinstance(event, Player)))
+        self.player_codes = {player_id: code for code, player_id in enumerate(self.player_ids)}
+        self.position = 0
+        self.half_inning: tuple[int, TeamLocation] | None = None
+        self.outs = 0
+        self.runners: list[str | None] = [None] * NUM_BASES
+        self.adjusted_runners: list[str | None] = [None] * NUM_BASES
+        self.lineup_slots = [NO_PLAYER] * NUM_VERSION_SLOTS
+        self.score = {location: 0 for location in TeamLocation}
+        self.hits = {location: 0 for location in TeamLocation}
+        self.errors = {location: 0 for location in TeamLocation}
+
+    def copy(self) -> "GameStateTracker":
+        """Copy the state, sharing the player ids and codes."""
+        tracker = copy.copy(self)
+        tracker.runners = list(self.runners)
+        tracker.adjusted_runners = list(self.adjusted_runners)
+        tracker.lineup_slots = list(self.lineup_slots)
+        tracker.score = dict(self.score)
+        tracker.hits = dict(self.hits)
+        tracker.errors = dict(self.errors)
+        return tracker
+
+    def start_half_inning(self, play: Play) -> bool:
+        """Start the half-inning of a play if it is a new one, clearing the outs and the bases but for adjusted runners.
+
+        Args:
+            play: the play
+
+        Returns:
+            whether the play starts a new half-inning
+        """
+        if self.half_inning == (play.inning, play.team_location):
+            return False
+
+        self.half_inning = (play.inning, play.team_location)
+        self.outs = 0
+        self.runners = self.adjusted_runners
+        self.adjusted_runners = [None] * NUM_BASES
+        return True
+
+    def apply(self, event: Player | Play | RunnerAdjustment) -> None:
+        """Apply a chronological event.
+
+        Starts and subs update the lineup slots, with pinch runners replacing the runner on base they run for. Runner
+        adjustments, which precede the first play of their half-inning, place their runner on base once it starts.
+        Plays start their half-inning if needed and move runners by their advances (see `Play.get_advances`).
+
+        Args:
+            event: the event
+        """
+        if isinstance(event, Player):
+            self._apply_lineup_change(event)
+        elif isinstance(event, RunnerAdjustment):
+            self.adjusted_runners[_BASE_INDEXES[event.base]] = event.runner_id
+        else:
+            self._apply_play(event)
+        self.position += 1
+
+    def _apply_lineup_change(self, player: Player) -> None:
+        replaced_code = NO_PLAYER
+        if 0 < player.batting_order_position <= NUM_BATTING_ORDER_POSITIONS:
+            team_offset = player.team_location.value * NUM_TEAM_SLOTS
+            replaced_code = self.lineup_slots[team_offset + player.batting_order_position - 1]
+        apply_lineup_change(player, self.player_codes[player.id], self.lineup_slots)
+        if player.fielding_position == PINCH_RUNNER_FIELDING_POSITION and replaced_code != NO_PLAYER:
+            replaced_player_id = self.player_ids[replaced_code]
+            for runners in (self.runners, self.adjusted_runners):
+                if replaced_player_id in runners:
+                    runners[runners.index(replaced_player_id)] = player.id
+
+    def _apply_play(self, play: Play) -> None:
+        self.start_half_inning(play)
+        self.runners, outs_on_play, runs = _advance_runners(play, self.runners)
+        self.outs += outs_on_play
+        self.score[play.team_location] += runs
+        if play.flags & PlayFlag.HIT:
+            self.hits[play.team_location] += 1
+        fielding_team = TeamLocation(1 - play.team_location.value)
+        self.errors[fielding_team] += sum(play.event.description.fielder_errors.values()) + sum(
+            len(advance.fielder_errors) for advance in play.event.advances
+        )
+
+
+def _advance_runners(play: Play, runners: list[str | None]) -> tuple[list[str | None], int, int]:
+    """Move the runners on base by the advances of a play.
+
+    Args:
+        play: the play
+        runners: the ids of the runners on first, second and third before the play
+
+    Returns:
+        the runners on base after the play, the number of outs made and the number of runs scored on the play
+    """
+    runners_after = list(runners)
+    arriving_runners: list[tuple[int, str]] = []
+    outs = runs = 0
+    for advance in play.get_advances():
+        if advance.from_base == Base.BATTER_AT_HOME:
+            runner = play.batter_id
+        else:
+            base_index = _BASE_INDEXES[advance.from_base]
+            runner = runners[base_index] or _UNKNOWN_RUNNER
+            runners_after[base_index] = None
+
+        if advance.is_out:
+            outs += 1
+        elif advance.to_base == Base.HOME:
+            runs += 1
+        else:
+            arriving_runners.append((_BASE_INDEXES[advance.to_base], runner))
+    # runners arrive after every runner left their base, as advances are ordered from the batter to third base
+    for base_index, runner in arriving_runners:
+        runners_after[base_index] = runner
+    return runners_after, outs, runs
+
+
+def _get_bases(runners: list[str | None]) -> int:
+    """Get the bases occupied by runners, as a combination of the `FIRST`, `SECOND` and `THIRD` bits.
+
+    Args:
+        runners: the runners on first, second and third, None for an empty base
+    """
+    return sum(1 << base_index for base_index, runner in enumerate(runners) if runner is not None)
+
+
+def _get_runner_code(runner_codes: dict[str, int], runner_ids: list[str], runner: str | None) -> int:
+    """Get the code of a runner in the runner columns, adding the runner to the runner ids if needed.
+
+    Args:
+        runner_codes: map of runner id to code
+        runner_ids: the runner ids, indexed by code
+        runner: the runner's id, None for an empty base or `_UNKNOWN_RUNNER` for an unknown runner
+    """
+    if not runner:
+        return NO_RUNNER
+
+    if runner not in runner_codes:
+        runner_codes[runner] = len(runner_ids)
+        runner_ids.append(runner)
+    return runner_codes[runner]
@@ -1,11 +1,30 @@
 """Encapsulates Retrosheet play data."""
+import re
 from dataclasses import dataclass
+from typing import Any
 
-from pyretrosheet.models.play.description import BatterEvent, RunnerEvent
+from pyretrosheet.models.base import Base
+from pyretrosheet.models.play.advance import Advance
+from pyretrosheet.models.play.description import BatterEvent, Description, RunnerEvent, get_batter_event
 from pyretrosheet.models.play.event import Event
+from pyretrosheet.models.play.flags import PlayFlag, is_strikeout
 from pyretrosheet.models.play.modifier import ModifierType
+from pyretrosheet.models.projection import Projection, reduce_partial
 from pyretrosheet.models.team import TeamLocation
 
+# runner events where the batter is not involved, and so runs scoring on them are not credited as RBIs
+NO_RBI_RUNNER_EVENTS = {
+    RunnerEvent.BALK,
+    RunnerEvent.CAUGHT_STEALING,
+    RunnerEvent.DEFENSIVE_INDIFFERENCE,
+    RunnerEvent.OTHER_ADVANCE,
+    RunnerEvent.PASSED_BALL,
+    RunnerEvent.WILD_PITCH,
+    RunnerEvent.PICKED_OFF,
+    RunnerEvent.PICKED_OFF_CAUGHT_STEALING,
+    RunnerEvent.STOLEN_BASE,
+}
+
 
 @dataclass
 class Play:
@@ -31,20 +50,59 @@ class Play:
     event: Event
     raw: str
 
+    def __reduce__(self) -> tuple[type["Play"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments, see `Game.__reduce__`."""
+        try:
+            return (
+                self.__class__,
+                (
+                    self.inning,
+                    self.team_location,
+                    self.batter_id,
+                    self.count,
+                    self.pitches,
+                    self.comments,
+                    self.event,
+                    self.raw,
+                ),
+            )
+        except AttributeError:
+            # projected instances lack the attributes that were not loaded
+            return reduce_partial(self)
+
     @classmethod
-    def from_play_line(cls, play_line: str, comment_lines: list[str] | None) -> "Play":
+    def from_play_line(
+        cls, play_line: str, comment_lines: list[str] | None, projection: Projection | None = None
+    ) -> "Play":
         """Load a play from a play line.
 
         Args:
             play_line: line for a play (format: play,inning,home/visitor,player id,count,pitches,event)
                 Examples include: 'play,7,0,saboc001,01,CX,8/F78', 'play,1,0,marts002,22,CBCBX,S9/L89S-'
             comment_lines: comment lines that reference the play, if present
+            projection: only load the fields selected by the projection
         """
         # Handle weird case of 'play,3,1,smitj106,??,,43,2-3' where I think this is an encoding error
         if play_line == "play,3,1,smitj106,??,,43,2-3":
             play_line = "play,3,1,smitj106,??,?,43.2-3"
 
         _, inning, team_location, batter_id, count, pitches, event = play_line.split(",")
+        if projection is not None and not projection.is_full("play"):
+            return projection.new(
+                cls,
+                "play",
+                {
+                    "inning": int(inning),
+                    "team_location": TeamLocation(int(team_location)),
+                    "batter_id": batter_id,
+                    "count": count,
+                    "pitches": pitches,
+                    "comments": [c.split(",")[1] for c in comment_lines or []],
+                    "raw": play_line,
+                    **({"event": Event.from_play_event(event, projection)} if projection.loads("event") else {}),
+                },
+            )
+
         return cls(
             inning=int(inning),
             team_location=TeamLocation(int(team_location)),
@@ -56,77 +114,206 @@ class Play:
             raw=play_line,
         )
 
+    @property
+    def flags(self) -> PlayFlag:
+        """The classification of the play, see `PlayFlag`."""
+        return self.event.flags
+
     def is_walk(self) -> bool:
         """Determines if the play resulted in a walk."""
-        return self.event.description.batter_event in [
-            BatterEvent.WALK,
-            BatterEvent.INTENTIONAL_WALK,
-        ]
+        return bool(self.event.flags & PlayFlag.WALK)
 
     def is_hit_by_pitch(self) -> bool:
         """Determines if the play resulted in the batter being hit by a pitch."""
-        return self.event.description.batter_event == BatterEvent.HIT_BY_PITCH
+        return bool(self.event.flags & PlayFlag.HIT_BY_PITCH)
 
     def is_sacrifice_fly(self) -> bool:
         """Determines if the play resulted in a sacrifice fly."""
-        return any(modifier.type == ModifierType.SACRIFICE_FLY for modifier in self.event.modifiers)
+        return bool(self.event.flags & PlayFlag.SACRIFICE_FLY)
 
     def is_an_at_bat(self) -> bool:
         """Determines if the play counts as an at bat."""
-        is_batter_event_at_bat = self.event.description.batter_event not in [
-            BatterEvent.NO_PLAY,
-            BatterEvent.CATCHER_INTERFERENCE,
-            BatterEvent.ERROR_ON_FOUL_FLY_BALL,
-        ]
-        is_runner_event_at_bat = self.event.description.runner_event not in [
-            RunnerEvent.WILD_PITCH,
-            RunnerEvent.CAUGHT_STEALING,
-            RunnerEvent.STOLEN_BASE,
-            RunnerEvent.OTHER_ADVANCE,
-            RunnerEvent.PASSED_BALL,
-            RunnerEvent.BALK,
-            RunnerEvent.PICKED_OFF,
-        ]
-        return all(
-            [
-                is_batter_event_at_bat,
-                is_runner_event_at_bat,
-                not self.is_walk(),
-                not self.is_hit_by_pitch(),
-                not self.is_sacrifice_fly(),
-            ]
-        )
+        return bool(self.event.flags & PlayFlag.AT_BAT)
 
     def is_single(self) -> bool:
         """Determines if the play resulted in a single."""
-        return self.event.description.batter_event == BatterEvent.SINGLE
+        return bool(self.event.flags & PlayFlag.SINGLE)
 
     def is_double(self) -> bool:
         """Determines if the play resulted in a double."""
-        return self.event.description.batter_event == BatterEvent.DOUBLE
+        return bool(self.event.flags & PlayFlag.DOUBLE)
 
     def is_triple(self) -> bool:
         """Determines if the play resulted in a triple."""
-        return self.event.description.batter_event == BatterEvent.TRIPLE
+        return bool(self.event.flags & PlayFlag.TRIPLE)
 
     def is_home_run(self) -> bool:
         """Determines if the play resulted in a home run."""
-        return self.event.description.batter_event in [
-            BatterEvent.HOME_RUN_INSIDE_PARK,
-            BatterEvent.HOME_RUN_LEAVING_PARK,
-        ]
+        return bool(self.event.flags & PlayFlag.HOME_RUN)
 
     def is_hit(self) -> bool:
         """Determines if the play resulted in a hit."""
-        return any(
-            [
-                self.is_single(),
-                self.is_double(),
-                self.is_triple(),
-                self.is_home_run(),
-            ]
-        )
+        return bool(self.event.flags & PlayFlag.HIT)
+
+    def is_strikeout(self) -> bool:
+        """Determines if the play resulted in a strikeout, including those combined with a runner event."""
+        return bool(self.event.flags & PlayFlag.STRIKEOUT)
 
     def batter_gets_on_base(self) -> bool:
         """Determines if the batter on the play gets on base (any base)."""
-        return any([self.is_hit(), self.is_walk(), self.is_hit_by_pitch()])
+        return bool(self.event.flags & PlayFlag.ON_BASE)
+
+    def get_advances(self) -> list[Advance]:
+        """Get all advances on the play, including those implied by the play's description.
+
+        Retrosheet leaves some advances implicit, e.g. the batter advancing to second on a double or a runner being
+        put out on a force play ('54(1)'). Implied advances are given for every runner without an explicit advance,
+        outs included (e.g. 'BX1' for a batter striking out), ordered batter first and then by base.
+        """
+        explicit_advances = {advance.from_base: advance for advance in self.event.advances}
+        implied_advances = {
+            advance.from_base: advance
+            for advance in (Advance.from_event_advance(a) for a in _get_implied_advances(self.event.description))
+            if advance.from_base not in explicit_advances
+        }
+        advances = {**explicit_advances, **implied_advances}
+        return [advances[base] for base in _BASES_IN_ADVANCE_ORDER if base in advances]
+
+    def num_outs_on_play(self) -> int:
+        """Determines the number of outs made on the play."""
+        return sum(advance.is_out for advance in self.get_advances())
+
+    def num_runs(self) -> int:
+        """Determines the number of runs scored on the play."""
+        return sum(advance.to_base == Base.HOME and not advance.is_out for advance in self.get_advances())
+
+    def num_rbis(self) -> int:
+        """Determines the number of runs batted in on the play.
+
+        Runs are credited as RBIs unless explicitly marked otherwise or scoring on an error, a double play or
+        a runner event not involving the batter (e.g. a wild pitch). Explicit RBI markers always credit the RBI.
+        """
+        description = self.event.description
+        is_rbi_play = not (
+            self.is_strikeout()
+            or description.batter_event
+            in [
+                BatterEvent.ERROR,
+                BatterEvent.GROUNDED_INTO_DOUBLE_PLAY,
+                BatterEvent.LINED_INTO_DOUBLE_PLAY,
+                BatterEvent.GROUNDED_INTO_TRIPLE_PLAY,
+                BatterEvent.LINED_INTO_TRIPLE_PLAY,
+            ]
+            or description.runner_event in NO_RBI_RUNNER_EVENTS
+            or any(modifier.type == ModifierType.GROUND_BALL_DOUBLE_PLAY for modifier in self.event.modifiers)
+        )
+        rbis = 0
+        for advance in self.get_advances():
+            if advance.to_base != Base.HOME or advance.is_out or advance.is_rbi_not_credited_explicit:
+                continue
+
+            if advance.is_rbi_credited_explicit or (is_rbi_play and not advance.fielder_errors):
+                rbis += 1
+
+        return rbis
+
+
+_BASES_IN_ADVANCE_ORDER = [Base.BATTER_AT_HOME, Base.FIRST_BASE, Base.SECOND_BASE, Base.THIRD_BASE]
+# the batter advance implied by a batter event, where the batter reaches base or strikes out
+_BATTER_EVENT_ADVANCES: dict[BatterEvent | None, str] = {
+    BatterEvent.SINGLE: "B-1",
+    BatterEvent.DOUBLE: "B-2",
+    BatterEvent.GROUND_RULE_DOUBLE: "B-2",
+    BatterEvent.TRIPLE: "B-3",
+    BatterEvent.HOME_RUN_LEAVING_PARK: "B-H",
+    BatterEvent.HOME_RUN_INSIDE_PARK: "B-H",
+    BatterEvent.ERROR: "B-1",
+    BatterEvent.FIELDERS_CHOICE: "B-1",
+    BatterEvent.CATCHER_INTERFERENCE: "B-1",
+    BatterEvent.HIT_BY_PITCH: "B-1",
+    BatterEvent.WALK: "B-1",
+    BatterEvent.INTENTIONAL_WALK: "B-1",
+    BatterEvent.STRIKEOUT: "BX1",
+}
+# batter events that may be followed by a '+' and runner events, e.g. 'K+SB2' or 'W+WP'
+_BATTER_EVENTS_WITH_RUNNER_EVENT = {BatterEvent.STRIKEOUT, BatterEvent.WALK, BatterEvent.INTENTIONAL_WALK}
+_NEXT_BASE = {"B": "1", "1": "2", "2": "3", "3": "H"}
+
+
+def _get_implied_advances(description: Description) -> list[str]:
+    """Get the advances implied by a play's description, encoded as Retrosheet advances.
+
+    Args:
+        description: the description of a play's event
+    """
+    # the description keeps the '!', '#' and '?' markers of e.g. 'S7!', which its batter event is not parsed with
+    raw = description.raw.replace("!", "").replace("#", "").replace("?", "")
+    batter_part, _, runner_part = raw.partition("+")
+    batter_event = description.batter_event
+    if is_strikeout(raw):
+        # including strikeouts with a fielder, e.g. 'K23'
+        batter_event = BatterEvent.STRIKEOUT
+    elif batter_event is None and batter_part == "FC":
+        # a fielder's choice without a fielder, which the description does not parse
+        batter_event = BatterEvent.FIELDERS_CHOICE
+    elif batter_event is None:
+        # the description's batter event is only parsed for descriptions without runner events or markers
+        batter_event = get_batter_event(batter_part)
+
+    if batter_event in _BATTER_EVENTS_WITH_RUNNER_EVENT:
+        return [_BATTER_EVENT_ADVANCES[batter_event], *_get_implied_runner_advances(runner_part)]
+
+    if advance := _BATTER_EVENT_ADVANCES.get(batter_event):
+        return [advance]
+
+    if re.fullmatch(r"(\d+(\([B123H]\))?)+", raw):
+        return _get_implied_fielded_out_advances(raw)
+
+    return _get_implied_runner_advances(raw)
+
+
+def _get_implied_fielded_out_advances(description: str) -> list[str]:
+    """Get the outs implied by a fielded out description, e.g. '63', '54(1)' or '8(B)84(2)'.
+
+    A fielding sequence without a parenthesized runner puts the batter out. If the batter is not put out
+    (a force out), the batter is implied to reach first.
+
+    Args:
+        description: the description part of a play's event
+    """
+    advances = []
+    batter_is_out = False
+    for _, explicit_runner in re.findall(r"(\d+)(?:\(([B123H])\))?", description):
+        runner = explicit_runner or "B"
+        batter_is_out = batter_is_out or runner == "B"
+        advances.append(f"{runner}X{_NEXT_BASE.get(runner, runner)}")
+
+    if not batter_is_out:
+        advances.append("B-1")
+
+    return advances
+
+
+def _get_implied_runner_advances(runner_events: str) -> list[str]:
+    """Get the runner advances implied by runner events, e.g. 'SB2;SB3', 'CS2(24)' or 'PO1(13)'.
+
+    Args:
+        runner_events: the runner event(s) part of a play's description
+    """
+    advances = []
+    for runner_event in runner_events.split(";"):
+        if match := re.fullmatch(r"SB([23H])", runner_event):
+            to_base = match.group(1)
+            from_base = {"2": "1", "3": "2", "H": "3"}[to_base]
+            advances.append(f"{from_base}-{to_base}")
+        elif match := re.fullmatch(r"(POCS|CS)([23H])\((.*)\)", runner_event):
+            to_base, fielders = match.group(2), match.group(3)
+            from_base = {"2": "1", "3": "2", "H": "3"}[to_base]
+            if "E" not in fielders:
+                advances.append(f"{from_base}X{to_base}")
+        elif match := re.fullmatch(r"PO([123])\((.*)\)", runner_event):
+            base, fielders = match.group(1), match.group(2)
+            if "E" not in fielders:
+                advances.append(f"{base}X{base}")
+
+    return advances
@@ -3,6 +3,7 @@ import re
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
 from pyretrosheet.models.base import Base
 from pyretrosheet.models.exceptions import ParseError
@@ -55,6 +56,27 @@ class Advance:
     is_team_unearned_run_explicit: bool
     raw: str
 
+    def __reduce__(self) -> tuple[type["Advance"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments, see `Game.__reduce__`."""
+        return (
+            self.__class__,
+            (
+                self.from_base,
+                self.to_base,
+                self.additional_info,
+                self.fielder_assists,
+                self.fielder_put_out,
+                self.fielder_handlers,
+                self.fielder_errors,
+                self.is_out,
+                self.is_unearned_run_explicit,
+                self.is_rbi_credited_explicit,
+                self.is_rbi_not_credited_explicit,
+                self.is_team_unearned_run_explicit,
+                self.raw,
+            ),
+        )
+
     @classmethod
     def from_event_advance(cls, advance: str) -> "Advance":
         """Load an advance from the advance part of a play's event.
@@ -3,8 +3,10 @@ import re
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Any
 
 from pyretrosheet.models.base import Base
+from pyretrosheet.models.projection import Projection, reduce_partial
 
 
 class BatterEvent(Enum):
@@ -75,15 +77,40 @@ class Description:
     stolen_base: Base | None
     raw: str
 
+    def __reduce__(self) -> tuple[type["Description"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments, see `Game.__reduce__`."""
+        try:
+            return (
+                self.__class__,
+                (
+                    self.batter_event,
+                    self.runner_event,
+                    self.fielder_assists,
+                    self.fielder_put_outs,
+                    self.fielder_handlers,
+                    self.fielder_errors,
+                    self.put_out_at_base,
+                    self.stolen_base,
+                    self.raw,
+                ),
+            )
+        except AttributeError:
+            # projected instances lack the attributes that were not loaded
+            return reduce_partial(self)
+
     @classmethod
-    def from_event_description(cls, description: str) -> "Description":
+    def from_event_description(cls, description: str, projection: Projection | None = None) -> "Description":
         """Load a description from the description part of a play's event.
 
         Args:
             description: the description part of a play's event
+            projection: only load the fields selected by the projection
         """
-        batter_event = _get_batter_event(description)
+        batter_event = get_batter_event(description)
         runner_event = _get_runner_event(description)
+        if projection is not None and not projection.is_full("description"):
+            return cls._from_event_description_projected(description, batter_event, runner_event, projection)
+
         fielding_out_plays = _get_fielding_out_plays(description, batter_event, runner_event)
         fielding_handler_plays = _get_fielding_handler_plays(description, batter_event, runner_event)
         return cls(
@@ -98,8 +125,40 @@ class Description:
             raw=description,
         )
 
+    @classmethod
+    def _from_event_description_projected(
+        cls,
+        description: str,
+        batter_event: BatterEvent | None,
+        runner_event: RunnerEvent | None,
+        projection: Projection,
+    ) -> "Description":
+        """Load a description with only the fields selected by a projection, skipping the parsing of the others.
 
-def _get_batter_event(description: str) -> BatterEvent | None:
+        Args:
+            description: the description part of a play's event
+            batter_event: the description's batter event
+            runner_event: the description's runner event
+            projection: the projection
+        """
+        attributes: dict[str, Any] = {"batter_event": batter_event, "runner_event": runner_event, "raw": description}
+        if projection.includes("description.fielder_assists") or projection.includes("description.fielder_put_outs"):
+            fielding_out_plays = _get_fielding_out_plays(description, batter_event, runner_event)
+            attributes["fielder_assists"] = _get_fielder_assists(fielding_out_plays)
+            attributes["fielder_put_outs"] = _get_fielder_put_outs(fielding_out_plays)
+        if projection.includes("description.fielder_handlers"):
+            fielding_handler_plays = _get_fielding_handler_plays(description, batter_event, runner_event)
+            attributes["fielder_handlers"] = _get_fielder_handlers(fielding_handler_plays)
+        if projection.includes("description.fielder_errors"):
+            attributes["fielder_errors"] = _get_fielder_errors(description, batter_event, runner_event)
+        if projection.includes("description.put_out_at_base"):
+            attributes["put_out_at_base"] = _get_put_out_at_base(description, batter_event)
+        if projection.includes("description.stolen_base"):
+            attributes["stolen_base"] = _get_stolen_base(description, runner_event)
+        return projection.new(cls, "description", attributes)
+
+
+def get_batter_event(description: str) -> BatterEvent | None:
     """Get the batter event from the description.
 
     The batter event is encoded at the start of the description, if there is one.
@@ -1,30 +1,71 @@
 """Encapsulates Retrosheet event as part of play data."""
 import re
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
 
 from pyretrosheet.models.exceptions import ParseError
 from pyretrosheet.models.play.advance import Advance
 from pyretrosheet.models.play.description import Description
+from pyretrosheet.models.play.flags import PlayFlag, get_play_flags
 from pyretrosheet.models.play.ignored import trim_ignored_characters
 from pyretrosheet.models.play.modifier import Modifier
+from pyretrosheet.models.projection import Projection, reduce_partial
 
 
 @dataclass
 class Event:
-    """The event of a play as defined in Retrosheet."""
+    """The event of a play as defined in Retrosheet.
+
+    Args:
+        description: the event's basic description
+        modifiers: the event's modifiers
+        advances: the event's explicit advances
+        raw: the raw event
+        flags: the classification of the play, computed from the description and modifiers on creation
+    """
 
     description: Description
     modifiers: list[Modifier]
     advances: list[Advance]
     raw: str
+    flags: PlayFlag = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Classify the play."""
+        self.flags = get_play_flags(self.description, self.modifiers)
+
+    def __reduce__(self) -> tuple[Callable[..., "Event"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments and the flags, see `Game.__reduce__`.
+
+        Unpickling restores the flags rather than classifying the play again.
+        """
+        try:
+            return (self._unpickle, (self.description, self.modifiers, self.advances, self.raw, int(self.flags)))
+        except AttributeError:
+            # projected instances lack the attributes that were not loaded
+            return reduce_partial(self)
+
+    @classmethod
+    def _unpickle(  # noqa: PLR0913
+        cls, description: Description, modifiers: list[Modifier], advances: list[Advance], raw: str, flags: int
+    ) -> "Event":
+        event = cls.__new__(cls)
+        event.description = description
+        event.modifiers = modifiers
+        event.advances = advances
+        event.raw = raw
+        event.flags = PlayFlag(flags)
+        return event
 
     @classmethod
-    def from_play_event(cls, event: str) -> "Event":
+    def from_play_event(cls, event: str, projection: Projection | None = None) -> "Event":
         """Load an event from a play line event value.
 
         Args:
             event: the event description (last part of a play line)
                 Examples include: '8/F78', '9/SF.3-H', 'S9/L9S.2-H;1-3'
+            projection: only load the fields selected by the projection
         """
         event_trimmed = trim_ignored_characters(event)
         # need to handle this case specifically as to not make the rest of the logic more complex
@@ -60,6 +101,22 @@ class Event:
         except AttributeError as e:
             raise ParseError("description_and_modifiers", event_trimmed) from e
 
+        if projection is not None and not projection.is_full("event"):
+            attributes: dict[str, Any] = {"raw": event}
+            if projection.loads("description"):
+                attributes["description"] = Description.from_event_description(description, projection)
+            if projection.loads("modifier"):
+                attributes["modifiers"] = [Modifier.from_event_modifier(m) for m in modifiers]
+            if projection.loads("advance"):
+                attributes["advances"] = [Advance.from_event_advance(a) for a in advances]
+            if projection.includes("event.flags"):
+                # flags need the full description and modifiers, whether or not they are loaded
+                attributes["flags"] = get_play_flags(
+                    Description.from_event_description(description),
+                    [Modifier.from_event_modifier(m) for m in modifiers],
+                )
+            return projection.new(cls, "event", attributes)
+
         return cls(
             description=Description.from_event_description(description),
             modifiers=[Modifier.from_event_modifier(m) for m in modifiers],
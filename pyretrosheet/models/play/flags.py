@@ -0,0 +1,92 @@
+"""Classification flags of a play, computed once when its event is parsed."""
+import re
+from collections.abc import Iterable
+from enum import IntFlag
+
+from pyretrosheet.models.play.description import BatterEvent, Description, RunnerEvent
+from pyretrosheet.models.play.modifier import Modifier, ModifierType
+
+# batter and runner events that do not count as an at bat
+_NO_AT_BAT_BATTER_EVENTS = {
+    BatterEvent.NO_PLAY,
+    BatterEvent.CATCHER_INTERFERENCE,
+    BatterEvent.ERROR_ON_FOUL_FLY_BALL,
+}
+_NO_AT_BAT_RUNNER_EVENTS = {
+    RunnerEvent.WILD_PITCH,
+    RunnerEvent.CAUGHT_STEALING,
+    RunnerEvent.STOLEN_BASE,
+    RunnerEvent.OTHER_ADVANCE,
+    RunnerEvent.PASSED_BALL,
+    RunnerEvent.BALK,
+    RunnerEvent.PICKED_OFF,
+}
+
+
+class PlayFlag(IntFlag):
+    """Classifications of a play, combined into a single integer per play.
+
+    Fits in 16 bits, so the flags of many plays can be stored in (and filtered as) an unsigned 16-bit column, e.g.
+    `flags & PlayFlag.HIT != 0`.
+    """
+
+    NONE = 0
+    AT_BAT = 1 << 0
+    SINGLE = 1 << 1
+    DOUBLE = 1 << 2
+    TRIPLE = 1 << 3
+    HOME_RUN = 1 << 4
+    WALK = 1 << 5
+    INTENTIONAL_WALK = 1 << 6
+    HIT_BY_PITCH = 1 << 7
+    SACRIFICE_FLY = 1 << 8
+    SACRIFICE_HIT = 1 << 9
+    STRIKEOUT = 1 << 10
+
+    HIT = SINGLE | DOUBLE | TRIPLE | HOME_RUN
+    ON_BASE = HIT | WALK | HIT_BY_PITCH
+
+
+def get_play_flags(description: Description, modifiers: Iterable[Modifier]) -> PlayFlag:
+    """Classify a play from its event's description and modifiers.
+
+    Args:
+        description: the description of the play's event
+        modifiers: the modifiers of the play's event
+    """
+    flags = _BATTER_EVENT_FLAGS.get(description.batter_event, PlayFlag.NONE)
+    for modifier in modifiers:
+        if modifier.type == ModifierType.SACRIFICE_FLY:
+            flags |= PlayFlag.SACRIFICE_FLY
+        elif modifier.type == ModifierType.SACRIFICE_HIT_BUNT:
+            flags |= PlayFlag.SACRIFICE_HIT
+    if is_strikeout(description.raw):
+        flags |= PlayFlag.STRIKEOUT
+    if not (
+        description.batter_event in _NO_AT_BAT_BATTER_EVENTS
+        or description.runner_event in _NO_AT_BAT_RUNNER_EVENTS
+        or flags & (PlayFlag.WALK | PlayFlag.HIT_BY_PITCH | PlayFlag.SACRIFICE_FLY)
+    ):
+        flags |= PlayFlag.AT_BAT
+    return flags
+
+
+def is_strikeout(description: str) -> bool:
+    """Determines if a description encodes a strikeout, including those combined with a runner event.
+
+    Args:
+        description: the description part of a play's event
+    """
+    return bool(re.match(r"K\d*(\+|$)", description))
+
+
+_BATTER_EVENT_FLAGS: dict[BatterEvent | None, PlayFlag] = {
+    BatterEvent.SINGLE: PlayFlag.SINGLE,
+    BatterEvent.DOUBLE: PlayFlag.DOUBLE,
+    BatterEvent.TRIPLE: PlayFlag.TRIPLE,
+    BatterEvent.HOME_RUN_LEAVING_PARK: PlayFlag.HOME_RUN,
+    BatterEvent.HOME_RUN_INSIDE_PARK: PlayFlag.HOME_RUN,
+    BatterEvent.WALK: PlayFlag.WALK,
+    BatterEvent.INTENTIONAL_WALK: PlayFlag.WALK | PlayFlag.INTENTIONAL_WALK,
+    BatterEvent.HIT_BY_PITCH: PlayFlag.HIT_BY_PITCH,
+}
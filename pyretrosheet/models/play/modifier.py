@@ -1,8 +1,10 @@
 """Encapsulates Retrosheet modifiers as part of play data."""
 
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Any
 
 from pyretrosheet.models.base import Base
 from pyretrosheet.models.exceptions import ParseError
@@ -138,6 +140,10 @@ class Modifier:
     base: Base | None
     raw: str
 
+    def __reduce__(self) -> tuple[Callable[..., "Modifier"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments, see `Game.__reduce__`."""
+        return (self.__class__, (self.type, self.hit_location, self.fielder_positions, self.base, self.raw))
+
     @classmethod
     def from_event_modifier(cls, modifier: str) -> "Modifier":
         """Load a modifier from the modifier part of a play's event.
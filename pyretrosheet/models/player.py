@@ -1,8 +1,14 @@
 """Encapsulates Retrosheet player data."""
 from dataclasses import dataclass
+from typing import Any
 
 from pyretrosheet.models.team import TeamLocation
 
+# fielding positions of players who are not fielders, the designated hitter, pinch hitters and pinch runners
+DESIGNATED_HITTER_FIELDING_POSITION = 10
+PINCH_HITTER_FIELDING_POSITION = 11
+PINCH_RUNNER_FIELDING_POSITION = 12
+
 
 @dataclass
 class Player:
@@ -25,6 +31,21 @@ class Player:
     is_sub: bool
     raw: str
 
+    def __reduce__(self) -> tuple[type["Player"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments, see `Game.__reduce__`."""
+        return (
+            self.__class__,
+            (
+                self.id,
+                self.name,
+                self.team_location,
+                self.batting_order_position,
+                self.fielding_position,
+                self.is_sub,
+                self.raw,
+            ),
+        )
+
     @classmethod
     def from_start_or_sub_line(cls, start_or_sub_line: str, is_sub: bool) -> "Player":
         """Load a player from Retrosheet start or sub line.
@@ -0,0 +1,193 @@
+"""Projections select the fields of the models to load, skipping the parsing of everything else.
+
+Fields are named `<model>.<attribute>`, with models named `game`, `player`, `play`, `runner_adjustment`, `event`,
+`description`, `modifier` and `advance`, e.g. `{"description.batter_event", "advance.to_base"}`. `<model>.*` selects
+every attribute of a model.
+
+A model is loaded if any of its fields, or of the fields of the models nested within it, is selected; attributes that
+are not selected are missing and raise `AttributeError` when accessed. Selecting an attribute holding nested models
+(e.g. `play.event`) loads those models in full. A game's `id` and `info` are always loaded, and players, runner
+adjustments, modifiers and advances are loaded in full when any of their fields is selected.
+"""
+import copyreg
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from typing import Any, TypeVar
+
+_Model = TypeVar("_Model")
+
+# the model that nests each model, and the attribute of the parent holding it
+_PARENTS = {
+    "player": ("game", "chronological_events"),
+    "play": ("game", "chronological_events"),
+    "runner_adjustment": ("game", "chronological_events"),
+    "event": ("play", "event"),
+    "description": ("event", "description"),
+    "modifier": ("event", "modifiers"),
+    "advance": ("event", "advances"),
+}
+# attributes holding nested models, which are loaded in full when the attribute is selected
+_NESTED_MODELS = {
+    ("game", "chronological_events"): ["player", "play", "runner_adjustment"],
+    ("play", "event"): ["event"],
+    ("event", "description"): ["description"],
+    ("event", "modifiers"): ["modifier"],
+    ("event", "advances"): ["advance"],
+}
+# attributes loaded regardless of the projection
+_ALWAYS_LOADED_FIELDS = {"game.id", "game.info"}
+# models loaded in full when any of their fields is selected
+_WHOLE_MODELS = ("player.", "runner_adjustment.", "modifier.", "advance.")
+
+
+class UnknownFieldError(ValueError):
+    """Raise when a projection selects a field that no model has."""
+
+    def __init__(self, field: str, known_fields: list[str]):
+        """Initialize the exception.
+
+        Args:
+            field: the unknown field
+            known_fields: the fields that can be selected
+        """
+        super().__init__(f"Unknown field {field!r}, expected one of {known_fields} or '<model>.*'")
+
+
+@dataclass(frozen=True)
+class Projection:
+    """The fields of the models to load, see the module's docstring.
+
+    Args:
+        fields: the selected fields, with wildcards expanded
+        models: the models to load (at least partially)
+        full_models: the models to load in full
+    """
+
+    fields: frozenset[str]
+    models: frozenset[str]
+    full_models: frozenset[str]
+
+    @classmethod
+    def from_fields(cls, fields: Iterable[str]) -> "Projection":
+        """Create a projection from selected fields.
+
+        Args:
+            fields: the selected fields, e.g. `{"description.batter_event", "advance.to_base"}`
+        """
+        model_fields = _get_model_fields()
+        selected_fields = set(_ALWAYS_LOADED_FIELDS)
+        for field in fields:
+            model, _, attribute = field.partition(".")
+            if attribute == "*" and model in model_fields:
+                selected_fields.update(f"{model}.{name}" for name in model_fields[model])
+            elif attribute in model_fields.get(model, []):
+                selected_fields.add(field)
+            else:
+                raise UnknownFieldError(
+                    field, [f"{model}.{name}" for model, names in model_fields.items() for name in names]
+                )
+
+        full_models: set[str] = set()
+        for field in selected_fields:
+            model, _, attribute = field.partition(".")
+            for nested_model in _NESTED_MODELS.get((model, attribute), []):
+                full_models.update(_get_descendants(nested_model))
+        # models are loaded whole when any of their fields is selected
+        full_models.update(field.partition(".")[0] for field in selected_fields if field.startswith(_WHOLE_MODELS))
+
+        models = {"game"}
+        for model in {field.partition(".")[0] for field in selected_fields} | full_models:
+            ancestor = model
+            while ancestor in _PARENTS:
+                models.add(ancestor)
+                ancestor = _PARENTS[ancestor][0]
+        # attributes holding loaded nested models are loaded too
+        selected_fields.update(
+            f"{parent}.{attribute}" for model, (parent, attribute) in _PARENTS.items() if model in models
+        )
+        return cls(fields=frozenset(selected_fields), models=frozenset(models), full_models=frozenset(full_models))
+
+    def loads(self, model: str) -> bool:
+        """Whether any of a model's fields (or of its nested models' fields) is loaded.
+
+        Args:
+            model: the name of the model, e.g. 'play'
+        """
+        return model in self.models
+
+    def is_full(self, model: str) -> bool:
+        """Whether a model is loaded in full.
+
+        Args:
+            model: the name of the model, e.g. 'play'
+        """
+        return model in self.full_models
+
+    def includes(self, field: str) -> bool:
+        """Whether a field is loaded.
+
+        Args:
+            field: the name of the field, e.g. 'play.comments'
+        """
+        return field in self.fields or field.partition(".")[0] in self.full_models
+
+    def new(self, cls: type[_Model], model: str, attributes: dict[str, Any]) -> _Model:
+        """Create a model instance with only the selected attributes set.
+
+        Args:
+            cls: the model's class
+            model: the name of the model, e.g. 'play'
+            attributes: the model's loaded attributes, which may include unselected attributes
+        """
+        instance: _Model = object.__new__(cls)
+        instance.__dict__.update(
+            (name, value) for name, value in attributes.items() if self.includes(f"{model}.{name}")
+        )
+        return instance
+
+
+def reduce_partial(instance: object) -> tuple[Any, ...]:
+    """Pickle a model instance missing unselected attributes as its attribute dict.
+
+    Args:
+        instance: the model instance
+    """
+    # only the dataclass fields are pickled, leaving out cached properties
+    field_names = instance.__dataclass_fields__  # type: ignore[attr-defined]
+    state = {name: value for name, value in instance.__dict__.items() if name in field_names}
+    return copyreg.__newobj__, (type(instance),), state  # type: ignore[attr-defined]
+
+
+def _get_descendants(model: str) -> list[str]:
+    """Get a model and the models nested within it, recursively.
+
+    Args:
+        model: the name of the model
+    """
+    children = [child for child, (parent, _) in _PARENTS.items() if parent == model]
+    return [model, *(descendant for child in children for descendant in _get_descendants(child))]
+
+
+def _get_model_fields() -> dict[str, list[str]]:
+    """Get the attribute names of each model."""
+    # imported here as the models import this module
+    from pyretrosheet.models.game import Game
+    from pyretrosheet.models.play import Play
+    from pyretrosheet.models.play.advance import Advance
+    from pyretrosheet.models.play.description import Description
+    from pyretrosheet.models.play.event import Event
+    from pyretrosheet.models.play.modifier import Modifier
+    from pyretrosheet.models.player import Player
+    from pyretrosheet.models.runner_adjustment import RunnerAdjustment
+
+    models = {
+        "game": Game,
+        "player": Player,
+        "play": Play,
+        "runner_adjustment": RunnerAdjustment,
+        "event": Event,
+        "description": Description,
+        "modifier": Modifier,
+        "advance": Advance,
+    }
+    return {name: [field.name for field in fields(model)] for name, model in models.items()}
@@ -0,0 +1,34 @@
+"""Encapsulates Retrosheet runner adjustment data."""
+from dataclasses import dataclass
+from typing import Any
+
+from pyretrosheet.models.base import Base
+
+
+@dataclass
+class RunnerAdjustment:
+    """A runner placed on base at the start of a half-inning, e.g. on second base in extra innings since 2020.
+
+    Args:
+        runner_id: the runner's id
+        base: the base the runner is placed on
+        raw: str
+    """
+
+    runner_id: str
+    base: Base
+    raw: str
+
+    def __reduce__(self) -> tuple[type["RunnerAdjustment"], tuple[Any, ...]]:
+        """Pickle as the constructor's positional arguments, see `Game.__reduce__`."""
+        return (self.__class__, (self.runner_id, self.base, self.raw))
+
+    @classmethod
+    def from_radj_line(cls, radj_line: str) -> "RunnerAdjustment":
+        """Load a runner adjustment from a Retrosheet radj line.
+
+        Args:
+            radj_line: radj line from Retrosheet play-by-play data, e.g. 'radj,rizza001,2'
+        """
+        _, runner_id, base = radj_line.split(",")
+        return cls(runner_id=runner_id, base=Base(base), raw=radj_line)
@@ -0,0 +1,236 @@
+"""Push-style parsing of Retrosheet play-by-play records, invoking callbacks per record type.
+
+Unlike loading `Game`s, a `RecordParser` streams event files line by line and only looks at the records that have
+callbacks registered, so scanning many years for one kind of record (e.g. every `data,er` line) costs little more
+than reading the files. Records are passed to callbacks as `Record`s, which build their model (e.g. a `Play` of a
+`play` record) only when a callback asks for it.
+
+Record types include `id`, `version`, `info`, `start`, `sub`, `play`, `com`, `data` and the adjustment records `radj`
+(runner placed on base), `badj` (batter hand), `padj` (pitcher hand), `ladj` (lineup order) and `presadj`
+(responsible pitcher).
+
+Example:
+    parser = RecordParser()
+
+    @parser.on_data
+    def on_data(record: Record) -> None:
+        print(record.game_id, record.values)
+
+    parser.parse_years(range(1990, 2000))
+"""
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.models.exceptions import ParseError
+from pyretrosheet.models.game_id import GameID
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
+
+RecordModel = GameID | Player | Play | RunnerAdjustment
+RecordCallback = Callable[["Record"], None]
+
+
+class RecordModelNotFoundError(Exception):
+    """Raise when the model of a record type without one is requested."""
+
+    def __init__(self, record_type: str):
+        """Initialize the exception.
+
+        Args:
+            record_type: the type of the record
+        """
+        super().__init__(
+            f"Records of type {record_type!r} have no model, expected one of 'id', 'start', 'sub', 'play', 'radj'"
+        )
+
+
+@dataclass
+class Record:
+    """A record (line) of a Retrosheet play-by-play file.
+
+    Args:
+        type: the record's type, e.g. 'play'
+        line: the raw line
+        game_id: the id of the game the record belongs to (e.g. 'WAS202204070'), None before the file's first game
+        file_path: the path of the play-by-play file
+        line_number: the line's number within the file, starting from 1
+        comment_lines: the `com` lines following a `play` record
+    """
+
+    type: str
+    line: str
+    game_id: str | None
+    file_path: str
+    line_number: int
+    comment_lines: list[str] = field(default_factory=list)
+
+    @cached_property
+    def values(self) -> list[str]:
+        """The comma separated values following the record's type."""
+        return self.line.split(",")[1:]
+
+    @cached_property
+    def model(self) -> RecordModel:
+        """The record's model, built on first access: a `GameID`, `Player`, `Play` or `RunnerAdjustment`."""
+        try:
+            match self.type:
+                case "id":
+                    return GameID.from_id_line(self.line)
+                case "start" | "sub":
+                    return Player.from_start_or_sub_line(self.line, is_sub=self.type == "sub")
+                case "play":
+                    return Play.from_play_line(self.line, self.comment_lines)
+                case "radj":
+                    return RunnerAdjustment.from_radj_line(self.line)
+        except ParseError as e:
+            raise ParseError(e.looking_for_value, e.raw_value, self.line, self.file_path) from e
+        except Exception as e:
+            raise ParseError("unknown", "unknown", self.line, self.file_path) from e
+
+        raise RecordModelNotFoundError(self.type)
+
+
+class RecordParser:
+    """Streams play-by-play files, invoking the callbacks registered for each record's type.
+
+    Callbacks are registered with `on` (or `on_<type>`, which can be used as decorators) and are invoked in order of
+    registration. `play` callbacks are invoked once the `com` lines following the play have been read, so that
+    `Record.comment_lines` is complete; `com` callbacks are therefore invoked before those of the play they follow.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a parser without callbacks."""
+        self._callbacks: dict[str, list[RecordCallback]] = {}
+
+    def on(self, record_type: str, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for records of a type.
+
+        Args:
+            record_type: the type of the records, e.g. 'play'
+            callback: called with each record of the type
+        """
+        self._callbacks.setdefault(record_type, []).append(callback)
+        return callback
+
+    def on_id(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `id` records, see `on`."""
+        return self.on("id", callback)
+
+    def on_info(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `info` records, see `on`."""
+        return self.on("info", callback)
+
+    def on_start(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `start` records, see `on`."""
+        return self.on("start", callback)
+
+    def on_sub(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `sub` records, see `on`."""
+        return self.on("sub", callback)
+
+    def on_play(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `play` records, see `on`."""
+        return self.on("play", callback)
+
+    def on_com(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `com` records, see `on`."""
+        return self.on("com", callback)
+
+    def on_data(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `data` records, see `on`."""
+        return self.on("data", callback)
+
+    def on_radj(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `radj` (runner adjustment) records, see `on`."""
+        return self.on("radj", callback)
+
+    def on_badj(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `badj` (batter hand adjustment) records, see `on`."""
+        return self.on("badj", callback)
+
+    def on_padj(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `padj` (pitcher hand adjustment) records, see `on`."""
+        return self.on("padj", callback)
+
+    def on_ladj(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `ladj` (lineup adjustment) records, see `on`."""
+        return self.on("ladj", callback)
+
+    def on_presadj(self, callback: RecordCallback) -> RecordCallback:
+        """Register a callback for `presadj` (responsible pitcher adjustment) records, see `on`."""
+        return self.on("presadj", callback)
+
+    def parse_years(
+        self,
+        years: Iterable[int],
+        data_dir: Path | str = load.DEFAULT_DATA_DIR,
+        force_download: bool = False,
+        compression: retrosheet.Compression | None = None,
+    ) -> None:
+        """Parse the play-by-play files of years of Retrosheet data.
+
+        Args:
+            years: the years to parse, in order
+            data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+            force_download: force a fresh download of the data even if it already exists
+            compression: store play-by-play files compressed with the given codec
+        """
+        for year in years:
+            files = retrosheet.retrieve_years_play_by_play_files(
+                year, Path(data_dir), force_download=force_download, compression=compression
+            )
+            for file in sorted(files):
+                self.parse_file(file)
+
+    def parse_file(self, file: Path) -> None:
+        """Parse a play-by-play file, streaming its lines.
+
+        Args:
+            file: the path of the play-by-play file, optionally compressed
+        """
+        with retrosheet.open_play_by_play_file(file) as lines:
+            self.parse_lines((line.rstrip("\r\n") for line in lines), file.as_posix())
+
+    def parse_lines(self, lines: Iterable[str], file_path: str = "<lines>") -> None:
+        """Parse the lines of a play-by-play file.
+
+        Args:
+            lines: lines of a play-by-play file, without line endings
+            file_path: the path of the play-by-play file, passed along in records and error messages
+        """
+        callbacks = self._callbacks
+        game_id = None
+        pending_play: Record | None = None
+        for line_number, line in enumerate(lines, start=1):
+            record_type, _, values = line.partition(",")
+            if pending_play is not None:
+                if record_type == "com":
+                    pending_play.comment_lines.append(line)
+                else:
+                    _invoke(callbacks["play"], pending_play)
+                    pending_play = None
+
+            if record_type == "id":
+                game_id = values.strip()
+
+            record_callbacks = callbacks.get(record_type)
+            if record_callbacks is None:
+                continue
+
+            record = Record(record_type, line, game_id, file_path, line_number)
+            if record_type == "play":
+                pending_play = record
+            else:
+                _invoke(record_callbacks, record)
+
+        if pending_play is not None:
+            _invoke(callbacks["play"], pending_play)
+
+
+def _invoke(callbacks: list[RecordCallback], record: Record) -> None:
+    for callback in callbacks:
+        callback(record)
@@ -0,0 +1,145 @@
+"""Incrementally refresh derived caches and exports from changes to Retrosheet data.
+
+A manifest per year (`<data_dir>/.<year>.manifest.json`) records a content hash of each of the year's play-by-play
+files and of each game block (the lines from an `id,` line up to the next) within them. A refresh re-downloads the
+year, skips files whose hash is unchanged, and re-parses only the game blocks that were added or changed. Files
+removed upstream are deleted by the download and reported as changed, with their games removed. The updated games
+and the ids of removed games are passed to refresh targets (e.g. `sqlite.refresh_target`), after which the manifest
+is updated, so the cost of a refresh scales with the size of the upstream changes.
+"""
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.models.game import Game
+
+RefreshTarget = Callable[["RefreshResult"], None]
+
+
+@dataclass
+class RefreshResult:
+    """The changes to a year's games found by a refresh.
+
+    Args:
+        year: the refreshed year
+        changed_files: the names of the play-by-play files added, changed or removed since the last refresh
+        updated_games: the games added or changed since the last refresh
+        removed_game_ids: the ids (e.g. 'WAS202204070') of the games removed since the last refresh
+    """
+
+    year: int
+    changed_files: list[str] = field(default_factory=list)
+    updated_games: list[Game] = field(default_factory=list)
+    removed_game_ids: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any game was added, changed or removed."""
+        return bool(self.updated_games or self.removed_game_ids)
+
+
+def refresh(
+    year: int,
+    targets: Iterable[RefreshTarget] = (),
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    force_download: bool = True,
+    compression: retrosheet.Compression | None = None,
+) -> RefreshResult:
+    """Refresh a year's data, applying the games that changed since the last refresh to the targets.
+
+    The first refresh of a year (without a manifest) treats every game as added. The manifest is only updated once
+    every target has applied the changes, so a failed refresh is retried in full by the next one.
+
+    Args:
+        year: the year to refresh
+        targets: callables applying the changes to a cache or export, e.g. `sqlite.refresh_target(database_path)`
+        data_dir: dir where Retrosheet data will be stored (defaults to '~/.pyretrosheet/data')
+        force_download: download the year's data again to pick up upstream changes
+        compression: store play-by-play files compressed with the given codec
+    """
+    data_dir = Path(data_dir)
+    files = retrosheet.retrieve_years_play_by_play_files(
+        year, data_dir, force_download=force_download, compression=compression
+    )
+    manifest_path = data_dir / f".{year}.manifest.json"
+    previous_manifest = _read_manifest(manifest_path)
+    manifest: dict[str, Any] = {}
+    result = RefreshResult(year)
+    for file in sorted(files):
+        text = load.read_play_by_play_file(file)
+        file_name = retrosheet.get_play_by_play_file_name(file)
+        file_hash = _hash(text)
+        previous_file_manifest = previous_manifest.get(file_name)
+        if previous_file_manifest and previous_file_manifest["hash"] == file_hash:
+            manifest[file_name] = previous_file_manifest
+            continue
+
+        previous_game_hashes = previous_file_manifest["games"] if previous_file_manifest else {}
+        game_hashes = {}
+        for game_lines in load.iter_game_lines(text.splitlines()):
+            game_id = _get_game_id(game_lines)
+            game_hash = game_hashes[game_id] = _hash("\n".join(game_lines))
+            if previous_game_hashes.get(game_id) != game_hash:
+                result.updated_games.extend(load.iter_games_from_lines(game_lines, file.as_posix()))
+
+        manifest[file_name] = {"hash": file_hash, "games": game_hashes}
+        result.changed_files.append(file_name)
+
+    # files in the previous manifest but not in the year's data were removed, along with their games
+    result.changed_files.extend(sorted(set(previous_manifest) - set(manifest)))
+    current_game_ids = {game_id for file_manifest in manifest.values() for game_id in file_manifest["games"]}
+    result.removed_game_ids = sorted(
+        {
+            game_id
+            for file_manifest in previous_manifest.values()
+            for game_id in file_manifest["games"]
+            if game_id not in current_game_ids
+        }
+    )
+
+    for target in targets:
+        target(result)
+
+    if result.has_changes:
+        load.clear_cache()
+    if manifest != previous_manifest:
+        _write_manifest(manifest_path, manifest)
+    return result
+
+
+def _get_game_id(game_lines: list[str]) -> str:
+    """Get the id of a game block from its `id,` line.
+
+    Args:
+        game_lines: the lines of a game
+    """
+    return game_lines[0].split(",")[1].strip()
+
+
+def _hash(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _read_manifest(manifest_path: Path) -> dict[str, Any]:
+    if not manifest_path.exists():
+        return {}
+
+    manifest: dict[str, Any] = json.loads(manifest_path.read_text())
+    return manifest
+
+
+def _write_manifest(manifest_path: Path, manifest: dict[str, Any]) -> None:
+    """Write a manifest atomically, so an interrupted write leaves the previous manifest in place.
+
+    Args:
+        manifest_path: the path of the manifest
+        manifest: the manifest
+    """
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, sort_keys=True))
+    tmp_path.replace(manifest_path)
@@ -1,12 +1,99 @@
 """Retrieve, load, and persist retrosheet.org data."""
+import bz2
+import gzip
+import lzma
+import shutil
+import sys
+import tempfile
 from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from enum import Enum
 from io import BytesIO
 from pathlib import Path
+from typing import IO, Any
 from zipfile import ZipFile
 
 from requests import Session
 
+if sys.platform != "win32":
+    import fcntl
+
+PLAY_BY_PLAY_FILE_EXTENSIONS = (
+    "EVN",  # National League data files
+    "EVA",  # American League data files
+    "EVF",  # Federal League data files
+    "EVR",  # Negro League data files
+)
+
+
+class Compression(Enum):
+    """Codecs play-by-play files may be stored at rest with.
+
+    The value of each member is the file suffix appended to the play-by-play file's name,
+    e.g. '2022WAS.EVN' is stored as '2022WAS.EVN.gz' with gzip compression.
+    """
+
+    GZIP = "gz"
+    BZ2 = "bz2"
+    LZMA = "xz"
+
+    @property
+    def suffix(self) -> str:
+        """The file suffix of files stored with the codec."""
+        return f".{self.value}"
+
+    def open(self, path: Path, mode: str = "rb") -> IO[Any]:
+        """Open a file stored with the codec, (de)compressing on the fly.
+
+        Args:
+            path: the path of the file
+            mode: the mode to open the file with
+        """
+        match self:
+            case Compression.GZIP:
+                return gzip.open(path, mode)  # type: ignore[return-value]
+            case Compression.BZ2:
+                return bz2.open(path, mode)
+            case Compression.LZMA:
+                return lzma.open(path, mode)
+
+
+def open_play_by_play_file(path: Path) -> IO[str]:
+    """Open a play-by-play file for reading text, decompressing on the fly if it is stored compressed.
+
+    Args:
+        path: the path of the play-by-play file
+    """
+    compression = get_compression(path)
+    if compression is None:
+        return path.open()
+
+    return compression.open(path, "rt")
+
+
+def get_compression(path: Path) -> Compression | None:
+    """Get the compression a file is stored with, inferred from its suffix.
+
+    Args:
+        path: the path of the file
+    """
+    for compression in Compression:
+        if path.suffix == compression.suffix:
+            return compression
+
+    return None
+
+
+def get_play_by_play_file_name(path: Path) -> str:
+    """Get the name of a play-by-play file independent of its compression, e.g. '2022WAS.EVN' for '2022WAS.EVN.gz'.
+
+    Args:
+        path: the path of the play-by-play file
+    """
+    compression = get_compression(path)
+    return path.name.removesuffix(compression.suffix) if compression else path.name
+
 
 @dataclass
 class RetrosheetClient:
@@ -45,6 +132,7 @@ def retrieve_years_play_by_play_files(
     data_dir: Path,
     retrosheet_client: RetrosheetClient | None = None,
     force_download: bool = False,
+    compression: Compression | None = None,
 ) -> list[Path]:
     """Retrieve a year's play-by-play files.
 
@@ -53,18 +141,86 @@ def retrieve_years_play_by_play_files(
         data_dir: the dir to retrieve/store play-by-play files from/to
         retrosheet_client: a Retrosheet client
         force_download: do not use existing data and force a new download of the data
+        compression: store play-by-play files compressed with the given codec
+            files stored with a different (or no) codec are not used and the data is retrieved again
+
+    Retrieval is safe across processes sharing a data dir: a per-year lock is held while checking for and
+    retrieving the year's files, so concurrent callers download the data once and the rest wait for it.
+    A download replaces the year's play-by-play files, deleting those that are no longer in the downloaded archive.
     """
     retrosheet_client = retrosheet_client or RetrosheetClient()
-    data_files = list(_yield_years_play_by_play_files(data_dir, year))
-    if data_files and not force_download:
-        return data_files
+    data_dir.mkdir(parents=True, exist_ok=True)
+    with data_dir_lock(data_dir, str(year)):
+        data_files = list(_yield_years_play_by_play_files(data_dir, year, compression))
+        if data_files and not force_download:
+            return data_files
+
+        data_zip_archive = retrosheet_client.get_zip_archive_of_years_play_by_play_data(year)
+        extracted_files = set(_extract_zip_archive_atomically(data_zip_archive, data_dir, compression))
+        data_files = list(_yield_years_play_by_play_files(data_dir, year, compression))
+        # files of a previous download that are no longer in the archive were removed upstream
+        for data_file in data_files:
+            if data_file not in extracted_files:
+                data_file.unlink()
+        return [data_file for data_file in data_files if data_file in extracted_files]
+
+
+@contextmanager
+def data_dir_lock(data_dir: Path, name: str) -> Iterator[None]:
+    """Hold an exclusive, cross-process lock on a named resource within a data dir, e.g. a year's data.
+
+    Locking is done via `fcntl.flock` on the file `.{name}.lock` in the data dir, which is released by the OS if the
+    holding process dies. On Windows, which lacks `fcntl`, no locking is done.
+
+    Args:
+        data_dir: the data dir
+        name: the name of the locked resource
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        yield
+        return
+
+    with (data_dir / f".{name}.lock").open("a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _extract_zip_archive_atomically(
+    zip_archive: ZipFile, target_dir: Path, compression: Compression | None = None
+) -> list[Path]:
+    """Extract a zip archive to a target directory such that no partially written file is ever visible.
+
+    The archive is extracted into a temporary directory within the target directory, after which each file is
+    atomically renamed into place.
 
-    data_zip_archive = retrosheet_client.get_zip_archive_of_years_play_by_play_data(year)
-    _extract_zip_archive(data_zip_archive, data_dir)
-    return list(_yield_years_play_by_play_files(data_dir, year))
+    Args:
+        zip_archive: the zip file to extract
+        target_dir: the path of the directory to extract to
+        compression: compress extracted play-by-play files with the given codec
+
+    Returns:
+        the extracted files
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target_files = []
+    with tempfile.TemporaryDirectory(dir=target_dir, prefix=".extract-") as tmp_dir:
+        extract_dir = Path(tmp_dir)
+        _extract_zip_archive(zip_archive, extract_dir, compression)
+        for extracted_file in extract_dir.rglob("*"):
+            if extracted_file.is_dir():
+                continue
+
+            target_file = target_dir / extracted_file.relative_to(extract_dir)
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            extracted_file.replace(target_file)
+            target_files.append(target_file)
+    return target_files
 
 
-def _extract_zip_archive(zip_archive: ZipFile, target_dir: Path) -> None:
+def _extract_zip_archive(zip_archive: ZipFile, target_dir: Path, compression: Compression | None = None) -> None:
     """Extract a zip archive to a target directory.
 
     If the target directory does not exist, it and its parents will be created.
@@ -72,19 +228,42 @@ def _extract_zip_archive(zip_archive: ZipFile, target_dir: Path) -> None:
     Args:
         zip_archive: the zip file to extract
         target_dir: the path of the directory to extract to
+        compression: compress extracted play-by-play files with the given codec
     """
     target_dir.mkdir(parents=True, exist_ok=True)
-    zip_archive.extractall(target_dir.as_posix())
+    if compression is None:
+        zip_archive.extractall(target_dir.as_posix())
+        return
+
+    for member in zip_archive.infolist():
+        if not _is_play_by_play_file_name(member.filename):
+            zip_archive.extract(member, target_dir.as_posix())
+            continue
+
+        compressed_file = target_dir / f"{member.filename}{compression.suffix}"
+        with zip_archive.open(member) as source, compression.open(compressed_file, "wb") as target:
+            shutil.copyfileobj(source, target)
+
+
+def _is_play_by_play_file_name(file_name: str) -> bool:
+    """Determine if a file name is of a play-by-play file.
+
+    Args:
+        file_name: the name of the file
+    """
+    return file_name.rpartition(".")[2] in PLAY_BY_PLAY_FILE_EXTENSIONS
 
 
-def _yield_years_play_by_play_files(data_dir: Path, year: int) -> Iterator[Path]:
+def _yield_years_play_by_play_files(
+    data_dir: Path, year: int, compression: Compression | None = None
+) -> Iterator[Path]:
     """Yield a year's play-by-play files.
 
     Args:
         data_dir: the directory to yield the files from
         year: the year to retrieve files for
+        compression: only yield files stored with the given codec
     """
-    yield from data_dir.glob(f"{year}*.EVN")  # National League data files
-    yield from data_dir.glob(f"{year}*.EVA")  # American League data files
-    yield from data_dir.glob(f"{year}*.EVF")  # Federal League data files
-    yield from data_dir.glob(f"{year}*.EVR")  # Negro League data files
+    suffix = compression.suffix if compression else ""
+    for extension in PLAY_BY_PLAY_FILE_EXTENSIONS:
+        yield from data_dir.glob(f"{year}*.{extension}{suffix}")
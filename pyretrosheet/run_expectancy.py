@@ -0,0 +1,219 @@
+"""Run expectancy of the 24 base-out states and the run value (RE24) of each play.
+
+Requires the `numpy` extra.
+
+The run expectancy of a base-out state is the mean number of runs the batting team scores from the state to the end
+of the half-inning. It is computed from the `PlayTable` columns of any number of seasons (`outs_before`,
+`bases_before`, `runs`, ...), with plays grouped into half-innings and runs to the end of each half-inning summed in
+a few vectorized passes. Only half-innings ending with three outs are counted, as walk-offs and rain-shortened
+half-innings end early, and no-play ('NP') events are left out.
+
+Seasons are aggregated independently into run totals and play counts per state, so seasons can be loaded and
+aggregated in parallel worker processes and merged by summing (see `RunExpectancy.load`).
+
+The RE24 of a play is the change in run expectancy over the play plus the runs scored on it:
+    RE24 = RE(state after) - RE(state before) + runs
+where the state after a play ending the half-inning has a run expectancy of 0.
+"""
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.dependencies import import_optional
+from pyretrosheet.models.play.description import BatterEvent
+from pyretrosheet.table import PlayTable, batter_event_code, map_years
+
+# base-out states are coded as `outs * NUM_BASE_STATES + bases`, see `get_base_out_state`
+NUM_BASE_STATES = 8
+NUM_OUTS = 3
+NUM_BASE_OUT_STATES = NUM_BASE_STATES * NUM_OUTS
+
+
+def get_base_out_state(outs: Any, bases: Any) -> Any:
+    """Get the code (0 to 23) of base-out states, e.g. of a play's `outs_before` and `bases_before` columns.
+
+    Args:
+        outs: the number of outs (0 to 2), or an array of them
+        bases: the occupied bases, as a combination of the `game_state` base bits, or an array of them
+    """
+    return outs * NUM_BASE_STATES + bases
+
+
+@dataclass
+class RunExpectancy:
+    """Run expectancy per base-out state, from the runs scored to the end of the half-inning after each state.
+
+    Args:
+        runs: the total runs scored from each base-out state to the end of its half-inning, indexed by state code
+        plays: the number of plays starting in each base-out state, indexed by state code
+    """
+
+    runs: Any
+    plays: Any
+
+    def __add__(self, other: "RunExpectancy") -> "RunExpectancy":
+        """Merge the aggregates of two sets of plays, e.g. of two seasons."""
+        return RunExpectancy(runs=self.runs + other.runs, plays=self.plays + other.plays)
+
+    @classmethod
+    def empty(cls) -> "RunExpectancy":
+        """Aggregates of no plays."""
+        np = import_optional("numpy", extra="numpy")
+        return cls(
+            runs=np.zeros(NUM_BASE_OUT_STATES, dtype=np.int64), plays=np.zeros(NUM_BASE_OUT_STATES, dtype=np.int64)
+        )
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "RunExpectancy":
+        """Aggregate play columns, ordered by game and then chronologically as in a `PlayTable` or `PlayStore`.
+
+        Args:
+            columns: `PlayTable` columns as NumPy arrays
+        """
+        np = import_optional("numpy", extra="numpy")
+        half_innings = _HalfInnings.from_columns(columns)
+        is_counted = (
+            half_innings.is_complete
+            & (columns["outs_before"] < NUM_OUTS)
+            & (columns["batter_event"] != batter_event_code(BatterEvent.NO_PLAY))
+        )
+        states = get_base_out_state(
+            columns["outs_before"][is_counted].astype(np.intp), columns["bases_before"][is_counted]
+        )
+        return cls(
+            runs=np.bincount(
+                states, weights=half_innings.runs_to_end[is_counted], minlength=NUM_BASE_OUT_STATES
+            ).astype(np.int64),
+            plays=np.bincount(states, minlength=NUM_BASE_OUT_STATES).astype(np.int64),
+        )
+
+    @classmethod
+    def from_table(cls, table: PlayTable) -> "RunExpectancy":
+        """Aggregate the plays of a table.
+
+        Args:
+            table: the table
+        """
+        return cls.from_columns(table.to_numpy())
+
+    @classmethod
+    def load_by_year(
+        cls,
+        years: Iterable[int],
+        data_dir: Path | str = load.DEFAULT_DATA_DIR,
+        compression: retrosheet.Compression | None = None,
+        max_workers: int | None = None,
+    ) -> dict[int, "RunExpectancy"]:
+        """Load years of Retrosheet data and aggregate the plays of each year, one season per worker process.
+
+        Each worker loads a season into a play table and returns only its aggregates (see `map_years`).
+
+        Args:
+            years: the years to aggregate
+            data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+            compression: store play-by-play files compressed with the given codec
+            max_workers: the number of processes loading seasons (defaults to the number of processors)
+        """
+        return dict(map_years(cls.from_table, years, data_dir, compression, max_workers))
+
+    @classmethod
+    def load(
+        cls,
+        years: Iterable[int],
+        data_dir: Path | str = load.DEFAULT_DATA_DIR,
+        compression: retrosheet.Compression | None = None,
+        max_workers: int | None = None,
+    ) -> "RunExpectancy":
+        """Load years of Retrosheet data and aggregate their plays, one season per worker process.
+
+        Args:
+            years: the years to aggregate
+            data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+            compression: store play-by-play files compressed with the given codec
+            max_workers: the number of processes loading seasons (defaults to the number of processors)
+        """
+        return sum(cls.load_by_year(years, data_dir, compression, max_workers).values(), cls.empty())
+
+    @property
+    def expectancy(self) -> Any:
+        """The mean runs scored from each base-out state to the end of its half-inning, NaN for states without plays."""
+        np = import_optional("numpy", extra="numpy")
+        expectancy = np.full(NUM_BASE_OUT_STATES, np.nan)
+        np.divide(self.runs, self.plays, out=expectancy, where=self.plays != 0)
+        return expectancy
+
+    def get(self, outs: int, bases: int) -> float:
+        """Get the run expectancy of a base-out state.
+
+        Args:
+            outs: the number of outs (0 to 2)
+            bases: the occupied bases, as a combination of the `game_state` base bits
+        """
+        return float(self.expectancy[get_base_out_state(outs, bases)])
+
+    def to_matrix(self) -> Any:
+        """The run expectancy as the classic matrix, with a row per base state (by base bits) and a column per out."""
+        return self.expectancy.reshape(NUM_OUTS, NUM_BASE_STATES).T
+
+    def re24(self, columns: Mapping[str, Any]) -> Any:
+        """Get the RE24 (run value) of each play of play columns, as a column aligned with them.
+
+        Plays from or to a state without plays in the aggregates have a NaN run value.
+
+        Args:
+            columns: `PlayTable` columns as NumPy arrays
+        """
+        np = import_optional("numpy", extra="numpy")
+        # a terminal state (three outs) is appended to the expectancy, with no runs expected
+        expectancy = np.append(self.expectancy, 0.0)
+        outs_before = columns["outs_before"].astype(np.intp)
+        states_before = _get_states_or_terminal(np, outs_before, columns["bases_before"])
+        states_after = _get_states_or_terminal(np, outs_before + columns["outs_on_play"], columns["bases_after"])
+        return expectancy[states_after] - expectancy[states_before] + columns["runs"]
+
+
+@dataclass
+class _HalfInnings:
+    """The half-innings of play columns.
+
+    Args:
+        runs_to_end: the runs scored from each play (included) to the end of its half-inning
+        is_complete: whether each play's half-inning ends with three outs
+    """
+
+    runs_to_end: Any
+    is_complete: Any
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "_HalfInnings":
+        np = import_optional("numpy", extra="numpy")
+        game_index, inning, team_location = columns["game_index"], columns["inning"], columns["team_location"]
+        starts = np.ones(len(game_index), dtype=bool)
+        starts[1:] = (
+            (game_index[1:] != game_index[:-1])
+            | (inning[1:] != inning[:-1])
+            | (team_location[1:] != team_location[:-1])
+        )
+        half_inning = np.cumsum(starts) - 1
+        # the row of the last play of each half-inning
+        ends = np.append(np.flatnonzero(starts)[1:] - 1, len(starts) - 1)[half_inning]
+        runs = columns["runs"].astype(np.int64)
+        cumulative_runs = np.cumsum(runs)
+        outs_after = columns["outs_before"] + columns["outs_on_play"]
+        return cls(
+            runs_to_end=cumulative_runs[ends] - cumulative_runs + runs,
+            is_complete=outs_after[ends] >= NUM_OUTS,
+        )
+
+
+def _get_states_or_terminal(np: Any, outs: Any, bases: Any) -> Any:
+    """Get the codes of base-out states, with `NUM_BASE_OUT_STATES` for states with three (or more) outs.
+
+    Args:
+        np: the numpy module
+        outs: an array of numbers of outs
+        bases: an array of occupied bases
+    """
+    return np.where(outs >= NUM_OUTS, NUM_BASE_OUT_STATES, get_base_out_state(np.minimum(outs, NUM_OUTS - 1), bases))
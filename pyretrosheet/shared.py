@@ -0,0 +1,179 @@
+"""Share play tables between processes via `multiprocessing.shared_memory`.
+
+A published table is a single shared memory block holding a length-prefixed JSON header (the string dictionaries and
+the offset of every column) followed by the raw column data. Workers attach to the block by name and read the columns
+through read-only, zero-copy views, so every process on the host shares one copy of the plays.
+
+The publishing process owns the block: it is unlinked when the owner is closed, garbage collected or exits, and by
+the `multiprocessing` resource tracker if the owner crashes.
+"""
+import json
+import sys
+import weakref
+from multiprocessing import parent_process, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any
+
+from pyretrosheet.dependencies import import_optional
+from pyretrosheet.table import NUM_FIELDER_POSITIONS, PlayTable
+
+# size of the header length prefix and the alignment of every column within the block
+_HEADER_LENGTH_SIZE = 8
+_ALIGNMENT = 8
+# names of the blocks published by this process, which must stay tracked when attached to
+_published_names: set[str] = set()
+
+
+class SharedPlayTable:
+    """A read-only play table in shared memory.
+
+    Columns are named and coded as in `PlayTable` and are exposed as read-only `memoryview`s into the shared block.
+    Create with `publish` in the owning process and `attach` in workers; close each when done, ideally via `with`.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, is_owner: bool):
+        """Read the header of a shared memory block and create views of its columns.
+
+        Args:
+            shared_memory: the shared memory block of a published table
+            is_owner: whether the table was published by this process, and so unlinks the block when closed
+        """
+        self.shared_memory = shared_memory
+        self.is_owner = is_owner
+        buffer = shared_memory.buf.toreadonly()
+        header_length = int.from_bytes(buffer[:_HEADER_LENGTH_SIZE], "little")
+        header = json.loads(bytes(buffer[_HEADER_LENGTH_SIZE : _HEADER_LENGTH_SIZE + header_length]))
+        # column offsets are relative to the start of the column data, which follows the header
+        data_start = _align(_HEADER_LENGTH_SIZE + header_length)
+        self.game_ids: list[str] = header["game_ids"]
+        self.batter_ids: list[str] = header["batter_ids"]
+        self.team_ids: list[str] = header["team_ids"]
+        self.columns: dict[str, memoryview] = {
+            name: buffer[data_start + offset : data_start + offset + size].cast(typecode)
+            for name, (typecode, offset, size) in header["columns"].items()
+        }
+        self._views = [buffer, *self.columns.values()]
+        self._finalizer = weakref.finalize(self, _release, shared_memory, self._views, is_owner)
+
+    @classmethod
+    def publish(cls, table: PlayTable, name: str | None = None) -> "SharedPlayTable":
+        """Copy a play table into a new shared memory block.
+
+        Args:
+            table: the table to publish
+            name: the name of the block, defaults to a random unique name
+        """
+        columns = {column_name: getattr(table, column_name) for column_name in PlayTable.column_names()}
+        header_columns = {}
+        data_size = 0
+        for column_name, column in columns.items():
+            size = len(column) * column.itemsize
+            header_columns[column_name] = (column.typecode, data_size, size)
+            data_size = _align(data_size + size)
+        header = {
+            "game_ids": table.game_ids,
+            "batter_ids": table.batter_ids,
+            "team_ids": table.team_ids,
+            "columns": header_columns,
+        }
+        encoded_header = json.dumps(header).encode()
+        data_start = _align(_HEADER_LENGTH_SIZE + len(encoded_header))
+
+        shared_memory = SharedMemory(name=name, create=True, size=data_start + data_size)
+        try:
+            buffer = shared_memory.buf
+            buffer[:_HEADER_LENGTH_SIZE] = len(encoded_header).to_bytes(_HEADER_LENGTH_SIZE, "little")
+            buffer[_HEADER_LENGTH_SIZE : _HEADER_LENGTH_SIZE + len(encoded_header)] = encoded_header
+            for column_name, column in columns.items():
+                _, column_offset, size = header_columns[column_name]
+                column_start = data_start + column_offset
+                buffer[column_start : column_start + size] = memoryview(column).cast("B")
+            del buffer
+        except BaseException:
+            shared_memory.close()
+            shared_memory.unlink()
+            raise
+
+        _published_names.add(shared_memory.name)
+        return cls(shared_memory, is_owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedPlayTable":
+        """Attach to a table published by another process.
+
+        Args:
+            name: the name of the table's shared memory block
+        """
+        shared_memory = SharedMemory(name=name)
+        if sys.version_info < (3, 13) and parent_process() is None and shared_memory.name not in _published_names:
+            # before Python 3.13 attaching registers the block with this process' resource tracker, which would unlink
+            # it when this process exits. Children of the owner share its tracker and can stay registered.
+            resource_tracker.unregister(shared_memory._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(shared_memory, is_owner=False)
+
+    @property
+    def name(self) -> str:
+        """The name of the table's shared memory block, used to attach to it."""
+        return self.shared_memory.name
+
+    def __len__(self) -> int:
+        """The number of plays in the table."""
+        return len(self.columns["game_index"])
+
+    def __enter__(self) -> "SharedPlayTable":
+        """Use the table within a context, closing it on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the table."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the table's views and detach from the block, unlinking it if this process owns it.
+
+        Any NumPy arrays created by `to_numpy` must be deleted before closing.
+        """
+        self._finalizer()
+
+    def to_numpy(self) -> dict[str, Any]:
+        """View the table's columns as read-only NumPy arrays, without copying.
+
+        Fielder credit columns are shaped `(len(table), NUM_FIELDER_POSITIONS)`.
+        Requires the `numpy` extra.
+        """
+        np = import_optional("numpy", extra="numpy")
+        columns = {}
+        for name, column in self.columns.items():
+            values = np.frombuffer(column, dtype=column.format) if len(column) else np.array([], dtype=column.format)
+            if name.startswith("fielder_"):
+                values = values.reshape(-1, NUM_FIELDER_POSITIONS)
+            values.flags.writeable = False
+            columns[name] = values
+        return columns
+
+
+def _release(shared_memory: SharedMemory, views: list[memoryview], unlink: bool) -> None:
+    """Release the views of a block, then detach from it and unlink it if owned.
+
+    Args:
+        shared_memory: the shared memory block
+        views: the views created of the block
+        unlink: whether to unlink (destroy) the block
+    """
+    if unlink:
+        _published_names.discard(shared_memory.name)
+        shared_memory.unlink()
+
+    for view in reversed(views):
+        view.release()
+    shared_memory.close()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,263 @@
+"""Vectorized batting stats over columns of plays.
+
+Requires the `numpy` extra.
+
+Stats are computed from the `PlayTable` columns of any number of seasons, whether of a `PlayTable` (`to_numpy`), a
+`PlayStore` (`select`) or a `SharedPlayTable` (`to_numpy`), by grouping plays on a dictionary-coded column (`batter`
+or `team`) with `np.bincount`. Counting stats are read from the play classification flags (see `PlayFlag`), so they
+match the `Play.is_*` predicates exactly:
+    AVG = H / AB
+    OBP = (H + BB + HBP) / (AB + BB + HBP + SF)
+    SLG = TB / AB, where TB = 1B + 2 * 2B + 3 * 3B + 4 * HR
+    OPS = OBP + SLG
+
+Rate stats are NaN for players (or teams) without any plate appearance in their denominator.
+"""
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field, fields
+from functools import partial
+from pathlib import Path
+from typing import Any, Literal
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.dependencies import import_optional
+from pyretrosheet.models.play.flags import PlayFlag
+from pyretrosheet.table import PlayTable, map_years
+
+GroupBy = Literal["batter", "team"]
+
+# the flag counted by each counting stat
+_FLAG_STATS = {
+    "at_bats": PlayFlag.AT_BAT,
+    "hits": PlayFlag.HIT,
+    "singles": PlayFlag.SINGLE,
+    "doubles": PlayFlag.DOUBLE,
+    "triples": PlayFlag.TRIPLE,
+    "home_runs": PlayFlag.HOME_RUN,
+    "walks": PlayFlag.WALK,
+    "intentional_walks": PlayFlag.INTENTIONAL_WALK,
+    "hit_by_pitches": PlayFlag.HIT_BY_PITCH,
+    "sacrifice_flies": PlayFlag.SACRIFICE_FLY,
+    "sacrifice_hits": PlayFlag.SACRIFICE_HIT,
+    "strikeouts": PlayFlag.STRIKEOUT,
+}
+
+
+@dataclass
+class BattingStats:
+    """Batting stats per player (or team), as NumPy arrays aligned with `ids`.
+
+    Args:
+        ids: the player (or team) ids
+        at_bats: at bats (AB)
+        hits: hits (H)
+        singles: singles (1B)
+        doubles: doubles (2B)
+        triples: triples (3B)
+        home_runs: home runs (HR)
+        walks: walks (BB), including intentional walks
+        intentional_walks: intentional walks (IBB)
+        hit_by_pitches: hit by pitches (HBP)
+        sacrifice_flies: sacrifice flies (SF)
+        sacrifice_hits: sacrifice hits (SH)
+        strikeouts: strikeouts (SO)
+        runs_batted_in: runs batted in (RBI)
+    """
+
+    ids: Sequence[str]
+    at_bats: Any
+    hits: Any
+    singles: Any
+    doubles: Any
+    triples: Any
+    home_runs: Any
+    walks: Any
+    intentional_walks: Any
+    hit_by_pitches: Any
+    sacrifice_flies: Any
+    sacrifice_hits: Any
+    strikeouts: Any
+    runs_batted_in: Any
+    _indexes: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index the ids."""
+        self._indexes = {str(id_): index for index, id_ in enumerate(self.ids)}
+
+    def __add__(self, other: "BattingStats") -> "BattingStats":
+        """Merge the stats of two sets of plays, e.g. of two seasons, adding up the stats of ids in both."""
+        np = import_optional("numpy", extra="numpy")
+        ids = list(dict.fromkeys([*map(str, self.ids), *map(str, other.ids)]))
+        indexes = {id_: index for index, id_ in enumerate(ids)}
+        self_indexes = np.array([indexes[str(id_)] for id_ in self.ids], dtype=np.intp)
+        other_indexes = np.array([indexes[str(id_)] for id_ in other.ids], dtype=np.intp)
+        counts = {}
+        for name in self.counting_stat_names():
+            count = np.zeros(len(ids), dtype=np.int64)
+            count[self_indexes] += getattr(self, name)
+            count[other_indexes] += getattr(other, name)
+            counts[name] = count
+        return BattingStats(ids=ids, **counts)
+
+    @classmethod
+    def empty(cls) -> "BattingStats":
+        """Stats of no plays."""
+        np = import_optional("numpy", extra="numpy")
+        return cls(ids=[], **{name: np.zeros(0, dtype=np.int64) for name in cls.counting_stat_names()})
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any], ids: Sequence[str], by: GroupBy = "batter") -> "BattingStats":
+        """Compute stats from play columns.
+
+        Args:
+            columns: `PlayTable` columns as NumPy arrays (at least `flags`, `rbi` and the `by` column)
+            ids: the dictionary of the `by` column, e.g. the table's `batter_ids`
+            by: the column to group plays by, `batter` or `team`
+        """
+        np = import_optional("numpy", extra="numpy")
+        codes = np.asarray(columns[by])
+        flags = np.asarray(columns["flags"])
+        num_ids = len(ids)
+        counts = {
+            name: np.bincount(codes[(flags & flag) != 0], minlength=num_ids) for name, flag in _FLAG_STATS.items()
+        }
+        runs_batted_in = np.bincount(codes, weights=columns["rbi"], minlength=num_ids).astype(np.int64)
+        return cls(ids=ids, runs_batted_in=runs_batted_in, **counts)
+
+    @classmethod
+    def from_table(cls, table: PlayTable, by: GroupBy = "batter") -> "BattingStats":
+        """Compute stats from a play table.
+
+        Args:
+            table: the table
+            by: the column to group plays by, `batter` or `team`
+        """
+        return cls.from_columns(table.to_numpy(), table.batter_ids if by == "batter" else table.team_ids, by)
+
+    @classmethod
+    def load_by_year(  # noqa: PLR0913
+        cls,
+        years: Iterable[int],
+        data_dir: Path | str = load.DEFAULT_DATA_DIR,
+        by: GroupBy = "batter",
+        compression: retrosheet.Compression | None = None,
+        max_workers: int | None = None,
+    ) -> dict[int, "BattingStats"]:
+        """Load years of Retrosheet data and compute the stats of each year, one season per worker process.
+
+        Each worker loads a season into a play table and returns only its stats (see `map_years`).
+
+        Args:
+            years: the years to compute stats over
+            data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+            by: the column to group plays by, `batter` or `team`
+            compression: store play-by-play files compressed with the given codec
+            max_workers: the number of processes loading seasons (defaults to the number of processors)
+        """
+        return dict(map_years(partial(cls.from_table, by=by), years, data_dir, compression, max_workers))
+
+    @classmethod
+    def load(  # noqa: PLR0913
+        cls,
+        years: Iterable[int],
+        data_dir: Path | str = load.DEFAULT_DATA_DIR,
+        by: GroupBy = "batter",
+        compression: retrosheet.Compression | None = None,
+        max_workers: int | None = None,
+    ) -> "BattingStats":
+        """Load years of Retrosheet data and compute their combined stats, one season per worker process.
+
+        Args:
+            years: the years to compute stats over
+            data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+            by: the column to group plays by, `batter` or `team`
+            compression: store play-by-play files compressed with the given codec
+            max_workers: the number of processes loading seasons (defaults to the number of processors)
+        """
+        return sum(cls.load_by_year(years, data_dir, by, compression, max_workers).values(), cls.empty())
+
+    @classmethod
+    def counting_stat_names(cls) -> list[str]:
+        """The names of the counting stats computed from plays."""
+        return [field.name for field in fields(cls) if field.init and field.name != "ids"]
+
+    @classmethod
+    def stat_names(cls) -> list[str]:
+        """The names of every stat, counting stats followed by derived stats."""
+        return [
+            *cls.counting_stat_names(),
+            "total_bases",
+            "batting_average",
+            "on_base_percentage",
+            "slugging_percentage",
+            "on_base_plus_slugging",
+        ]
+
+    @property
+    def total_bases(self) -> Any:
+        """Total bases (TB)."""
+        return self.singles + 2 * self.doubles + 3 * self.triples + 4 * self.home_runs
+
+    @property
+    def batting_average(self) -> Any:
+        """Batting average (AVG)."""
+        return _divide(self.hits, self.at_bats)
+
+    @property
+    def on_base_percentage(self) -> Any:
+        """On base percentage (OBP)."""
+        times_on_base = self.hits + self.walks + self.hit_by_pitches
+        return _divide(times_on_base, self.at_bats + self.walks + self.hit_by_pitches + self.sacrifice_flies)
+
+    @property
+    def slugging_percentage(self) -> Any:
+        """Slugging percentage (SLG)."""
+        return _divide(self.total_bases, self.at_bats)
+
+    @property
+    def on_base_plus_slugging(self) -> Any:
+        """On base plus slugging (OPS)."""
+        return self.on_base_percentage + self.slugging_percentage
+
+    def get(self, id_: str) -> dict[str, float]:
+        """Get the stats of a player (or team).
+
+        Args:
+            id_: the player (or team) id
+
+        Raises:
+            KeyError: if there are no stats for the id
+        """
+        index = self._indexes[id_]
+        id_stats = BattingStats(
+            ids=[id_], **{name: getattr(self, name)[index : index + 1] for name in self.counting_stat_names()}
+        )
+        return {name: getattr(id_stats, name)[0].item() for name in self.stat_names()}
+
+    def leaders(self, stat: str, n: int = 10, min_at_bats: int = 0) -> list[tuple[str, float]]:
+        """Get the players (or teams) with the highest value of a stat, in descending order.
+
+        Args:
+            stat: the name of a counting or rate stat, e.g. 'home_runs' or 'on_base_plus_slugging'
+            n: the number of leaders
+            min_at_bats: only include players (or teams) with at least as many at bats
+        """
+        np = import_optional("numpy", extra="numpy")
+        values = getattr(self, stat)
+        candidates = np.flatnonzero((self.at_bats >= min_at_bats) & ~np.isnan(values.astype(float)))
+        # a stable sort of the negated values keeps ties in id order
+        leaders = candidates[np.argsort(-values[candidates], kind="stable")[:n]]
+        return [(str(self.ids[index]), values[index].item()) for index in leaders]
+
+
+def _divide(numerator: Any, denominator: Any) -> Any:
+    """Divide arrays element-wise, with NaN where the denominator is zero.
+
+    Args:
+        numerator: the numerator
+        denominator: the denominator
+    """
+    np = import_optional("numpy", extra="numpy")
+    quotient = np.full(len(numerator), np.nan)
+    np.divide(numerator, denominator, out=quotient, where=denominator != 0)
+    return quotient
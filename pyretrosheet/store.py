@@ -0,0 +1,392 @@
+"""Memory-mapped columnar store of plays, built once and opened instantly by any number of processes.
+
+Requires the `numpy` extra.
+
+Layout (under `<data_dir>/play_store`):
+    CURRENT: the name of the version dir of the current store
+    <version>/: a built store, one NumPy `.npy` file per array:
+        <column>.npy: the `PlayTable` columns of every play, fielder credit columns shaped
+            (plays, NUM_FIELDER_POSITIONS)
+        game_ids.npy, batter_ids.npy, team_ids.npy: the string dictionaries of the `game_index`, `batter` and `team`
+            columns
+        column_names.npy: the names of the `PlayTable` columns the store was built with
+        years.npy: the years in the store, ascending
+        season_game_offsets.npy: season `i`'s games are `game_ids[season_game_offsets[i]:season_game_offsets[i + 1]]`
+        game_play_offsets.npy: game `i`'s plays are rows `game_play_offsets[i]:game_play_offsets[i + 1]`
+
+Readers memory-map the files, so opening a store reads nothing but the array headers and the OS page cache is shared
+by every process reading it.
+
+Each build writes a new version dir and then atomically replaces `CURRENT` to publish it, while readers resolve
+`CURRENT` once and open every array from that version, so a reader always sees one complete store. The version
+replaced by a build is kept for readers that were still opening it, and removed by the next build.
+
+`update` (and the `refresh.refresh` target from `refresh_target`) publishes a new version the same way, but only
+loads the years it rebuilds; the plays of the store's other years are copied from the current version.
+
+Opening a store built with other `PlayTable` columns (or before the store recorded them) raises `OutdatedStoreError`;
+the store needs to be rebuilt with `build`.
+"""
+import shutil
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.dependencies import import_optional
+from pyretrosheet.refresh import RefreshResult, RefreshTarget
+from pyretrosheet.table import NUM_FIELDER_POSITIONS, PlayTable
+
+STORE_DIR_NAME = "play_store"
+# the file naming the version dir of the current store
+CURRENT_FILE_NAME = "CURRENT"
+# number of values copied at a time from the build's scratch files into the final arrays
+_COPY_CHUNK_SIZE = 1 << 20
+
+
+class OutdatedStoreError(Exception):
+    """Raise when opening a store built with other `PlayTable` columns than the current ones."""
+
+    def __init__(self, store_dir: Path):
+        """Initialize the exception.
+
+        Args:
+            store_dir: the dir of the store
+        """
+        super().__init__(f"The play store at '{store_dir}' is outdated, rebuild it with store.build")
+
+
+def build(
+    years: Iterable[int],
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    compression: retrosheet.Compression | None = None,
+) -> Path:
+    """Build the store from years of Retrosheet data, replacing any existing store.
+
+    Years are loaded one at a time and their columns appended to scratch files, so memory use is bound by the largest
+    year. The store is built in a new version dir and published once complete (see the module's docstring), so readers
+    never see a partial store. Builds sharing a data dir are serialized by a cross-process lock.
+
+    Args:
+        years: the years to store
+        data_dir: dir where Retrosheet data (and the store) will be stored (defaults to '~/.pyretrosheet/data')
+        compression: store play-by-play files compressed with the given codec
+
+    Returns:
+        the dir of the store
+    """
+    return _publish_version(Path(data_dir), sorted(set(years)), compression)
+
+
+def update(
+    years: Iterable[int],
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    compression: retrosheet.Compression | None = None,
+) -> Path:
+    """Rebuild years of an existing store, e.g. after a refresh changed their data, adding any not in the store.
+
+    Only the given years are loaded; the plays of the store's other years are copied from the current version. The
+    new version is published like `build`'s.
+
+    Args:
+        years: the years to rebuild
+        data_dir: dir where Retrosheet data (and the store) is stored (defaults to '~/.pyretrosheet/data')
+        compression: store play-by-play files compressed with the given codec
+
+    Returns:
+        the dir of the store
+
+    Raises:
+        OutdatedStoreError: if the store was built with other `PlayTable` columns than the current ones
+    """
+    return _publish_version(Path(data_dir), sorted(set(years)), compression, update=True)
+
+
+def refresh_target(
+    data_dir: Path | str = load.DEFAULT_DATA_DIR, compression: retrosheet.Compression | None = None
+) -> RefreshTarget:
+    """Get a `refresh.refresh` target rebuilding the refreshed year of the store, see `update`.
+
+    Years the store was not built with are skipped, as are refreshes of a data dir without a store.
+
+    Args:
+        data_dir: dir where Retrosheet data (and the store) is stored (defaults to '~/.pyretrosheet/data')
+        compression: the codec the play-by-play files are stored with
+    """
+    current_file = Path(data_dir) / STORE_DIR_NAME / CURRENT_FILE_NAME
+
+    def apply(result: RefreshResult) -> None:
+        if result.has_changes and current_file.exists() and result.year in PlayStore.open(data_dir).years:
+            update([result.year], data_dir, compression)
+
+    return apply
+
+
+def _publish_version(
+    data_dir: Path, years: list[int], compression: retrosheet.Compression | None, update: bool = False
+) -> Path:
+    """Build a new version of the store and publish it, see the module's docstring.
+
+    Args:
+        data_dir: dir where Retrosheet data (and the store) is stored
+        years: the years to load, ascending
+        compression: store play-by-play files compressed with the given codec
+        update: keep the current version's other years, copying their plays rather than loading them
+    """
+    np = import_optional("numpy", extra="numpy")
+    store_dir = data_dir / STORE_DIR_NAME
+    store_dir.mkdir(parents=True, exist_ok=True)
+    with retrosheet.data_dir_lock(data_dir, STORE_DIR_NAME):
+        # opened under the lock, so that no other build replaces the version the kept years are copied from
+        current_store = PlayStore.open(data_dir) if update else None
+        version_dir = Path(tempfile.mkdtemp(dir=store_dir, prefix="version-"))
+        try:
+            _build_version(np, version_dir, years, data_dir, compression, current_store)
+        except BaseException:
+            shutil.rmtree(version_dir, ignore_errors=True)
+            raise
+
+        current_file = store_dir / CURRENT_FILE_NAME
+        previous_version = current_file.read_text() if current_file.exists() else None
+        new_current_file = store_dir / f".{CURRENT_FILE_NAME}.new"
+        new_current_file.write_text(version_dir.name)
+        new_current_file.replace(current_file)
+        # remove all but the new and the replaced version, including the dirs of failed builds
+        for path in store_dir.iterdir():
+            if path.name not in {CURRENT_FILE_NAME, version_dir.name, previous_version}:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+    return store_dir
+
+
+def _build_version(  # noqa: PLR0913
+    np: Any,
+    version_dir: Path,
+    years: list[int],
+    data_dir: Path,
+    compression: retrosheet.Compression | None,
+    current_store: "PlayStore | None" = None,
+) -> None:
+    """Build a version of the store.
+
+    Args:
+        np: the numpy module
+        version_dir: the dir to build the version in
+        years: the years to load, ascending
+        data_dir: dir where Retrosheet data is stored
+        compression: store play-by-play files compressed with the given codec
+        current_store: the current store, whose other years are copied into the version
+    """
+    kept_years = set(current_store.years.tolist()) - set(years) if current_store is not None else set()
+    years = sorted(set(years) | kept_years)
+    game_ids: list[str] = []
+    batter_codes: dict[str, int] = {}
+    team_codes: dict[str, int] = {}
+    season_game_offsets = [0]
+    game_play_offsets = [0]
+    scratch_files = {name: (version_dir / f"{name}.bin").open("wb") for name in PlayTable.column_names()}
+    try:
+        for year in years:
+            if current_store is not None and year in kept_years:
+                columns, year_game_ids, year_batter_ids, year_team_ids = _get_stored_season(np, current_store, year)
+            else:
+                table = PlayTable.load([year], data_dir, compression=compression)
+                columns, year_game_ids = table.to_numpy(), table.game_ids
+                year_batter_ids, year_team_ids = table.batter_ids, table.team_ids
+            plays_per_game = np.bincount(columns["game_index"], minlength=len(year_game_ids))
+            # re-code the year's dictionary-coded columns against the store's dictionaries
+            columns["game_index"] = columns["game_index"] + len(game_ids)
+            columns["batter"] = _recode(np, columns["batter"], year_batter_ids, batter_codes)
+            columns["team"] = _recode(np, columns["team"], year_team_ids, team_codes)
+            for name, scratch_file in scratch_files.items():
+                scratch_file.write(columns[name].tobytes())
+
+            game_play_offsets.extend((game_play_offsets[-1] + np.cumsum(plays_per_game)).tolist())
+            game_ids.extend(year_game_ids)
+            season_game_offsets.append(len(game_ids))
+    finally:
+        for scratch_file in scratch_files.values():
+            scratch_file.close()
+
+    num_plays = game_play_offsets[-1]
+    for name in PlayTable.column_names():
+        _write_column(np, version_dir, name, num_plays)
+    np.save(version_dir / "game_ids.npy", np.array(game_ids, dtype=str))
+    np.save(version_dir / "batter_ids.npy", np.array(list(batter_codes), dtype=str))
+    np.save(version_dir / "team_ids.npy", np.array(list(team_codes), dtype=str))
+    np.save(version_dir / "column_names.npy", np.array(PlayTable.column_names(), dtype=str))
+    np.save(version_dir / "years.npy", np.array(years, dtype=np.uint16))
+    np.save(version_dir / "season_game_offsets.npy", np.array(season_game_offsets, dtype=np.uint32))
+    np.save(version_dir / "game_play_offsets.npy", np.array(game_play_offsets, dtype=np.uint64))
+
+
+def _get_stored_season(
+    np: Any, play_store: "PlayStore", year: int
+) -> tuple[dict[str, Any], list[str], list[str], list[str]]:
+    """Get a season's columns from a store, coded like a `PlayTable` of the season.
+
+    Returns the columns, with `game_index` relative to the season's first game, and the season's game, batter and team
+    ids.
+
+    Args:
+        np: the numpy module
+        play_store: the store
+        year: the year of the season
+    """
+    games = play_store.season_games(year)
+    columns = play_store.select(play_store.season_rows(year))
+    game_index = columns["game_index"]
+    columns["game_index"] = game_index - np.array(games.start, dtype=game_index.dtype)
+    # keep only the season's batters and teams in their dictionaries
+    batter_codes, batter = np.unique(columns["batter"], return_inverse=True)
+    team_codes, team = np.unique(columns["team"], return_inverse=True)
+    columns["batter"] = batter.reshape(-1).astype(columns["batter"].dtype)
+    columns["team"] = team.reshape(-1).astype(columns["team"].dtype)
+    return (
+        columns,
+        play_store.game_ids[games].tolist(),
+        play_store.batter_ids[batter_codes].tolist(),
+        play_store.team_ids[team_codes].tolist(),
+    )
+
+
+def _recode(np: Any, column: Any, ids: list[str], codes: dict[str, int]) -> Any:
+    """Re-code a dictionary-coded column against the store's dictionary, adding any new ids to it.
+
+    Args:
+        np: the numpy module
+        column: the column, coded against `ids`
+        ids: the column's dictionary
+        codes: the store's dictionary, mapping ids to their code
+    """
+    code_map = np.array([codes.setdefault(id_, len(codes)) for id_ in ids], dtype=column.dtype)
+    return code_map[column]
+
+
+def _write_column(np: Any, version_dir: Path, name: str, num_plays: int) -> None:
+    """Copy a column's scratch file into its `.npy` file, chunk by chunk.
+
+    Args:
+        np: the numpy module
+        version_dir: the dir the store is being built in
+        name: the name of the column
+        num_plays: the number of plays in the store
+    """
+    scratch_path = version_dir / f"{name}.bin"
+    dtype = np.dtype(getattr(PlayTable(), name).typecode)
+    width = NUM_FIELDER_POSITIONS if name.startswith("fielder_") else 1
+    shape = (num_plays, width) if width > 1 else (num_plays,)
+    column = np.lib.format.open_memmap(version_dir / f"{name}.npy", mode="w+", dtype=dtype, shape=shape)
+    flat_column = column.reshape(-1)
+    with scratch_path.open("rb") as scratch_file:
+        for start in range(0, num_plays * width, _COPY_CHUNK_SIZE):
+            chunk = np.fromfile(scratch_file, dtype=dtype, count=_COPY_CHUNK_SIZE)
+            flat_column[start : start + len(chunk)] = chunk
+    column.flush()
+    del flat_column, column
+    scratch_path.unlink()
+
+
+@dataclass
+class PlayStore:
+    """A read-only, memory-mapped store of plays, see the module's docstring for its layout.
+
+    Args:
+        columns: the `PlayTable` columns of every play, as memory-mapped arrays
+        game_ids: the raw game ids of the games in the store
+        batter_ids: the player ids of the batters in the store
+        team_ids: the team ids of the batting teams in the store
+        years: the years in the store, ascending
+        season_game_offsets: the index of the first game of each season, followed by the number of games
+        game_play_offsets: the row of the first play of each game, followed by the number of plays
+    """
+
+    columns: dict[str, Any]
+    game_ids: Any
+    batter_ids: Any
+    team_ids: Any
+    years: Any
+    season_game_offsets: Any
+    game_play_offsets: Any
+
+    @classmethod
+    def open(cls, data_dir: Path | str = load.DEFAULT_DATA_DIR) -> "PlayStore":
+        """Open a built store by memory-mapping its arrays.
+
+        Args:
+            data_dir: dir where Retrosheet data (and the store) is stored (defaults to '~/.pyretrosheet/data')
+
+        Raises:
+            OutdatedStoreError: if the store was built with other `PlayTable` columns than the current ones
+        """
+        np = import_optional("numpy", extra="numpy")
+        store_dir = Path(data_dir) / STORE_DIR_NAME
+        current_file = store_dir / CURRENT_FILE_NAME
+        # stores built before versioned dirs have their arrays directly in the store dir
+        if not current_file.exists() and (store_dir / "years.npy").exists():
+            raise OutdatedStoreError(store_dir)
+
+        # resolved once, so that every array is opened from the same version even if a build publishes a new one
+        version_dir = store_dir / current_file.read_text()
+
+        def open_array(name: str) -> Any:
+            return np.load(version_dir / f"{name}.npy", mmap_mode="r")
+
+        column_names_path = version_dir / "column_names.npy"
+        if not column_names_path.exists() or np.load(column_names_path).tolist() != PlayTable.column_names():
+            raise OutdatedStoreError(store_dir)
+
+        return cls(
+            columns={name: open_array(name) for name in PlayTable.column_names()},
+            game_ids=open_array("game_ids"),
+            batter_ids=open_array("batter_ids"),
+            team_ids=open_array("team_ids"),
+            years=open_array("years"),
+            season_game_offsets=open_array("season_game_offsets"),
+            game_play_offsets=open_array("game_play_offsets"),
+        )
+
+    def __len__(self) -> int:
+        """The number of plays in the store."""
+        return len(self.columns["game_index"])
+
+    def season_games(self, year: int) -> slice:
+        """Get the indexes of a season's games in `game_ids`.
+
+        Args:
+            year: the year of the season
+        """
+        season = int(self.years.searchsorted(year))
+        if season == len(self.years) or self.years[season] != year:
+            raise KeyError(year)
+
+        return slice(int(self.season_game_offsets[season]), int(self.season_game_offsets[season + 1]))
+
+    def season_rows(self, year: int) -> slice:
+        """Get the rows of a season's plays.
+
+        Args:
+            year: the year of the season
+        """
+        games = self.season_games(year)
+        return slice(int(self.game_play_offsets[games.start]), int(self.game_play_offsets[games.stop]))
+
+    def game_rows(self, game_index: int) -> slice:
+        """Get the rows of a game's plays.
+
+        Args:
+            game_index: the index of the game in `game_ids`
+        """
+        return slice(int(self.game_play_offsets[game_index]), int(self.game_play_offsets[game_index + 1]))
+
+    def select(self, rows: slice) -> dict[str, Any]:
+        """Get views of every column over a range of rows, without copying.
+
+        Args:
+            rows: the rows to select, e.g. from `season_rows` or `game_rows`
+        """
+        return {name: column[rows] for name, column in self.columns.items()}
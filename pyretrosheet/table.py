@@ -0,0 +1,301 @@
+"""Columnar (struct-of-arrays) representations of Retrosheet data."""
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.dependencies import import_optional
+from pyretrosheet.models.game import Game
+from pyretrosheet.models.game_state import GameStates
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.play.description import BatterEvent, RunnerEvent
+from pyretrosheet.models.team import TeamLocation
+
+# fielder positions 1-9, with 0 encoding an unknown fielder
+NUM_FIELDER_POSITIONS = 10
+# code of a missing batter or runner event in the event columns
+NO_EVENT = 0
+
+T = TypeVar("T")
+
+
+@dataclass
+class PlayTable:
+    """Plays stored as typed columns, one row per play.
+
+    Columns are `array.array`s that can be viewed as NumPy arrays without copying via `to_numpy`. Strings are
+    dictionary-coded: `game_index` indexes into `game_ids`, `batter` into `batter_ids` and `team` into `team_ids`.
+    Batter and runner events are coded by their enum value, with `NO_EVENT` (0) for plays without one.
+
+    Fielder credit columns are flattened per play with `NUM_FIELDER_POSITIONS` entries per row,
+    i.e. the put outs of the shortstop on play `i` are at `fielder_put_outs[i * NUM_FIELDER_POSITIONS + 6]`.
+
+    Args:
+        game_ids: the raw game ids of the games in the table
+        batter_ids: the player ids of the batters in the table
+        team_ids: the team ids of the batting teams in the table
+        game_index: the index of the play's game in `game_ids`
+        inning: the inning the play occurred in
+        team_location: the value of the batting team's location
+        team: the index of the batting team in `team_ids`
+        batter: the index of the play's batter in `batter_ids`
+        batter_event: the value of the play's batter event
+        runner_event: the value of the play's runner event
+        outs_before: the number of outs before the play
+        bases_before: the bases occupied before the play, as a combination of the `game_state` base bits
+        bases_after: the bases occupied after the play
+        visiting_score: the visiting team's runs before the play
+        home_score: the home team's runs before the play
+        outs_on_play: the number of outs made on the play
+        runs: the number of runs scored on the play
+        rbi: the number of runs batted in on the play
+        flags: the play's classification flags (`PlayFlag`), e.g. filter hits with `flags & PlayFlag.HIT != 0`
+        fielder_put_outs: the number of put outs per fielder position on the play
+        fielder_assists: the number of assists per fielder position on the play
+        fielder_errors: the number of errors per fielder position on the play
+    """
+
+    game_ids: list[str] = field(default_factory=list)
+    batter_ids: list[str] = field(default_factory=list)
+    team_ids: list[str] = field(default_factory=list)
+    game_index: "array[int]" = field(default_factory=partial(array, "I"))
+    inning: "array[int]" = field(default_factory=partial(array, "B"))
+    team_location: "array[int]" = field(default_factory=partial(array, "B"))
+    team: "array[int]" = field(default_factory=partial(array, "H"))
+    batter: "array[int]" = field(default_factory=partial(array, "I"))
+    batter_event: "array[int]" = field(default_factory=partial(array, "B"))
+    runner_event: "array[int]" = field(default_factory=partial(array, "B"))
+    outs_before: "array[int]" = field(default_factory=partial(array, "B"))
+    bases_before: "array[int]" = field(default_factory=partial(array, "B"))
+    bases_after: "array[int]" = field(default_factory=partial(array, "B"))
+    visiting_score: "array[int]" = field(default_factory=partial(array, "H"))
+    home_score: "array[int]" = field(default_factory=partial(array, "H"))
+    outs_on_play: "array[int]" = field(default_factory=partial(array, "B"))
+    runs: "array[int]" = field(default_factory=partial(array, "B"))
+    rbi: "array[int]" = field(default_factory=partial(array, "B"))
+    flags: "array[int]" = field(default_factory=partial(array, "H"))
+    fielder_put_outs: "array[int]" = field(default_factory=partial(array, "B"))
+    fielder_assists: "array[int]" = field(default_factory=partial(array, "B"))
+    fielder_errors: "array[int]" = field(default_factory=partial(array, "B"))
+    _batter_codes: dict[str, int] = field(init=False, repr=False, compare=False)
+    _team_codes: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index existing batter and team ids for dictionary-coding."""
+        self._batter_codes = {batter_id: code for code, batter_id in enumerate(self.batter_ids)}
+        self._team_codes = {team_id: code for code, team_id in enumerate(self.team_ids)}
+
+    def __len__(self) -> int:
+        """The number of plays in the table."""
+        return len(self.game_index)
+
+    @classmethod
+    def from_games(cls, games: Iterable[Game]) -> "PlayTable":
+        """Build a table from games.
+
+        Args:
+            games: the games to add the plays of
+        """
+        table = cls()
+        for game in games:
+            table.append_game(game)
+        return table
+
+    @classmethod
+    def load(
+        cls,
+        years: Iterable[int],
+        data_dir: Path | str = load.DEFAULT_DATA_DIR,
+        compression: retrosheet.Compression | None = None,
+    ) -> "PlayTable":
+        """Load the plays of years of Retrosheet data directly into a table.
+
+        Games are parsed one at a time and discarded once their plays are written to the table, so memory use is
+        bound by the size of the table rather than of the parsed games.
+
+        Args:
+            years: the years to load Retrosheet data for
+            data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+            compression: store play-by-play files compressed with the given codec
+        """
+        table = cls()
+        for year in years:
+            for game in load.iter_games(year, data_dir, compression=compression):
+                table.append_game(game)
+        return table
+
+    @classmethod
+    def column_names(cls) -> list[str]:
+        """The names of the table's typed columns."""
+        return [
+            "game_index",
+            "inning",
+            "team_location",
+            "team",
+            "batter",
+            "batter_event",
+            "runner_event",
+            "outs_before",
+            "bases_before",
+            "bases_after",
+            "visiting_score",
+            "home_score",
+            "outs_on_play",
+            "runs",
+            "rbi",
+            "flags",
+            "fielder_put_outs",
+            "fielder_assists",
+            "fielder_errors",
+        ]
+
+    def append_game(self, game: Game) -> None:
+        """Append the plays of a game to the table.
+
+        Args:
+            game: the game to append the plays of
+        """
+        game_index = len(self.game_ids)
+        self.game_ids.append(game.id.raw)
+        team_codes = {
+            TeamLocation.HOME: self._get_team_code(game.home_team_id),
+            TeamLocation.VISITING: self._get_team_code(game.visiting_team_id),
+        }
+        # the outs and runs on each play are read from the game's states, which already derived the play's advances
+        states = game.states
+        for row, play in enumerate(game.index.plays[None]):
+            self._append_play(game_index, team_codes[play.team_location], play, states, row)
+
+    def _append_play(  # noqa: PLR0913
+        self, game_index: int, team_code: int, play: Play, states: GameStates, row: int
+    ) -> None:
+        description = play.event.description
+        self.game_index.append(game_index)
+        self.inning.append(play.inning)
+        self.team_location.append(play.team_location.value)
+        self.team.append(team_code)
+        self.batter.append(self._get_batter_code(play.batter_id))
+        self.batter_event.append(batter_event_code(description.batter_event))
+        self.runner_event.append(runner_event_code(description.runner_event))
+        self.outs_before.append(states.outs_before[row])
+        self.bases_before.append(states.bases_before[row])
+        self.bases_after.append(states.bases_after[row])
+        self.visiting_score.append(states.visiting_score[row])
+        self.home_score.append(states.home_score[row])
+        self.outs_on_play.append(states.outs_after[row] - states.outs_before[row])
+        self.runs.append(states.runs[row])
+        self.rbi.append(play.num_rbis())
+        self.flags.append(play.flags)
+
+        put_outs = [0] * NUM_FIELDER_POSITIONS
+        assists = [0] * NUM_FIELDER_POSITIONS
+        errors = [0] * NUM_FIELDER_POSITIONS
+        for position, count in description.fielder_put_outs.items():
+            put_outs[position] += count
+        for position, count in description.fielder_assists.items():
+            assists[position] += count
+        for position, count in description.fielder_errors.items():
+            errors[position] += count
+        for advance in play.event.advances:
+            if advance.fielder_put_out is not None:
+                put_outs[advance.fielder_put_out] += 1
+            for position in advance.fielder_assists:
+                assists[position] += 1
+            for position in advance.fielder_errors:
+                errors[position] += 1
+        self.fielder_put_outs.extend(put_outs)
+        self.fielder_assists.extend(assists)
+        self.fielder_errors.extend(errors)
+
+    def _get_batter_code(self, batter_id: str) -> int:
+        code = self._batter_codes.get(batter_id)
+        if code is None:
+            code = self._batter_codes[batter_id] = len(self.batter_ids)
+            self.batter_ids.append(batter_id)
+        return code
+
+    def _get_team_code(self, team_id: str) -> int:
+        code = self._team_codes.get(team_id)
+        if code is None:
+            code = self._team_codes[team_id] = len(self.team_ids)
+            self.team_ids.append(team_id)
+        return code
+
+    def to_numpy(self) -> dict[str, Any]:
+        """View the table's columns as NumPy arrays, without copying.
+
+        Fielder credit columns are shaped `(len(table), NUM_FIELDER_POSITIONS)`.
+        Requires the `numpy` extra.
+        """
+        np = import_optional("numpy", extra="numpy")
+        columns = {}
+        for name in self.column_names():
+            column = getattr(self, name)
+            values = (
+                np.frombuffer(column, dtype=column.typecode) if len(column) else np.array([], dtype=column.typecode)
+            )
+            if name.startswith("fielder_"):
+                values = values.reshape(-1, NUM_FIELDER_POSITIONS)
+            columns[name] = values
+        return columns
+
+
+def batter_event_code(batter_event: BatterEvent | None) -> int:
+    """Get the code of a batter event as stored in a table's `batter_event` column.
+
+    Args:
+        batter_event: the batter event
+    """
+    return batter_event.value if batter_event else NO_EVENT
+
+
+def runner_event_code(runner_event: RunnerEvent | None) -> int:
+    """Get the code of a runner event as stored in a table's `runner_event` column.
+
+    Args:
+        runner_event: the runner event
+    """
+    return runner_event.value if runner_event else NO_EVENT
+
+
+def map_years(
+    function: Callable[[PlayTable], T],
+    years: Iterable[int],
+    data_dir: Path | str = load.DEFAULT_DATA_DIR,
+    compression: retrosheet.Compression | None = None,
+    max_workers: int | None = None,
+) -> Iterator[tuple[int, T]]:
+    """Load each year into a play table and apply a function to it, one year per worker process.
+
+    Only the function's results cross process boundaries, so reducing a year to small aggregates (e.g. counts per
+    state) keeps the parent's memory use bound by the aggregates rather than by the plays of every year.
+
+    Args:
+        function: the function applied to each year's table, which must be picklable (e.g. defined at module level)
+        years: the years to load, yielded in the given order
+        data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+        compression: store play-by-play files compressed with the given codec
+        max_workers: the number of processes loading years (defaults to the number of processors)
+    """
+    years = list(years)
+    apply = partial(_apply_to_year, function, data_dir=Path(data_dir), compression=compression)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from zip(years, executor.map(apply, years))
+
+
+def _apply_to_year(
+    function: Callable[[PlayTable], T], year: int, data_dir: Path, compression: retrosheet.Compression | None
+) -> T:
+    """Load a year into a play table and apply a function to it, in a worker process.
+
+    Args:
+        function: the function to apply
+        year: the year
+        data_dir: dir where data will be stored
+        compression: store play-by-play files compressed with the given codec
+    """
+    return function(PlayTable.load([year], data_dir, compression=compression))
@@ -1,7 +1,6 @@
 """View model data through various filters."""
-from collections import defaultdict
-
 from pyretrosheet.models.game import Game
+from pyretrosheet.models.game_index import Team
 from pyretrosheet.models.play import Play
 from pyretrosheet.models.player import Player
 from pyretrosheet.models.team import TeamLocation
@@ -15,15 +14,10 @@ def get_plays(game: Game, include_home_team: bool = True, include_visiting_team:
         include_home_team: include plays for the home team
         include_visiting_team: include plays for the visiting team
     """
-    plays = []
-    for event in game.chronological_events:
-        if isinstance(event, Play):
-            play = event
-            if play.team_location == TeamLocation.HOME and include_home_team:
-                plays.append(play)
-            if play.team_location == TeamLocation.VISITING and include_visiting_team:
-                plays.append(play)
-    return plays
+    if not (include_home_team or include_visiting_team):
+        return []
+
+    return list(game.index.plays[_get_team(include_home_team, include_visiting_team)])
 
 
 def get_players(game: Game, include_home_team: bool = True, include_visiting_team: bool = True) -> list[Player]:
@@ -34,15 +28,10 @@ def get_players(game: Game, include_home_team: bool = True, include_visiting_tea
         include_home_team: include players from the home team
         include_visiting_team: include players from the visiting team
     """
-    players = []
-    for event in game.chronological_events:
-        if isinstance(event, Player):
-            player = event
-            if player.team_location == TeamLocation.HOME and include_home_team:
-                players.append(player)
-            if player.team_location == TeamLocation.VISITING and include_visiting_team:
-                players.append(player)
-    return players
+    if not (include_home_team or include_visiting_team):
+        return []
+
+    return list(game.index.players[_get_team(include_home_team, include_visiting_team)])
 
 
 def get_batter_plays(
@@ -55,10 +44,11 @@ def get_batter_plays(
         include_home_team: include plays from the home team
         include_visiting_team: include plays from the visiting team
     """
-    batter_plays = defaultdict(list)
-    for play in get_plays(game, include_home_team=include_home_team, include_visiting_team=include_visiting_team):
-        batter_plays[play.batter_id].append(play)
-    return dict(batter_plays)
+    if not (include_home_team or include_visiting_team):
+        return {}
+
+    batter_plays = game.index.batter_plays[_get_team(include_home_team, include_visiting_team)]
+    return {batter_id: list(plays) for batter_id, plays in batter_plays.items()}
 
 
 def get_inning_plays(
@@ -71,10 +61,11 @@ def get_inning_plays(
         include_home_team: include plays per inning from the home team
         include_visiting_team: include plays per inning from the visiting team
     """
-    inning_plays = defaultdict(list)
-    for play in get_plays(game, include_home_team=include_home_team, include_visiting_team=include_visiting_team):
-        inning_plays[play.inning].append(play)
-    return dict(inning_plays)
+    if not (include_home_team or include_visiting_team):
+        return {}
+
+    inning_plays = game.index.inning_plays[_get_team(include_home_team, include_visiting_team)]
+    return {inning: list(plays) for inning, plays in inning_plays.items()}
 
 
 def get_team_players(games: list[Game], team_id: str) -> list[Player]:
@@ -88,19 +79,27 @@ def get_team_players(games: list[Game], team_id: str) -> list[Player]:
     seen_player_ids = set()
     for game in games:
         if game.home_team_id == team_id:
-            include_home_team = True
-            include_visiting_team = False
+            team_location = TeamLocation.HOME
         elif game.visiting_team_id == team_id:
-            include_home_team = False
-            include_visiting_team = True
+            team_location = TeamLocation.VISITING
         else:
             raise ValueError(f"Could not find {team_id} in game={game.id.raw}")  # noqa: TRY003
 
-        for player in get_players(
-            game, include_home_team=include_home_team, include_visiting_team=include_visiting_team
-        ):
+        for player in game.index.players[team_location]:
             if player.id not in seen_player_ids:
                 players.append(player)
                 seen_player_ids.add(player.id)
 
     return players
+
+
+def _get_team(include_home_team: bool, include_visiting_team: bool) -> Team:
+    """Get the game index key of the included teams, at least one of which must be included.
+
+    Args:
+        include_home_team: include the home team
+        include_visiting_team: include the visiting team
+    """
+    if include_home_team and include_visiting_team:
+        return None
+    return TeamLocation.HOME if include_home_team else TeamLocation.VISITING
@@ -0,0 +1,231 @@
+"""Win expectancy of game states and the win probability added (WPA) of each play.
+
+Requires the `numpy` extra.
+
+The win expectancy of a game state (inning, half-inning, outs, occupied bases and score difference) is the share of
+plays in the state whose game the home team went on to win. Like run expectancy (see `pyretrosheet.run_expectancy`),
+it is computed from the `PlayTable` columns of any number of seasons with vectorized passes, aggregated per season in
+worker processes into win and play counts per state, and merged by summing. Games ending in a tie and no-play ('NP')
+events are left out.
+
+Extra innings share the state of the last regular inning (`MAX_INNING`) and score differences are clipped to
+`MAX_SCORE_DIFFERENCE` runs either way, keeping the late-game and lopsided states populated.
+
+The WPA of a play is the change in the batting team's win expectancy over the play, where the state after a play is
+the state before the game's next play, or the game's outcome (1 for a win, 0 for a loss) after its last play.
+"""
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pyretrosheet import load, retrosheet
+from pyretrosheet.dependencies import import_optional
+from pyretrosheet.models.play.description import BatterEvent
+from pyretrosheet.models.team import TeamLocation
+from pyretrosheet.run_expectancy import NUM_BASE_STATES, NUM_OUTS
+from pyretrosheet.table import PlayTable, batter_event_code, map_years
+
+# innings after `MAX_INNING` share its states
+MAX_INNING = 9
+# score differences (home runs less visiting runs) are clipped to +/- `MAX_SCORE_DIFFERENCE`
+MAX_SCORE_DIFFERENCE = 10
+# the shape of the win expectancy table, by inning, batting team location, outs, bases and score difference
+STATES_SHAPE = (MAX_INNING, len(TeamLocation), NUM_OUTS, NUM_BASE_STATES, 2 * MAX_SCORE_DIFFERENCE + 1)
+# the outcome of a tied game, between a loss (0) and a win (1)
+_TIE = 0.5
+
+
+@dataclass
+class WinExpectancy:
+    """Home team win expectancy per game state, from the outcome of the games of the plays in each state.
+
+    Counts are flattened, indexed by state code (see `get_states`).
+
+    Args:
+        home_wins: the number of plays in each state whose game the home team won
+        plays: the number of plays in each state
+    """
+
+    home_wins: Any
+    plays: Any
+
+    def __add__(self, other: "WinExpectancy") -> "WinExpectancy":
+        """Merge the aggregates of two sets of plays, e.g. of two seasons."""
+        return WinExpectancy(home_wins=self.home_wins + other.home_wins, plays=self.plays + other.plays)
+
+    @classmethod
+    def empty(cls) -> "WinExpectancy":
+        """Aggregates of no plays."""
+        np = import_optional("numpy", extra="numpy")
+        num_states = int(np.prod(STATES_SHAPE))
+        return cls(home_wins=np.zeros(num_states, dtype=np.int64), plays=np.zeros(num_states, dtype=np.int64))
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "WinExpectancy":
+        """Aggregate play columns, ordered by game and then chronologically as in a `PlayTable` or `PlayStore`.
+
+        Args:
+            columns: `PlayTable` columns as NumPy arrays
+        """
+        np = import_optional("numpy", extra="numpy")
+        outcomes = _get_home_outcomes(np, columns)
+        is_counted = (
+            (outcomes != _TIE)
+            & (columns["outs_before"] < NUM_OUTS)
+            & (columns["batter_event"] != batter_event_code(BatterEvent.NO_PLAY))
+        )
+        states = get_states({name: column[is_counted] for name, column in columns.items()})
+        num_states = int(np.prod(STATES_SHAPE))
+        return cls(
+            home_wins=np.bincount(states, weights=outcomes[is_counted], minlength=num_states).astype(np.int64),
+            plays=np.bincount(states, minlength=num_states).astype(np.int64),
+        )
+
+    @classmethod
+    def from_table(cls, table: PlayTable) -> "WinExpectancy":
+        """Aggregate the plays of a table.
+
+        Args:
+            table: the table
+        """
+        return cls.from_columns(table.to_numpy())
+
+    @classmethod
+    def load(
+        cls,
+        years: Iterable[int],
+        data_dir: Path | str = load.DEFAULT_DATA_DIR,
+        compression: retrosheet.Compression | None = None,
+        max_workers: int | None = None,
+    ) -> "WinExpectancy":
+        """Load years of Retrosheet data and aggregate their plays, one season per worker process.
+
+        Seasons are merged as their aggregates arrive (see `map_years`), so memory use does not grow with the number
+        of seasons.
+
+        Args:
+            years: the years to aggregate
+            data_dir: dir where data will be stored (defaults to '~/.pyretrosheet/data')
+            compression: store play-by-play files compressed with the given codec
+            max_workers: the number of processes loading seasons (defaults to the number of processors)
+        """
+        win_expectancy = cls.empty()
+        for _, year_win_expectancy in map_years(cls.from_table, years, data_dir, compression, max_workers):
+            win_expectancy += year_win_expectancy
+        return win_expectancy
+
+    @property
+    def expectancy(self) -> Any:
+        """The home team's win expectancy in each state, NaN for states without plays."""
+        np = import_optional("numpy", extra="numpy")
+        expectancy = np.full(len(self.plays), np.nan)
+        np.divide(self.home_wins, self.plays, out=expectancy, where=self.plays != 0)
+        return expectancy
+
+    def get(  # noqa: PLR0913
+        self, inning: int, team_location: TeamLocation, outs: int, bases: int, score_difference: int
+    ) -> float:
+        """Get the home team's win expectancy in a state.
+
+        Args:
+            inning: the inning
+            team_location: the batting team's location
+            outs: the number of outs (0 to 2)
+            bases: the occupied bases, as a combination of the `game_state` base bits
+            score_difference: the home team's runs less the visiting team's runs
+        """
+        np = import_optional("numpy", extra="numpy")
+        return float(self.expectancy[_get_states(np, inning, team_location.value, outs, bases, score_difference)])
+
+    def win_expectancy(self, columns: Mapping[str, Any]) -> Any:
+        """Get the home team's win expectancy before each play of play columns, as a column aligned with them.
+
+        Args:
+            columns: `PlayTable` columns as NumPy arrays
+        """
+        return self.expectancy[get_states(columns)]
+
+    def wpa(self, columns: Mapping[str, Any]) -> Any:
+        """Get the batting team's win probability added by each play of play columns, as a column aligned with them.
+
+        Plays from or to a state without plays in the aggregates have a NaN WPA.
+
+        Args:
+            columns: `PlayTable` columns as NumPy arrays
+        """
+        np = import_optional("numpy", extra="numpy")
+        before = self.win_expectancy(columns)
+        # the state after a play is the state before the next play of its game, or the game's outcome
+        game_index = columns["game_index"]
+        is_last_play = np.ones(len(game_index), dtype=bool)
+        is_last_play[:-1] = game_index[1:] != game_index[:-1]
+        after = np.where(is_last_play, _get_home_outcomes(np, columns), np.append(before[1:], np.nan))
+        home_wpa = after - before
+        return np.where(columns["team_location"] == TeamLocation.HOME.value, home_wpa, -home_wpa)
+
+
+def get_states(columns: Mapping[str, Any]) -> Any:
+    """Get the win expectancy state codes of the plays of play columns, before each play.
+
+    Args:
+        columns: `PlayTable` columns as NumPy arrays (at least `inning`, `team_location`, `outs_before`,
+            `bases_before`, `visiting_score` and `home_score`)
+    """
+    np = import_optional("numpy", extra="numpy")
+    return _get_states(
+        np,
+        columns["inning"].astype(np.intp),
+        columns["team_location"].astype(np.intp),
+        columns["outs_before"].astype(np.intp),
+        columns["bases_before"].astype(np.intp),
+        columns["home_score"].astype(np.intp) - columns["visiting_score"].astype(np.intp),
+    )
+
+
+def _get_states(  # noqa: PLR0913
+    np: Any, inning: Any, team_location: Any, outs: Any, bases: Any, score_difference: Any
+) -> Any:
+    """Get win expectancy state codes, from scalars or arrays.
+
+    Args:
+        np: the numpy module
+        inning: the inning
+        team_location: the value of the batting team's location
+        outs: the number of outs
+        bases: the occupied bases
+        score_difference: the home team's runs less the visiting team's runs
+    """
+    return np.ravel_multi_index(
+        (
+            np.minimum(inning, MAX_INNING) - 1,
+            team_location,
+            np.minimum(outs, NUM_OUTS - 1),
+            bases,
+            np.clip(score_difference, -MAX_SCORE_DIFFERENCE, MAX_SCORE_DIFFERENCE) + MAX_SCORE_DIFFERENCE,
+        ),
+        STATES_SHAPE,
+    )
+
+
+def _get_home_outcomes(np: Any, columns: Mapping[str, Any]) -> Any:
+    """Get the outcome of the game of each play for the home team: 1 for a win, 0 for a loss and 0.5 for a tie.
+
+    Args:
+        np: the numpy module
+        columns: `PlayTable` columns as NumPy arrays
+    """
+    game_index = columns["game_index"]
+    if not len(game_index):
+        return np.array([], dtype=float)
+
+    starts = np.ones(len(game_index), dtype=bool)
+    starts[1:] = game_index[1:] != game_index[:-1]
+    game = np.cumsum(starts) - 1
+    # final scores follow the runs scored on each game's last play
+    last_plays = np.append(np.flatnonzero(starts)[1:] - 1, len(starts) - 1)
+    runs = columns["runs"][last_plays].astype(np.intp)
+    is_home_batting = columns["team_location"][last_plays] == TeamLocation.HOME.value
+    home_score = columns["home_score"][last_plays].astype(np.intp) + np.where(is_home_batting, runs, 0)
+    visiting_score = columns["visiting_score"][last_plays].astype(np.intp) + np.where(is_home_batting, 0, runs)
+    return (np.sign(home_score - visiting_score) + 1)[game] / 2
@@ -1,3 +1,4 @@
+import shutil
 from copy import deepcopy
 
 import pytest
@@ -39,3 +40,14 @@ def play_single(player_1):
 def real_game():
     game_lines = testing_data.WAS_2022_SINGLE_GAME_EXAMPLE.read_text().splitlines()
     return game.Game.from_game_lines(game_lines)
+
+
+@pytest.fixture
+def extra_inning_game():
+    return game.Game.from_game_lines(testing_data.EXTRA_INNING_GAME_LINES)
+
+
+@pytest.fixture
+def tmp_data_dir(tmp_path):
+    # loads write per-year lock files into their data dir, so they load from a copy of the tests data dir
+    return shutil.copytree(testing_data.TEST_DATA_DIR, tmp_path / "data")
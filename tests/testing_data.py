@@ -3,3 +3,21 @@ from pathlib import Path
 TEST_DATA_DIR = Path(__file__).parent / "data"
 WAS_2022_SINGLE_GAME_EXAMPLE = TEST_DATA_DIR / "2022WAS_1.EVN"
 WAS_2022_TWO_GAME_EXAMPLE = TEST_DATA_DIR / "2022WAS_2.EVN"
+# since 2020, extra innings start with a runner on second base, recorded by a `radj` line
+EXTRA_INNING_GAME_LINES = [
+    "id,WAS202204070",
+    "info,visteam,NYN",
+    "info,hometeam,WAS",
+    'start,visia001,"Visitor A",0,1,8',
+    'start,visib001,"Visitor B",0,2,6',
+    'start,homea001,"Home A",1,1,8',
+    'start,homeb001,"Home B",1,2,6',
+    "play,9,1,homeb001,??,,8",
+    "radj,visib001,2",
+    "play,10,0,visia001,??,,S8.2-3",
+    "play,10,0,visib001,??,,K",
+    "radj,homea001,2",
+    'sub,pinch001,"Pinch Runner",1,1,12',
+    "play,10,1,homeb001,??,,S9.2-H",
+    "data,er,homea001,0",
+]
@@ -0,0 +1,127 @@
+import csv
+import io
+
+import pytest
+
+from pyretrosheet import load
+from pyretrosheet.export import chadwick
+from pyretrosheet.models.game import Game
+from pyretrosheet.models.play import Play
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.export.chadwick"
+
+
+def _game(*event_lines):
+    return Game.from_game_lines(
+        ["id,WAS202204070", "info,visteam,NYN", "info,hometeam,WAS", *event_lines, "data,er,grays001,0"]
+    )
+
+
+def _rows(game):
+    return [dict(zip(chadwick.FIELDS, row, strict=True)) for row in chadwick.iter_event_rows(game)]
+
+
+def test_iter_event_rows__tracks_base_out_state():
+    game = _game(
+        'start,lindf001,"Francisco Lindor",0,1,6',
+        "play,1,0,lindf001,10,BX,S8",
+        "play,1,0,alonp001,00,X,D7.1-3",
+        "play,1,0,mcnej002,00,X,8/SF.3-H",
+        'sub,pinch001,"Pinch Runner",0,1,12',
+        "play,1,0,canrr001,00,X,K",
+        "play,1,0,escae001,00,X,HR.2-H",
+    )
+
+    rows = _rows(game)
+
+    assert [row["OUTS_CT"] for row in rows] == [0, 0, 0, 1, 2]
+    assert [(row["BASE1_RUN_ID"], row["BASE2_RUN_ID"], row["BASE3_RUN_ID"]) for row in rows] == [
+        ("", "", ""),
+        ("lindf001", "", ""),
+        ("", "alonp001", "lindf001"),
+        ("", "alonp001", ""),
+        ("", "alonp001", ""),
+    ]
+    assert [row["EVENT_CD"] for row in rows] == [20, 21, 2, 3, 23]
+    assert [row["AWAY_SCORE_CT"] for row in rows] == [0, 0, 0, 1, 1]
+    assert rows[-1]["RBI_CT"] == 2
+    assert rows[-1]["BAT_DEST_ID"] == chadwick.DEST_SCORED
+    assert rows[2]["SF_FL"] == "T"
+    assert rows[3]["PO1_FLD_CD"] == 2
+
+
+def test_iter_event_rows__swaps_in_pinch_runners():
+    game = _game(
+        'start,lindf001,"Francisco Lindor",0,1,6',
+        "play,1,0,lindf001,10,BX,S8",
+        'sub,pinch001,"Pinch Runner",0,1,12',
+        "play,1,0,alonp001,00,X,K",
+    )
+
+    assert _rows(game)[1]["BASE1_RUN_ID"] == "pinch001"
+
+
+def test_iter_event_rows__sacrifice_hit_is_not_an_at_bat():
+    game = _game(
+        "play,1,0,lindf001,10,BX,S8",
+        "play,1,0,alonp001,00,X,13/SH/BG23.1-2",
+    )
+
+    row = _rows(game)[1]
+
+    assert (row["BAT_EVENT_FL"], row["AB_FL"], row["SH_FL"]) == ("T", "F", "T")
+    assert (row["EVENT_CD"], row["EVENT_OUTS_CT"], row["BAT_DEST_ID"], row["RUN1_DEST_ID"]) == (2, 1, 0, 2)
+
+
+def test_iter_event_rows__error_on_foul_fly_is_not_a_batter_event():
+    game = _game(
+        "play,1,0,lindf001,01,F,FLE5",
+        "play,1,0,lindf001,12,FX,63",
+    )
+
+    rows = _rows(game)
+
+    assert (rows[0]["BAT_EVENT_FL"], rows[0]["AB_FL"], rows[0]["EVENT_CD"], rows[0]["ERR1_FLD_CD"]) == ("F", "F", 13, 5)
+    assert (rows[1]["BAT_EVENT_FL"], rows[1]["AB_FL"]) == ("T", "T")
+
+
+def test_iter_event_rows__matches_game_states(real_game):
+    rows = _rows(real_game)
+    states = [state for state, play in zip(real_game.states, real_game.index.plays[None]) if play.event.raw != "NP"]
+
+    assert [row["OUTS_CT"] for row in rows] == [state.before.outs for state in states]
+    assert [(row["BASE1_RUN_ID"], row["BASE2_RUN_ID"], row["BASE3_RUN_ID"]) for row in rows] == [
+        tuple(runner or "" for runner in state.before.runners) for state in states
+    ]
+
+
+def test_iter_event_rows__real_game(real_game):
+    rows = _rows(real_game)
+    plays = [event for event in real_game.chronological_events if isinstance(event, Play)]
+
+    assert len(rows) == len([play for play in plays if play.event.raw != "NP"])
+    assert sum(row["EVENT_OUTS_CT"] for row in rows) == sum(play.num_outs_on_play() for play in plays)
+    assert all(row["OUTS_CT"] < 3 for row in rows)
+    assert (rows[-1]["AWAY_SCORE_CT"], rows[-1]["HOME_SCORE_CT"]) == (5, 1)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10_000])
+def test_write_events(chunk_size):
+    games = load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+    file = io.StringIO()
+
+    num_rows = chadwick.write_events(games, file, chunk_size=chunk_size)
+
+    lines = list(csv.reader(io.StringIO(file.getvalue())))
+    assert lines[0] == chadwick.FIELDS
+    assert len(lines) == num_rows + 1
+    assert num_rows == sum(len(list(chadwick.iter_event_rows(game))) for game in games)
+
+
+def test_export_years(tmp_path, tmp_data_dir):
+    path = tmp_path / "events.csv"
+
+    num_rows = chadwick.export_years([2022], path, data_dir=tmp_data_dir, header=False)
+
+    assert len(path.read_text().splitlines()) == num_rows
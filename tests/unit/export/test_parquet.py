@@ -0,0 +1,140 @@
+import copy
+import datetime as dt
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pyretrosheet import load, refresh
+from tests import testing_data
+
+pytest.importorskip("pyarrow")
+import pyarrow.dataset as pa_dataset  # noqa: E402
+
+from pyretrosheet.export import parquet, rows  # noqa: E402
+
+MODULE_PATH = "pyretrosheet.export.parquet"
+
+
+@pytest.fixture
+def dataset_dir(tmp_path, tmp_data_dir):
+    games = load.load_games(2022, tmp_data_dir)
+    parquet.write_dataset(games, tmp_path / "dataset")
+    return tmp_path / "dataset"
+
+
+def test_write_dataset__partitions_by_year_and_home_team(dataset_dir):
+    assert sorted(path.name for path in (dataset_dir / "plays").iterdir()) == ["year=2022"]
+    assert sorted(path.name for path in (dataset_dir / "plays" / "year=2022").iterdir()) == ["home_team_id=WAS"]
+    assert set(path.name for path in dataset_dir.iterdir()) == set(parquet.TABLE_ROWS)
+
+
+def test_write_dataset__replaces_written_partitions(dataset_dir, tmp_data_dir):
+    game = load.load_games(2022, tmp_data_dir)[0]
+
+    parquet.write_dataset([game], dataset_dir)
+
+    assert parquet.read_table(dataset_dir, "games").num_rows == 1
+
+
+def test_read_table(dataset_dir, tmp_data_dir):
+    games = parquet.read_table(dataset_dir, "games")
+    plays = parquet.read_table(dataset_dir, "plays")
+
+    assert games.num_rows == 3
+    assert plays.num_rows == sum(
+        1 for game in load.load_games(2022, tmp_data_dir) for _ in parquet.rows.iter_play_rows(game)
+    )
+
+
+@pytest.mark.parametrize(
+    ["filters", "expected_num_games"],
+    [
+        ({"years": [2022]}, 3),
+        ({"years": [2021]}, 0),
+        ({"team_ids": ["NYN"]}, 3),
+        ({"team_ids": ["SFN"]}, 0),
+        ({"home_team_ids": ["WAS"]}, 3),
+        ({"home_team_ids": ["NYN"]}, 0),
+        ({"start_date": dt.date(2022, 4, 8)}, 1),
+        ({"end_date": dt.date(2022, 4, 7)}, 2),
+    ],
+)
+def test_read_table__filters(dataset_dir, filters, expected_num_games):
+    assert parquet.read_table(dataset_dir, "games", **filters).num_rows == expected_num_games
+
+
+def test_read_table__filters_batters(dataset_dir):
+    plays = parquet.read_table(dataset_dir, "plays", batter_ids=["sotoj001"], columns=["batter_id"])
+
+    assert plays.num_rows > 0
+    assert set(plays.column("batter_id").to_pylist()) == {"sotoj001"}
+
+
+@pytest.mark.parametrize(
+    ["filters", "expected_home_team_ids"],
+    [
+        ({"home_team_ids": ["WAS"]}, ["WAS"]),
+        # visiting teams are not partitioned, so team filters scan every partition
+        ({"team_ids": ["WAS"]}, ["NYN", "WAS"]),
+    ],
+)
+def test_read_table__home_team_filter_prunes_partitions(tmp_data_dir, tmp_path, filters, expected_home_team_ids):
+    games = load.load_games(2022, tmp_data_dir)
+    swapped_game = copy.deepcopy(games[0])
+    swapped_game.info["hometeam"], swapped_game.info["visteam"] = "NYN", "WAS"
+    parquet.write_dataset([*games, swapped_game], tmp_path / "dataset")
+    dataset = pa_dataset.dataset(tmp_path / "dataset" / "games", format="parquet", partitioning="hive")
+    filter_args = {"years": None, "team_ids": None, "home_team_ids": None, "start_date": None, "end_date": None}
+    (expression,) = parquet._iter_filters(pa_dataset.field, **{**filter_args, **filters}, batter_ids=None)
+
+    scanned_partitions = {Path(fragment.path).parent.name for fragment in dataset.get_fragments(filter=expression)}
+
+    assert scanned_partitions == {f"home_team_id={team_id}" for team_id in expected_home_team_ids}
+
+
+def test_read_table__raises_on_unknown_table(dataset_dir):
+    with pytest.raises(ValueError, match="Unknown table"):
+        parquet.read_table(dataset_dir, "unknown")
+
+
+def test_replace_games(tmp_path):
+    games = load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+    dataset_dir = tmp_path / "dataset"
+    parquet.write_dataset(games, dataset_dir)
+    games[1].info["attendance"] = "1"
+
+    parquet.replace_games(games[1:], dataset_dir)
+
+    info = parquet.read_table(dataset_dir, "games", columns=["game_id"])
+    plays = parquet.read_table(dataset_dir, "plays")
+    assert sorted(info.column("game_id").to_pylist()) == ["WAS202204070", "WAS202204080"]
+    assert plays.num_rows == sum(len(list(rows.iter_play_rows(game))) for game in games)
+
+
+def test_replace_games__only_reads_affected_partitions(tmp_path):
+    games = load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+    dataset_dir = tmp_path / "dataset"
+    parquet.write_dataset(games, dataset_dir)
+    for table_name in parquet.TABLE_ROWS:
+        corrupt_partition = dataset_dir / table_name / "year=2021" / "home_team_id=NYN"
+        corrupt_partition.mkdir(parents=True)
+        (corrupt_partition / "part-0.parquet").write_bytes(b"not parquet")
+
+    parquet.replace_games(games[1:], dataset_dir, removed_game_ids=[games[0].id.raw.removeprefix("id,")])
+
+    assert (dataset_dir / "games" / "year=2021" / "home_team_id=NYN" / "part-0.parquet").read_bytes() == b"not parquet"
+    for table_name in parquet.TABLE_ROWS:
+        shutil.rmtree(dataset_dir / table_name / "year=2021")
+    assert parquet.read_table(dataset_dir, "games", years=[2022]).column("game_id").to_pylist() == ["WAS202204080"]
+
+
+def test_refresh_target__removes_empty_partitions(tmp_path):
+    games = load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+    dataset_dir = tmp_path / "dataset"
+    target = parquet.refresh_target(dataset_dir)
+
+    target(refresh.RefreshResult(2022, updated_games=games))
+    target(refresh.RefreshResult(2022, removed_game_ids=["WAS202204070", "WAS202204080"]))
+
+    assert list((dataset_dir / "games" / "year=2022").iterdir()) == []
@@ -0,0 +1,91 @@
+import shutil
+import sqlite3
+
+import pytest
+
+from pyretrosheet import load, refresh
+from pyretrosheet.export import sqlite
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.export.sqlite"
+
+
+@pytest.fixture
+def games():
+    return load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+
+
+@pytest.fixture
+def connection(tmp_path):
+    connection = sqlite3.connect(tmp_path / "retrosheet.db")
+    sqlite.create_schema(connection)
+    yield connection
+    connection.close()
+
+
+def _count(connection, table_name):
+    return connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+
+def test_upsert_year(connection, games):
+    sqlite.upsert_year(connection, 2022, games, batch_size=10)
+
+    assert _count(connection, "games") == 2
+    assert _count(connection, "plays") == sum(1 for game in games for _ in sqlite.rows.iter_play_rows(game))
+    assert _count(connection, "lineups") == sum(1 for game in games for _ in sqlite.rows.iter_player_rows(game))
+    assert _count(connection, "info") == sum(len(game.info) for game in games)
+    assert _count(connection, "earned_runs") == sum(len(game.earned_runs) for game in games)
+    assert connection.execute("SELECT date FROM games ORDER BY date LIMIT 1").fetchone() == ("2022-04-07",)
+
+
+def test_upsert_year__replaces_year(connection, games):
+    sqlite.upsert_year(connection, 2022, games)
+    sqlite.upsert_year(connection, 2022, games[:1])
+
+    assert _count(connection, "games") == 1
+    assert _count(connection, "plays") == sum(1 for _ in sqlite.rows.iter_play_rows(games[0]))
+
+
+def test_upsert_year__rolls_back_on_error(connection, games, mocker):
+    sqlite.upsert_year(connection, 2022, games)
+    mocker.patch(f"{MODULE_PATH}.insert_games", side_effect=ValueError("oops"))
+
+    with pytest.raises(ValueError, match="oops"):
+        sqlite.upsert_year(connection, 2022, games[:1])
+
+    assert _count(connection, "games") == 2
+
+
+def test_export_years(tmp_path):
+    database_path = tmp_path / "retrosheet.db"
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+
+    sqlite.export_years([2022], database_path, data_dir=tmp_path)
+
+    connection = sqlite3.connect(database_path)
+    index_names = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert set(sqlite.INDEXES) <= index_names
+    assert _count(connection, "games") == 2
+    connection.close()
+
+
+def test_replace_games(connection, games):
+    sqlite.upsert_year(connection, 2022, games)
+    num_plays = _count(connection, "plays")
+
+    sqlite.replace_games(connection, games[:1], removed_game_ids=["WAS202204080"])
+
+    assert [row[0] for row in connection.execute("SELECT game_id FROM games")] == ["WAS202204070"]
+    assert _count(connection, "plays") < num_plays
+
+
+def test_refresh_target(tmp_path, games):
+    database_path = tmp_path / "retrosheet.db"
+    target = sqlite.refresh_target(database_path)
+
+    target(refresh.RefreshResult(2022, updated_games=games))
+    target(refresh.RefreshResult(2022, updated_games=games[1:], removed_game_ids=["WAS202204070"]))
+
+    connection = sqlite3.connect(database_path)
+    assert [row[0] for row in connection.execute("SELECT game_id FROM games")] == ["WAS202204080"]
+    connection.close()
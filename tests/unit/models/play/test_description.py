@@ -39,8 +39,8 @@ from pyretrosheet.models.play.description import BatterEvent, RunnerEvent
         ("NP", BatterEvent.NO_PLAY),
     ],
 )
-def test__get_batter_event(raw_description, expected_batter_event):
-    assert description._get_batter_event(raw_description) == expected_batter_event
+def test_get_batter_event(raw_description, expected_batter_event):
+    assert description.get_batter_event(raw_description) == expected_batter_event
 
 
 @pytest.mark.parametrize(
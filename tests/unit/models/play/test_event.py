@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from pyretrosheet.models.play import event
@@ -18,3 +20,15 @@ def test_can_parse_event(raw_event):
     _ = event.Event.from_play_event(raw_event).modifiers
 
     # passes if no exception raised
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle__restores_flags_without_classifying(mocker, protocol):
+    event_ = event.Event.from_play_event("S8/L89D.2-H")
+    get_play_flags = mocker.spy(event, "get_play_flags")
+
+    unpickled = pickle.loads(pickle.dumps(event_, protocol))
+
+    assert unpickled == event_
+    assert unpickled.flags == event_.flags
+    get_play_flags.assert_not_called()
@@ -0,0 +1,32 @@
+import pytest
+
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.play.flags import PlayFlag
+
+MODULE_PATH = "pyretrosheet.models.play.flags"
+
+
+@pytest.mark.parametrize(
+    ["raw_event", "expected_flags"],
+    [
+        ("S8/L89D+", PlayFlag.AT_BAT | PlayFlag.SINGLE),
+        ("HR/F78XD.2-H;1-H", PlayFlag.AT_BAT | PlayFlag.HOME_RUN),
+        ("W", PlayFlag.WALK),
+        ("IW", PlayFlag.WALK | PlayFlag.INTENTIONAL_WALK),
+        ("HP", PlayFlag.HIT_BY_PITCH),
+        ("9/SF.3-H", PlayFlag.SACRIFICE_FLY),
+        ("K", PlayFlag.AT_BAT | PlayFlag.STRIKEOUT),
+        ("K+SB2", PlayFlag.STRIKEOUT),
+        ("SB2", PlayFlag.NONE),
+        ("NP", PlayFlag.NONE),
+    ],
+)
+def test_get_play_flags(raw_event, expected_flags):
+    play_ = Play.from_play_line(f"play,1,0,batter001,00,X,{raw_event}", [])
+
+    assert play_.flags == expected_flags
+    assert play_.event.flags == expected_flags
+
+
+def test_play_flag__fits_in_16_bits():
+    assert max(PlayFlag) < 1 << 16
@@ -49,3 +49,69 @@ def test_is_an_at_bat__true_for_single():
     play_ = play.Play.from_play_line(raw_play_line, [])
 
     assert play_.is_an_at_bat() is True
+
+
+@pytest.mark.parametrize(
+    ["raw_event", "expected_advances"],
+    [
+        ("S8/L89D+", ["B-1"]),
+        ("D7/G5.3-H;2-H;1-H", ["B-2", "1-H", "2-H", "3-H"]),
+        ("HR/F78XD.2-H;1-H", ["B-H", "1-H", "2-H"]),
+        ("63/G6M", ["BX1"]),
+        ("54(1)/FO/G5.3-H", ["B-1", "1X2", "3-H"]),
+        ("64(1)3/GDP/G6", ["BX1", "1X2"]),
+        ("8(B)84(2)/LDP/L8", ["BX1", "2X3"]),
+        ("K", ["BX1"]),
+        ("K23", ["BX1"]),
+        ("K+WP.B-1", ["B-1"]),
+        ("K+SB2", ["BX1", "1-2"]),
+        ("W.1-2", ["B-1", "1-2"]),
+        ("FC5/G5.3XH(52)", ["B-1", "3XH(52)"]),
+        ("FC.1-2", ["B-1", "1-2"]),
+        ("S7!.1-3", ["B-1", "1-3"]),
+        ("W+WP.2-3", ["B-1", "2-3"]),
+        ("SB3;SB2", ["1-2", "2-3"]),
+        ("CS2(24).2-3", ["1X2", "2-3"]),
+        ("CS2(2E4).1-3", ["1-3"]),
+        ("PO1(13)", ["1X1"]),
+        ("WP.2-3;1-2", ["1-2", "2-3"]),
+        ("NP", []),
+    ],
+)
+def test_get_advances(raw_event, expected_advances):
+    play_ = play.Play.from_play_line(f"play,1,0,batter001,??,,{raw_event}", [])
+
+    assert [advance.raw for advance in play_.get_advances()] == expected_advances
+
+
+@pytest.mark.parametrize("raw_event", ["S7!.1-3", "FC.1-2"])
+def test_get_advances__does_not_change_description(raw_event):
+    play_ = play.Play.from_play_line(f"play,1,0,batter001,??,,{raw_event}", [])
+
+    play_.get_advances()
+
+    assert play_.event.description.raw == raw_event.split(".")[0]
+    assert play_.event.description.batter_event is None
+
+
+@pytest.mark.parametrize(
+    ["raw_event", "expected_outs", "expected_runs", "expected_rbis"],
+    [
+        ("HR/F78XD.2-H;1-H", 0, 3, 3),
+        ("64(1)3/GDP/G6.3-H", 2, 1, 0),
+        ("8/SF.3-H", 1, 1, 1),
+        ("E6/G6.3-H;2-3", 0, 1, 0),
+        ("E6/G6.3-H(RBI);2-3", 0, 1, 1),
+        ("WP.3-H", 0, 1, 0),
+        ("W.3-H;2-3;1-2", 0, 1, 1),
+        ("S9.2-H(NR);1-3", 0, 1, 0),
+        ("K+CS2(26)", 2, 0, 0),
+        ("1(B)16(2)63(1)/LTP/L1", 3, 0, 0),
+    ],
+)
+def test_outs_runs_and_rbis(raw_event, expected_outs, expected_runs, expected_rbis):
+    play_ = play.Play.from_play_line(f"play,1,0,batter001,??,,{raw_event}", [])
+
+    assert play_.num_outs_on_play() == expected_outs
+    assert play_.num_runs() == expected_runs
+    assert play_.num_rbis() == expected_rbis
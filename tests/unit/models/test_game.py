@@ -1,4 +1,15 @@
+import copyreg
+import dataclasses
+import io
+import pickle
+
+import pytest
+
 from pyretrosheet.models import game
+from pyretrosheet.models.base import Base
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.projection import Projection
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
 from tests import testing_data
 
 MODULE_PATH = "pyretrosheet.models.game"
@@ -28,6 +39,18 @@ class TestGame:
             "votha001": 2,
         }
 
+    def test_from_game_lines__runner_adjustments(self, extra_inning_game):
+        adjustments = [event for event in extra_inning_game.chronological_events if isinstance(event, RunnerAdjustment)]
+
+        assert adjustments == [
+            RunnerAdjustment(runner_id="visib001", base=Base.SECOND_BASE, raw="radj,visib001,2"),
+            RunnerAdjustment(runner_id="homea001", base=Base.SECOND_BASE, raw="radj,homea001,2"),
+        ]
+        assert extra_inning_game.chronological_events.index(adjustments[0]) == 5
+        assert len(extra_inning_game.index.plays[None]) == 4
+        assert len(extra_inning_game.lineups) == 4
+        assert pickle.loads(pickle.dumps(extra_inning_game)) == extra_inning_game
+
     def test_from_game_lines__basic_info_only(self):
         game_lines = testing_data.WAS_2022_SINGLE_GAME_EXAMPLE.read_text().splitlines()
 
@@ -39,9 +62,83 @@ class TestGame:
         assert len(game_.chronological_events) == 0
         assert game_.earned_runs == {}
 
+    def test_from_game_lines__projection(self):
+        game_lines = testing_data.WAS_2022_SINGLE_GAME_EXAMPLE.read_text().splitlines()
+        full_game = game.Game.from_game_lines(game_lines)
+
+        game_ = game.Game.from_game_lines(
+            game_lines, projection=Projection.from_fields({"description.batter_event", "advance.to_base"})
+        )
+
+        full_plays = [event for event in full_game.chronological_events if isinstance(event, Play)]
+        assert game_.id == full_game.id
+        assert len(game_.chronological_events) == len(full_plays)
+        play = game_.chronological_events[0]
+        assert play.event.description.batter_event == full_plays[0].event.description.batter_event
+        assert play.event.advances == full_plays[0].event.advances
+        for missing_attribute in ("comments", "inning"):
+            with pytest.raises(AttributeError):
+                getattr(play, missing_attribute)
+        with pytest.raises(AttributeError):
+            play.event.description.fielder_assists
+        with pytest.raises(AttributeError):
+            game_.earned_runs
+
+    def test_from_game_lines__full_projection(self):
+        game_lines = testing_data.WAS_2022_SINGLE_GAME_EXAMPLE.read_text().splitlines()
+
+        game_ = game.Game.from_game_lines(game_lines, projection=Projection.from_fields({"game.*"}))
+
+        assert game_ == game.Game.from_game_lines(game_lines)
+
     def test_pretty_id(self):
         game_lines = testing_data.WAS_2022_SINGLE_GAME_EXAMPLE.read_text().splitlines()
 
         game_ = game.Game.from_game_lines(game_lines, basic_info_only=True)
 
         assert game_.pretty_id == "2022/04/07 NYN @ WAS"
+
+    @pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, real_game, protocol):
+        unpickled = pickle.loads(pickle.dumps(real_game, protocol))
+
+        assert unpickled == real_game
+        assert unpickled.chronological_events[0] is not real_game.chronological_events[0]
+
+    def test_pickle__leaves_out_index(self, real_game):
+        real_game.index
+
+        unpickled = pickle.loads(pickle.dumps(real_game))
+
+        assert "index" not in vars(unpickled)
+        assert unpickled.index.plays[None] == real_game.index.plays[None]
+
+    def test_pickle__projected(self):
+        game_lines = testing_data.WAS_2022_SINGLE_GAME_EXAMPLE.read_text().splitlines()
+        game_ = game.Game.from_game_lines(game_lines, projection=Projection.from_fields({"play.batter_id"}))
+
+        unpickled = pickle.loads(pickle.dumps(game_))
+
+        assert unpickled.id == game_.id
+        assert [play.batter_id for play in unpickled.chronological_events] == [
+            play.batter_id for play in game_.chronological_events
+        ]
+        with pytest.raises(AttributeError):
+            unpickled.chronological_events[0].event
+
+    def test_pickle__smaller_than_attribute_dicts(self, real_game):
+        assert len(pickle.dumps(real_game)) < len(_pickle_as_attribute_dicts(real_game)) * 0.8
+
+
+def _pickle_as_attribute_dicts(obj):
+    """Pickle as dataclasses are pickled by default, bypassing their `__reduce__`."""
+
+    class Pickler(pickle.Pickler):
+        def reducer_override(self, obj):
+            if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+                return copyreg.__newobj__, (type(obj),), obj.__dict__
+            return NotImplemented
+
+    file = io.BytesIO()
+    Pickler(file).dump(obj)
+    return file.getvalue()
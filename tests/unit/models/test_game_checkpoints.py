@@ -0,0 +1,103 @@
+import pytest
+
+from pyretrosheet.models import game_checkpoints
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.team import TeamLocation
+
+MODULE_PATH = "pyretrosheet.models.game_checkpoints"
+
+
+@pytest.mark.parametrize("game", ["real_game", "extra_inning_game"])
+def test_game_checkpoints_match_states_and_lineups(request, game):
+    real_game = request.getfixturevalue(game)
+    checkpoints = game_checkpoints.GameCheckpoints.from_chronological_events(real_game.chronological_events, 8)
+
+    play_positions = [
+        position for position, event in enumerate(real_game.chronological_events) if isinstance(event, Play)
+    ]
+    assert len(play_positions) == len(real_game.states)
+    for row, position in enumerate(play_positions):
+        snapshot = checkpoints.get_state(position)
+        state = real_game.states[row]
+        assert snapshot.position == position
+        assert (snapshot.inning, snapshot.team_location) == (state.inning, state.team_location)
+        assert (snapshot.outs, snapshot.runners) == (state.before.outs, state.before.runners)
+        assert (snapshot.visiting_score, snapshot.home_score) == (state.before.visiting_score, state.before.home_score)
+        assert snapshot.visiting_lineup == real_game.lineups.get_lineup(row, TeamLocation.VISITING)
+        assert snapshot.home_lineup == real_game.lineups.get_lineup(row, TeamLocation.HOME)
+
+
+def test_game_checkpoints_get_state_at_start_and_end(real_game):
+    checkpoints = real_game.checkpoints
+    num_events = len(real_game.chronological_events)
+
+    start = checkpoints.get_state(0)
+    assert (start.inning, start.team_location, start.outs) == (0, None, 0)
+    assert start.visiting_lineup.batting_order == [None] * 9
+    end = checkpoints.get_state(num_events)
+    last_state = real_game.states[-1]
+    assert end.position == num_events
+    assert (end.visiting_score, end.home_score) == (last_state.after.visiting_score, last_state.after.home_score)
+    # line score of WAS202204070, with the home team reaching on the visiting shortstop's error
+    assert (end.visiting_hits, end.home_hits) == (12, 6)
+    assert (end.visiting_errors, end.home_errors) == (1, 0)
+    with pytest.raises(IndexError):
+        checkpoints.get_state(num_events + 1)
+    with pytest.raises(IndexError):
+        checkpoints.get_state(-1)
+
+
+def test_game_checkpoints_get_state_count(real_game, extra_inning_game):
+    positions = [position for position, event in enumerate(real_game.chronological_events) if isinstance(event, Play)]
+
+    snapshots = [real_game.checkpoints.get_state(position) for position in positions]
+
+    # play,1,0,marts002,22,CBCBX,S9/L89S-
+    assert (snapshots[0].balls, snapshots[0].strikes) == (2, 2)
+    assert all(
+        f"{snapshot.balls}{snapshot.strikes}" == real_game.chronological_events[snapshot.position].count
+        for snapshot in snapshots
+    )
+    # before a start or sub, and for a count of '??'
+    assert (real_game.checkpoints.get_state(0).balls, real_game.checkpoints.get_state(0).strikes) == (None, None)
+    assert extra_inning_game.checkpoints.get_state(7).balls is None
+
+
+def test_game_checkpoints_positions(real_game):
+    interval = 8
+    checkpoints = game_checkpoints.GameCheckpoints.from_chronological_events(real_game.chronological_events, interval)
+
+    assert checkpoints.positions[0] == 0
+    assert all(end - start <= interval for start, end in zip(checkpoints.positions, checkpoints.positions[1:]))
+    # every half-inning starts at a checkpoint
+    play_positions = [
+        position for position, event in enumerate(real_game.chronological_events) if isinstance(event, Play)
+    ]
+    for row, position in enumerate(play_positions):
+        if real_game.states[row].starts_half_inning:
+            assert position in checkpoints.positions
+    assert len(checkpoints) < len(real_game.chronological_events)
+
+
+def test_game_checkpoints_default_interval_checkpoints_half_innings(real_game):
+    checkpoints = real_game.checkpoints
+
+    # the 18 half-innings of the game's 129 events, and the state at its start
+    assert len(real_game.chronological_events) == 129
+    assert len(checkpoints) == sum(state.starts_half_inning for state in real_game.states) + 1 == 19
+
+
+def test_game_checkpoints_get_state_replays_less_than_interval(mocker, real_game):
+    interval = 8
+    checkpoints = game_checkpoints.GameCheckpoints.from_chronological_events(real_game.chronological_events, interval)
+    apply = mocker.spy(game_checkpoints.GameStateTracker, "apply")
+
+    for position in range(len(real_game.chronological_events) + 1):
+        apply.reset_mock()
+        checkpoints.get_state(position)
+        assert apply.call_count < interval
+
+
+def test_game_checkpoints_rejects_non_positive_interval(real_game):
+    with pytest.raises(ValueError):
+        game_checkpoints.GameCheckpoints.from_chronological_events(real_game.chronological_events, 0)
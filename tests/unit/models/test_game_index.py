@@ -0,0 +1,31 @@
+from pyretrosheet.models import game_index
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.models.team import TeamLocation
+
+MODULE_PATH = "pyretrosheet.models.game_index"
+
+
+def test_game_index_from_chronological_events(real_game):
+    index = game_index.GameIndex.from_chronological_events(real_game.chronological_events)
+
+    events = real_game.chronological_events
+    plays = [event for event in events if isinstance(event, Play)]
+    assert index.plays[None] == plays
+    assert index.plays[TeamLocation.HOME] == [play for play in plays if play.team_location == TeamLocation.HOME]
+    assert [events[position] for position in index.play_positions[TeamLocation.VISITING]] == (
+        index.plays[TeamLocation.VISITING]
+    )
+    assert [events[position] for position in index.player_positions[None]] == [
+        event for event in events if isinstance(event, Player)
+    ]
+    assert index.batter_plays[None]["lindf001"] == [play for play in plays if play.batter_id == "lindf001"]
+    assert index.inning_plays[TeamLocation.HOME][1] == index.get_half_inning_plays(1, TeamLocation.HOME)
+    assert index.get_half_inning_plays(10, TeamLocation.HOME) == []
+
+
+def test_game_index__built_once(real_game, mocker):
+    from_chronological_events = mocker.spy(game_index.GameIndex, "from_chronological_events")
+
+    assert real_game.index is real_game.index
+    from_chronological_events.assert_called_once()
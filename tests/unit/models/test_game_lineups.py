@@ -0,0 +1,62 @@
+import pytest
+
+from pyretrosheet.models import game_lineups
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.models.team import TeamLocation
+
+MODULE_PATH = "pyretrosheet.models.game_lineups"
+
+
+@pytest.fixture
+def chronological_events():
+    return [
+        Player.from_start_or_sub_line('start,visia001,"Visitor A",0,1,6', is_sub=False),
+        Player.from_start_or_sub_line('start,visib001,"Visitor B",0,2,10', is_sub=False),
+        Player.from_start_or_sub_line('start,visip001,"Visitor P",0,0,1', is_sub=False),
+        Player.from_start_or_sub_line('start,homea001,"Home A",1,1,7', is_sub=False),
+        Player.from_start_or_sub_line('start,homeb001,"Home B",1,2,3', is_sub=False),
+        Player.from_start_or_sub_line('start,homep001,"Home P",1,9,1', is_sub=False),
+        Play.from_play_line("play,1,0,visia001,??,,63", None),
+        Play.from_play_line("play,1,1,homea001,??,,43", None),
+        Player.from_start_or_sub_line('sub,homeh001,"Pinch Hitter",1,9,11', is_sub=True),
+        Play.from_play_line("play,1,1,homeh001,??,,S7", None),
+        # the pinch hitter stays in the game at first base, moving the first baseman to left field
+        Player.from_start_or_sub_line('sub,homeh001,"Pinch Hitter",1,9,3', is_sub=True),
+        Player.from_start_or_sub_line('sub,homeb001,"Home B",1,2,7', is_sub=True),
+        Player.from_start_or_sub_line('sub,homer001,"Home Reliever",1,1,1', is_sub=True),
+        Play.from_play_line("play,2,0,visib001,??,,3/G", None),
+    ]
+
+
+def test_game_lineups_from_chronological_events(chronological_events):
+    lineups = game_lineups.GameLineups.from_chronological_events(chronological_events)
+
+    assert len(lineups) == 4
+    assert list(lineups.play_versions) == [0, 0, 1, 2]
+    # the visiting team's pitcher bats through the designated hitter
+    visiting_lineup = lineups.get_lineup(0, TeamLocation.VISITING)
+    assert visiting_lineup.batting_order[:3] == ["visia001", "visib001", None]
+    assert visiting_lineup.fielders == {6: "visia001", 10: "visib001", 1: "visip001"}
+    assert lineups.get_pitcher(0) == "homep001"
+    assert lineups.get_pitcher(1) == "visip001"
+    assert lineups.get_batter(2, TeamLocation.HOME, 9) == "homeh001"
+    # pinch hitters don't take a defensive position
+    assert lineups.get_lineup(2, TeamLocation.HOME).fielders[1] == "homep001"
+    assert lineups.get_pitcher(3) == "homer001"
+    assert lineups.get_lineup(3, TeamLocation.HOME).batting_order[0] == "homer001"
+    assert lineups.resolve_fielders(3, [3, 7, 0]) == ["homeh001", "homeb001", None]
+    assert lineups.get_fielder(3, 6, TeamLocation.VISITING) == "visia001"
+
+
+def test_game_lineups__batters_in_batting_order(real_game):
+    for row, play in enumerate(real_game.index.plays[None]):
+        batting_order = real_game.lineups.get_lineup(row, play.team_location).batting_order
+        assert play.batter_id in batting_order
+
+
+def test_game_lineups__built_once(real_game, mocker):
+    from_chronological_events = mocker.spy(game_lineups.GameLineups, "from_chronological_events")
+
+    assert real_game.lineups is real_game.lineups
+    from_chronological_events.assert_called_once()
@@ -0,0 +1,105 @@
+import pytest
+
+from pyretrosheet.export import chadwick
+from pyretrosheet.models import game_state
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.models.team import TeamLocation
+
+MODULE_PATH = "pyretrosheet.models.game_state"
+
+
+@pytest.fixture
+def chronological_events():
+    return [
+        Player.from_start_or_sub_line('start,visia001,"Visitor A",0,1,8', is_sub=False),
+        Player.from_start_or_sub_line('start,visib001,"Visitor B",0,2,6', is_sub=False),
+        Player.from_start_or_sub_line('start,homea001,"Home A",1,1,8', is_sub=False),
+        Play.from_play_line("play,1,0,visia001,??,,S8", None),
+        Play.from_play_line("play,1,0,visib001,??,,D7.1-3", None),
+        Player.from_start_or_sub_line('sub,pinch001,"Pinch Runner",0,2,12', is_sub=True),
+        Play.from_play_line("play,1,0,visic001,??,,63.3-H", None),
+        Play.from_play_line("play,1,0,visia001,??,,K", None),
+        Play.from_play_line("play,1,0,visid001,??,,8", None),
+        Play.from_play_line("play,1,1,homea001,??,,HR/F7", None),
+        Play.from_play_line("play,1,1,homeb001,??,,SB3", None),
+    ]
+
+
+def test_game_states_from_chronological_events(chronological_events):
+    states = game_state.GameStates.from_chronological_events(chronological_events)
+
+    assert len(states) == 7
+    assert [(state.before.outs, state.after.outs) for state in states] == [
+        (0, 0),
+        (0, 0),
+        (0, 1),
+        (1, 2),
+        (2, 3),
+        (0, 0),
+        (0, 0),
+    ]
+    assert states[1].after.runners == (None, "visib001", "visia001")
+    assert states[1].after.bases == game_state.SECOND | game_state.THIRD
+    # the pinch runner replaces the runner on second
+    assert states[2].before.runners == (None, "pinch001", "visia001")
+    assert states[2].runs == 1
+    assert states[2].after.runners == (None, "pinch001", None)
+    assert (states[2].after.visiting_score, states[2].after.home_score) == (1, 0)
+    assert [state.starts_half_inning for state in states] == [True, False, False, False, False, True, False]
+    assert [state.ends_half_inning for state in states] == [False, False, False, False, True, False, True]
+    # a new half-inning starts with empty bases and no outs, keeping the score
+    assert states[5].team_location == TeamLocation.HOME
+    assert states[5].before == game_state.BaseOutState(0, 0, (None, None, None), 1, 0)
+    assert (states[5].after.visiting_score, states[5].after.home_score) == (1, 1)
+    # runners that are not known to be on base are unknown
+    assert states[-1].after.bases == game_state.THIRD
+    assert states[-1].after.runners == (None, None, None)
+
+
+def test_game_states__extra_inning_runner_adjustments(extra_inning_game):
+    states = extra_inning_game.states
+
+    assert len(states) == 4
+    assert (states[1].before.bases, states[1].before.runners) == (game_state.SECOND, (None, "visib001", None))
+    assert states[1].after.runners == ("visia001", None, "visib001")
+    assert states[2].before.runners == ("visia001", None, "visib001")
+    # the home team's adjusted runner was replaced by a pinch runner before the half-inning started
+    assert (states[3].before.bases, states[3].before.runners) == (game_state.SECOND, (None, "pinch001", None))
+    assert (states[3].runs, states[3].after.home_score) == (1, 1)
+
+
+def test_game_states_getitem__out_of_range(chronological_events):
+    states = game_state.GameStates.from_chronological_events(chronological_events)
+
+    with pytest.raises(IndexError):
+        states[len(states)]
+
+
+def test_game_states__match_chadwick_events(real_game):
+    # chadwick event rows skip no-play (NP) events
+    states = [
+        state
+        for play, state in zip(real_game.index.plays[None], real_game.states)
+        if play.event.description.raw != "NP"
+    ]
+    rows = list(chadwick.iter_event_rows(real_game))
+    fields = {name: index for index, name in enumerate(chadwick.FIELDS)}
+
+    assert len(states) == len(rows)
+    for state, row in zip(states, rows):
+        assert state.before.outs == row[fields["OUTS_CT"]]
+        assert (state.before.visiting_score, state.before.home_score) == (
+            row[fields["AWAY_SCORE_CT"]],
+            row[fields["HOME_SCORE_CT"]],
+        )
+        assert [runner or "" for runner in state.before.runners] == row[
+            fields["BASE1_RUN_ID"] : fields["BASE3_RUN_ID"] + 1
+        ]
+
+
+def test_game_states__built_once(real_game, mocker):
+    from_chronological_events = mocker.spy(game_state.GameStates, "from_chronological_events")
+
+    assert real_game.states is real_game.states
+    from_chronological_events.assert_called_once()
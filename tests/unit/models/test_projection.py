@@ -0,0 +1,44 @@
+import pytest
+
+from pyretrosheet.models import projection
+
+MODULE_PATH = "pyretrosheet.models.projection"
+
+
+def test_projection_from_fields():
+    projection_ = projection.Projection.from_fields({"description.batter_event", "advance.to_base"})
+
+    assert projection_.models == {"game", "play", "event", "description", "advance"}
+    assert projection_.full_models == {"advance"}
+    assert projection_.includes("game.id")
+    assert projection_.includes("game.chronological_events")
+    assert projection_.includes("play.event")
+    assert projection_.includes("event.advances")
+    assert projection_.includes("advance.is_out")
+    assert not projection_.includes("play.comments")
+    assert not projection_.includes("event.modifiers")
+    assert not projection_.includes("description.fielder_assists")
+    assert not projection_.loads("player")
+    assert not projection_.loads("modifier")
+
+
+def test_projection_from_fields__nested_models_loaded_in_full():
+    projection_ = projection.Projection.from_fields({"event.description"})
+
+    assert projection_.is_full("description")
+    assert not projection_.is_full("event")
+    assert not projection_.loads("advance")
+
+
+def test_projection_from_fields__wildcard():
+    projection_ = projection.Projection.from_fields({"play.*"})
+
+    assert projection_.full_models == {"event", "description", "modifier", "advance"}
+    assert projection_.includes("play.comments")
+    assert projection_.includes("description.fielder_assists")
+    assert not projection_.loads("player")
+
+
+def test_projection_from_fields__unknown_field():
+    with pytest.raises(projection.UnknownFieldError, match="play.batter_event"):
+        projection.Projection.from_fields({"play.batter_event"})
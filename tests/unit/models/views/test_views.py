@@ -56,3 +56,18 @@ def test_team_players(real_game):
     assert len(team_players) == 15
     for player in team_players:
         assert isinstance(player, Player)
+
+
+def test_views__no_teams(real_game):
+    assert views.get_plays(real_game, include_home_team=False, include_visiting_team=False) == []
+    assert views.get_players(real_game, include_home_team=False, include_visiting_team=False) == []
+    assert views.get_batter_plays(real_game, include_home_team=False, include_visiting_team=False) == {}
+    assert views.get_inning_plays(real_game, include_home_team=False, include_visiting_team=False) == {}
+
+
+def test_views__return_copies_of_the_game_index(real_game):
+    views.get_plays(real_game).clear()
+    views.get_batter_plays(real_game)["lindf001"].clear()
+
+    assert len(views.get_plays(real_game)) == 94
+    assert views.get_batter_plays(real_game)["lindf001"]
@@ -0,0 +1,125 @@
+import fcntl
+import shutil
+
+import pytest
+
+from pyretrosheet import careers, load, retrosheet
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.refresh import RefreshResult
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.careers"
+
+
+def test_build(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+
+    index_path = careers.build([2022], data_dir=tmp_path)
+
+    assert index_path == tmp_path / careers.INDEX_FILE_NAME
+    games = load._get_games_from_play_by_play_file(tmp_path / "2022WAS.EVN")
+    appearances = careers.get_appearances("lindf001", data_dir=tmp_path)
+    assert [(appearance.file_name, appearance.game_offset) for appearance in appearances] == [
+        ("2022WAS.EVN", 0),
+        ("2022WAS.EVN", 1),
+    ]
+    for appearance, game in zip(appearances, games, strict=True):
+        assert appearance.game_id == game.id.raw.removeprefix("id,")
+        assert [game.chronological_events[position] for position in appearance.play_positions] == [
+            event for event in game.chronological_events if isinstance(event, Play) and event.batter_id == "lindf001"
+        ]
+        assert [game.chronological_events[position] for position in appearance.lineup_positions] == [
+            event for event in game.chronological_events if isinstance(event, Player) and event.id == "lindf001"
+        ]
+    assert careers.get_appearances("unknown001", data_dir=tmp_path) == []
+
+
+def test_build__positions_count_runner_adjustments(tmp_path, extra_inning_game):
+    (tmp_path / "2022WAS.EVN").write_text("\n".join(testing_data.EXTRA_INNING_GAME_LINES))
+
+    careers.build([2022], data_dir=tmp_path)
+
+    (appearance,) = careers.get_appearances("homeb001", data_dir=tmp_path)
+    assert [extra_inning_game.chronological_events[position] for position in appearance.play_positions] == [
+        event
+        for event in extra_inning_game.chronological_events
+        if isinstance(event, Play) and event.batter_id == "homeb001"
+    ]
+
+
+def test_build__skips_indexed_years(tmp_path, mocker):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    careers.build([2022], data_dir=tmp_path)
+    index_files = mocker.spy(careers, "_index_files")
+
+    careers.build([2022], data_dir=tmp_path)
+
+    index_files.assert_not_called()
+    assert len(careers.get_appearances("lindf001", data_dir=tmp_path)) == 2
+
+
+@pytest.mark.parametrize("refresh", [False, True])
+def test_index_files__holds_year_lock(tmp_data_dir, mocker, refresh):
+    index_files = careers._index_files
+    lock_held = []
+
+    def _index_files(*args):
+        with (tmp_data_dir / ".2022.lock").open("a") as lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_held.append(True)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_held.append(False)
+        index_files(*args)
+
+    mocker.patch(f"{MODULE_PATH}._index_files", side_effect=_index_files)
+
+    if refresh:
+        careers.refresh_target(tmp_data_dir)(RefreshResult(2022, changed_files=["2022WAS_2.EVN"]))
+    else:
+        careers.build([2022], data_dir=tmp_data_dir)
+
+    assert lock_held == [True]
+
+
+def test_refresh_target__removed_files(tmp_data_dir):
+    careers.build([2022], data_dir=tmp_data_dir)
+    (tmp_data_dir / "2022WAS_2.EVN").unlink()
+
+    careers.refresh_target(tmp_data_dir)(RefreshResult(2022, changed_files=["2022WAS_2.EVN"]))
+
+    assert [appearance.file_name for appearance in careers.get_appearances("lindf001", data_dir=tmp_data_dir)] == [
+        "2022WAS_1.EVN"
+    ]
+
+
+def test_load_career_games(tmp_path, mocker):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    careers.build([2022], data_dir=tmp_path)
+    all_games = load._get_games_from_play_by_play_file(tmp_path / "2022WAS.EVN")
+    from_game_lines = mocker.spy(careers.load.Game, "from_game_lines")
+
+    # appeared in the second game only
+    games = careers.load_career_games("grayj004", data_dir=tmp_path)
+
+    assert games == [all_games[1]]
+    assert from_game_lines.call_count == 1
+
+
+def test_refresh_target(tmp_path):
+    with retrosheet.Compression.GZIP.open(tmp_path / "2022WAS.EVN.gz", "wb") as f:
+        f.write(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE.read_bytes())
+    careers.build([2022], data_dir=tmp_path, compression=retrosheet.Compression.GZIP)
+    with retrosheet.Compression.GZIP.open(tmp_path / "2022WAS.EVN.gz", "wb") as f:
+        f.write(testing_data.WAS_2022_TWO_GAME_EXAMPLE.read_bytes())
+
+    assert len(careers.get_appearances("lindf001", data_dir=tmp_path)) == 1
+
+    careers.refresh_target(tmp_path, compression=retrosheet.Compression.GZIP)(
+        RefreshResult(2022, changed_files=["2022WAS.EVN"])
+    )
+
+    assert len(careers.get_appearances("lindf001", data_dir=tmp_path)) == 2
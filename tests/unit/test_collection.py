@@ -0,0 +1,76 @@
+import datetime as dt
+import pickle
+
+import pytest
+
+from pyretrosheet import load, views
+from pyretrosheet.collection import GameCollection
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.collection"
+
+
+@pytest.fixture
+def games():
+    return GameCollection(load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE))
+
+
+def test_game_collection_get_game(games):
+    assert games.get_game("id,WAS202204080") is games[1]
+    with pytest.raises(KeyError):
+        games.get_game("id,WAS202204090")
+
+
+def test_game_collection_get_team_games(games):
+    assert games.get_team_games("WAS") == games
+    assert games.get_team_games("NYN") == games
+    assert games.get_team_games("SFN") == []
+
+
+def test_game_collection_get_date_games(games):
+    assert games.get_date_games(dt.date(2022, 4, 7)) == [games[0]]
+    assert games.get_date_games(dt.date(2022, 4, 9)) == []
+    assert games.get_games_between(dt.date(2022, 4, 8), dt.date(2022, 4, 30)) == [games[1]]
+    assert games.get_games_between(dt.date(2022, 4, 1), dt.date(2022, 4, 8)) == games
+
+
+def test_game_collection_get_player_games(games):
+    appearances = games.get_player_appearances("lindf001")
+
+    assert games.get_player_games("lindf001") == games
+    assert [game for game, _ in appearances] == games
+    assert all(player.id == "lindf001" for _, player in appearances)
+    assert games.get_player_games("unknown001") == []
+
+
+def test_game_collection_get_team_players(games):
+    assert games.get_team_players("WAS") == views.get_team_players(games, "WAS")
+    assert games.get_team_players("SFN") == []
+
+
+def test_game_collection__mutation_discards_indexes(games):
+    game = games.pop()
+    assert games.get_team_games("WAS") == [games[0]]
+
+    games.append(game)
+    assert games.get_team_games("WAS") == games
+
+    games[:] = []
+    assert games.get_team_games("WAS") == []
+
+
+def test_game_collection__pickle(games):
+    games.get_team_games("WAS")
+
+    unpickled = pickle.loads(pickle.dumps(games))
+
+    assert isinstance(unpickled, GameCollection)
+    assert unpickled == games
+    assert unpickled._team_games is None
+
+
+def test_load_games__returns_game_collection(tmp_data_dir):
+    games = load.load_games(2022, data_dir=tmp_data_dir)
+
+    assert isinstance(games, GameCollection)
+    assert len(games.get_team_games("WAS")) == 3
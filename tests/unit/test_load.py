@@ -1,15 +1,22 @@
-from pyretrosheet import load
+import asyncio
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyretrosheet import load, retrosheet
 from tests import testing_data
 
 MODULE_PATH = "pyretrosheet.load"
 
 
-def test_load_games(mocker):
+def test_load_games(mocker, tmp_data_dir):
     year = 2022
 
     games_in_year = list(
         load.load_games(
-            data_dir=testing_data.TEST_DATA_DIR,
+            data_dir=tmp_data_dir,
             year=year,
         )
     )
@@ -19,6 +26,14 @@ def test_load_games(mocker):
     assert len(games_in_year) == 3
 
 
+def test_load_games__fields(tmp_data_dir):
+    games = load.load_games(2022, data_dir=tmp_data_dir, fields={"play.batter_id"})
+
+    assert [game.id for game in games] == [game.id for game in load.load_games(2022, tmp_data_dir)]
+    assert all(hasattr(play, "batter_id") for game in games for play in game.chronological_events)
+    assert not any(hasattr(play, "event") for game in games for play in game.chronological_events)
+
+
 def test__iter_games_from_play_by_play_file():
     play_by_play_file = testing_data.WAS_2022_TWO_GAME_EXAMPLE
 
@@ -27,3 +42,180 @@ def test__iter_games_from_play_by_play_file():
     game_one, game_two = games
     assert game_one.id.raw == "id,WAS202204070"
     assert game_two.id.raw == "id,WAS202204080"
+
+
+def test__get_games_from_play_by_play_file__compressed(tmp_path):
+    compressed_file = tmp_path / "2022WAS_2.EVN.gz"
+    with retrosheet.Compression.GZIP.open(compressed_file, "wb") as f:
+        f.write(testing_data.WAS_2022_TWO_GAME_EXAMPLE.read_bytes())
+
+    games = load._get_games_from_play_by_play_file(compressed_file)
+
+    assert games == load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+
+
+def test_iter_games_by_year(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+
+    games_by_year = list(load.iter_games_by_year([2022, 2021], data_dir=tmp_path, max_parse_workers=2))
+
+    assert [year for year, _ in games_by_year] == [2022, 2021]
+    assert [len(games) for _, games in games_by_year] == [1, 2]
+    assert games_by_year[1][1] == load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+
+
+def test_iter_games_by_year__bounds_years_in_flight(mocker, tmp_path):
+    retrieve = mocker.patch(f"{MODULE_PATH}.retrosheet.retrieve_years_play_by_play_files", return_value=[])
+    max_years_ahead = 2
+
+    def wait_for_retrieved_years(num_years):
+        deadline = time.monotonic() + 5
+        while retrieve.call_count < num_years and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # give the fetch threads time to (wrongly) retrieve more years
+        time.sleep(0.1)
+        return [call.kwargs["year"] for call in retrieve.call_args_list]
+
+    games_by_year = load.iter_games_by_year(range(2000, 2010), data_dir=tmp_path, max_years_ahead=max_years_ahead)
+    assert next(games_by_year)[0] == 2000
+    # the yielded year and the years ahead of it, and no more until the consumer advances
+    assert wait_for_retrieved_years(max_years_ahead + 1) == [2000, 2001, 2002]
+
+    assert next(games_by_year)[0] == 2001
+    assert wait_for_retrieved_years(max_years_ahead + 2) == [2000, 2001, 2002, 2003]
+    games_by_year.close()
+
+
+def test_iter_games_by_year__stops_while_years_are_retrieved(mocker, tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+
+    def retrieve(year, data_dir, force_download, compression):
+        if year == 2022:
+            # still retrieving when the consumer stops
+            time.sleep(0.2)
+        return [data_dir / f"{year}WAS.EVN"]
+
+    mocker.patch(f"{MODULE_PATH}.retrosheet.retrieve_years_play_by_play_files", side_effect=retrieve)
+    retrieve_and_read_year = mocker.spy(load, "_retrieve_and_read_year")
+
+    games_by_year = load.iter_games_by_year([2021, 2022], data_dir=tmp_path, max_parse_workers=1)
+    assert next(games_by_year)[0] == 2021
+    games_by_year.close()
+
+    # the year being retrieved handed its file off for parsing before the parse pool was shut down
+    assert retrieve_and_read_year.call_count == 2
+    assert retrieve_and_read_year.spy_exception is None
+
+
+def test_aload_games(tmp_data_dir):
+    games = asyncio.run(load.aload_games(2022, data_dir=tmp_data_dir))
+
+    assert games == load.load_games(2022, data_dir=tmp_data_dir)
+
+
+def test_astream_games(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+
+    async def stream():
+        return [game.id.raw async for game in load.astream_games([2022, 2021], data_dir=tmp_path)]
+
+    assert asyncio.run(stream()) == ["id,WAS202204070", "id,WAS202204070", "id,WAS202204080"]
+
+
+def test_astream_games__applies_backpressure_and_cancels_on_close(mocker, tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+    aload_games = mocker.spy(load, "aload_games")
+
+    async def stream():
+        games = load.astream_games([2021] * 10, data_dir=tmp_path, max_buffered_games=1)
+        first_game = await anext(games)
+        await asyncio.sleep(0.1)
+        await games.aclose()
+        return first_game
+
+    assert asyncio.run(stream()).id.raw == "id,WAS202204070"
+    # the second game of the first year fills the buffer, the producer is blocked within the second year
+    assert aload_games.call_count == 2
+
+
+def test_astream_games__raises_errors(mocker, tmp_path):
+    mocker.patch(f"{MODULE_PATH}.retrosheet.retrieve_years_play_by_play_files", side_effect=ValueError("oops"))
+
+    async def stream():
+        return [game async for game in load.astream_games([2022], data_dir=tmp_path)]
+
+    with pytest.raises(ValueError, match="oops"):
+        asyncio.run(stream())
+
+
+def test_load_games__coalesces_concurrent_calls(mocker, tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    retrieve = load._retrieve_years_play_by_play_files
+
+    def slow_retrieve(*args):
+        time.sleep(0.1)
+        return retrieve(*args)
+
+    retrieve_spy = mocker.patch(f"{MODULE_PATH}._retrieve_years_play_by_play_files", side_effect=slow_retrieve)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda data_dir: load.load_games(2022, data_dir), [tmp_path, str(tmp_path)] * 2))
+
+    assert retrieve_spy.call_count == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_clear_cache(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    games = load.load_games(2022, tmp_path)
+    assert load.load_games(2022, tmp_path) is games
+
+    load.clear_cache()
+
+    assert load.load_games(2022, tmp_path) is not games
+
+
+def test__single_flight__shares_errors():
+    single_flight = load._SingleFlight()
+
+    def fail():
+        time.sleep(0.1)
+        raise ValueError("oops")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(single_flight.do, "key", fail) for _ in range(2)]
+
+    for future in futures:
+        with pytest.raises(ValueError, match="oops"):
+            future.result()
+    assert single_flight._in_flight == {}
+
+
+def test_aload_games__coalesces_concurrent_calls(mocker, tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    retrieve_spy = mocker.spy(load, "_retrieve_years_play_by_play_files")
+
+    async def load_concurrently():
+        return await asyncio.gather(*(load.aload_games(2022, data_dir) for data_dir in [tmp_path, str(tmp_path)] * 2))
+
+    results = asyncio.run(load_concurrently())
+
+    assert retrieve_spy.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert load._aload_games_in_flight == {}
+
+
+def test_aload_games__cancelling_one_caller_does_not_cancel_others(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+
+    async def load_concurrently():
+        cancelled = asyncio.create_task(load.aload_games(2022, tmp_path))
+        waiting = asyncio.create_task(load.aload_games(2022, tmp_path))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await waiting
+
+    assert len(asyncio.run(load_concurrently())) == 2
@@ -0,0 +1,116 @@
+import shutil
+
+import pytest
+
+from pyretrosheet import load, records
+from pyretrosheet.models.base import Base
+from pyretrosheet.models.game_id import GameID
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.player import Player
+from pyretrosheet.models.runner_adjustment import RunnerAdjustment
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.records"
+
+
+def test_record_parser__invokes_callbacks_per_record_type():
+    parser = records.RecordParser()
+    data_records = []
+    sub_records = []
+    parser.on_data(data_records.append)
+    parser.on_sub(sub_records.append)
+
+    parser.parse_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+
+    assert len(data_records) == 21
+    assert data_records[0].game_id == "WAS202204070"
+    assert data_records[-1].game_id == "WAS202204080"
+    assert data_records[0].values == data_records[0].line.split(",")[1:]
+    assert data_records[0].file_path == testing_data.WAS_2022_TWO_GAME_EXAMPLE.as_posix()
+    assert all(record.type == "sub" for record in sub_records)
+
+
+def test_record_parser__models_match_games():
+    parser = records.RecordParser()
+    models = []
+    parser.on_id(lambda record: models.append(record.model))
+    parser.on_start(lambda record: models.append(record.model))
+    parser.on_sub(lambda record: models.append(record.model))
+    parser.on_play(lambda record: models.append(record.model))
+
+    parser.parse_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+
+    games = load._get_games_from_play_by_play_file(testing_data.WAS_2022_TWO_GAME_EXAMPLE)
+    assert models == [model for game in games for model in [game.id, *game.chronological_events]]
+    assert {type(model) for model in models} == {GameID, Player, Play}
+    assert any(model.comments for model in models if isinstance(model, Play))
+
+
+def test_record_parser__play_callbacks_follow_their_comments():
+    parser = records.RecordParser()
+    invocations = []
+    parser.on_play(lambda record: invocations.append(("play", record.comment_lines)))
+    parser.on_com(lambda record: invocations.append(("com", record.line)))
+
+    parser.parse_lines(["id,WAS202204070", "play,1,0,a,00,,S8", "com,first", "com,second", "play,1,0,b,00,,K"])
+
+    assert invocations == [
+        ("com", "com,first"),
+        ("com", "com,second"),
+        ("play", ["com,first", "com,second"]),
+        ("play", []),
+    ]
+
+
+def test_record_parser__adjustment_records():
+    parser = records.RecordParser()
+    adjustments = []
+    for register in [parser.on_radj, parser.on_badj, parser.on_padj, parser.on_ladj, parser.on_presadj]:
+        register(adjustments.append)
+
+    parser.parse_lines(
+        [
+            "id,WAS202204070",
+            "badj,bonib001,R",
+            "play,10,0,a,00,,S8",
+            "radj,rizza001,2",
+            "padj,harrg001,L",
+            "ladj,0,9",
+            "presadj,bonib001,1",
+        ]
+    )
+
+    assert [(record.type, record.values) for record in adjustments] == [
+        ("badj", ["bonib001", "R"]),
+        ("radj", ["rizza001", "2"]),
+        ("padj", ["harrg001", "L"]),
+        ("ladj", ["0", "9"]),
+        ("presadj", ["bonib001", "1"]),
+    ]
+    assert adjustments[1].model == RunnerAdjustment(runner_id="rizza001", base=Base.SECOND_BASE, raw="radj,rizza001,2")
+    with pytest.raises(records.RecordModelNotFoundError):
+        adjustments[0].model
+
+
+def test_record_parser__models_built_on_demand(mocker):
+    from_play_line = mocker.patch(f"{MODULE_PATH}.Play.from_play_line")
+    parser = records.RecordParser()
+    parser.on_play(lambda record: None)
+
+    parser.parse_file(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE)
+
+    from_play_line.assert_not_called()
+
+
+def test_record_parser__parse_years(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    parser = records.RecordParser()
+    game_ids = []
+
+    @parser.on_id
+    def on_id(record):
+        game_ids.append(record.game_id)
+
+    parser.parse_years([2022], data_dir=tmp_path)
+
+    assert game_ids == ["WAS202204070", "WAS202204080"]
@@ -0,0 +1,100 @@
+import shutil
+
+import pytest
+
+from pyretrosheet import load, refresh
+from pyretrosheet.models.game import Game
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.refresh"
+
+
+@pytest.fixture()
+def data_dir(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    return tmp_path
+
+
+def _refresh(data_dir, targets=()):
+    return refresh.refresh(2022, targets, data_dir=data_dir, force_download=False)
+
+
+def _game_ids(games):
+    return [game.id.raw for game in games]
+
+
+def test_refresh__first_refresh_adds_every_game(data_dir):
+    results = []
+
+    result = _refresh(data_dir, [results.append])
+
+    assert results == [result]
+    assert result.changed_files == ["2022WAS.EVN"]
+    assert _game_ids(result.updated_games) == ["id,WAS202204070", "id,WAS202204080"]
+    assert result.removed_game_ids == []
+    assert (data_dir / ".2022.manifest.json").exists()
+
+
+def test_refresh__unchanged_files_are_not_parsed(data_dir, mocker):
+    _refresh(data_dir)
+    from_game_lines = mocker.spy(Game, "from_game_lines")
+
+    result = _refresh(data_dir)
+
+    assert not result.has_changes
+    assert result.changed_files == []
+    from_game_lines.assert_not_called()
+
+
+def test_refresh__only_changed_games_are_parsed(data_dir, mocker):
+    _refresh(data_dir)
+    file = data_dir / "2022WAS.EVN"
+    file.write_text(file.read_text().replace("info,attendance,25677", "info,attendance,25678"))
+    from_game_lines = mocker.spy(Game, "from_game_lines")
+
+    result = _refresh(data_dir)
+
+    assert _game_ids(result.updated_games) == ["id,WAS202204080"]
+    assert result.updated_games[0].info["attendance"] == "25678"
+    assert from_game_lines.call_count == 1
+
+
+def test_refresh__removed_games(data_dir):
+    _refresh(data_dir)
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, data_dir / "2022WAS.EVN")
+
+    result = _refresh(data_dir)
+
+    assert result.updated_games == []
+    assert result.removed_game_ids == ["WAS202204080"]
+
+
+def test_refresh__removed_files(data_dir):
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, data_dir / "2022WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, data_dir / "2022NYN.EVN")
+    _refresh(data_dir)
+    (data_dir / "2022NYN.EVN").unlink()
+
+    result = _refresh(data_dir)
+
+    assert result.changed_files == ["2022NYN.EVN"]
+    assert result.updated_games == []
+    assert result.removed_game_ids == ["WAS202204080"]
+    assert "2022NYN.EVN" not in refresh._read_manifest(data_dir / ".2022.manifest.json")
+
+
+def test_refresh__failed_target_does_not_update_manifest(data_dir):
+    def fail(result):
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        _refresh(data_dir, [fail])
+
+    assert len(_refresh(data_dir).updated_games) == 2
+
+
+def test_refresh__clears_load_cache(data_dir):
+    games = load.load_games(2022, data_dir)
+    _refresh(data_dir)
+
+    assert load.load_games(2022, data_dir) is not games
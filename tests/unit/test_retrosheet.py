@@ -1,3 +1,9 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
 import pytest
 from requests.exceptions import HTTPError
 
@@ -68,3 +74,100 @@ def test_retrieve_years_play_by_play_files__downloads_if_no_data_files(mocker, t
 
     assert extract_zip_archive.called_once_with(data_zip_archive, data_dir)
     assert data_files == list(yield_years_play_by_play_files.return_value)
+
+
+@pytest.mark.parametrize("compression", list(retrosheet.Compression))
+def test__extract_zip_archive__compresses_play_by_play_files(tmp_path, compression):
+    archive_bytes = BytesIO()
+    with ZipFile(archive_bytes, "w") as archive:
+        archive.writestr("2023TEAM.EVN", "id,TEAM202304010\n")
+        archive.writestr("TEAM2023", "TEAM,N,City,Name\n")
+    data_dir = tmp_path / "data"
+
+    retrosheet._extract_zip_archive(ZipFile(archive_bytes), data_dir, compression)
+
+    compressed_file = data_dir / f"2023TEAM.EVN{compression.suffix}"
+    assert not (data_dir / "2023TEAM.EVN").exists()
+    assert (data_dir / "TEAM2023").read_text() == "TEAM,N,City,Name\n"
+    assert list(retrosheet._yield_years_play_by_play_files(data_dir, 2023, compression)) == [compressed_file]
+    with retrosheet.open_play_by_play_file(compressed_file) as f:
+        assert f.read() == "id,TEAM202304010\n"
+
+
+def test__yield_years_play_by_play_files__ignores_files_with_other_compression(tmp_path):
+    (tmp_path / "2023TEAM.EVN").touch()
+    (tmp_path / "2023TEAM.EVN.gz").touch()
+
+    assert list(retrosheet._yield_years_play_by_play_files(tmp_path, 2023)) == [tmp_path / "2023TEAM.EVN"]
+    assert list(retrosheet._yield_years_play_by_play_files(tmp_path, 2023, retrosheet.Compression.BZ2)) == []
+
+
+def test_get_compression():
+    assert retrosheet.get_compression(Path("2023TEAM.EVN")) is None
+    assert retrosheet.get_compression(Path("2023TEAM.EVN.xz")) == retrosheet.Compression.LZMA
+
+
+def test_get_play_by_play_file_name():
+    assert retrosheet.get_play_by_play_file_name(Path("data/2023TEAM.EVN")) == "2023TEAM.EVN"
+    assert retrosheet.get_play_by_play_file_name(Path("data/2023TEAM.EVN.gz")) == "2023TEAM.EVN"
+
+
+def _zip_archive(files: dict[str, str]) -> ZipFile:
+    archive_bytes = BytesIO()
+    with ZipFile(archive_bytes, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return ZipFile(archive_bytes)
+
+
+def test_retrieve_years_play_by_play_files__concurrent_callers_download_once(mocker, tmp_path):
+    year = 2023
+    data_dir = tmp_path / "data"
+
+    def get_zip_archive(year):
+        time.sleep(0.1)
+        return _zip_archive({f"{year}TEAM.EVN": "id,TEAM202304010\n"})
+
+    client = mocker.Mock()
+    client.get_zip_archive_of_years_play_by_play_data.side_effect = get_zip_archive
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: retrosheet.retrieve_years_play_by_play_files(year, data_dir, retrosheet_client=client),
+                range(4),
+            )
+        )
+
+    assert client.get_zip_archive_of_years_play_by_play_data.call_count == 1
+    assert all(result == [data_dir / f"{year}TEAM.EVN"] for result in results)
+
+
+def test_retrieve_years_play_by_play_files__download_deletes_files_removed_upstream(mocker, tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "2023TEAM.EVN").write_text("id,TEAM202304010\n")
+    (data_dir / "2023GONE.EVN").write_text("id,GONE202304010\n")
+    client = mocker.Mock()
+    client.get_zip_archive_of_years_play_by_play_data.return_value = _zip_archive(
+        {"2023TEAM.EVN": "id,TEAM202304020\n"}
+    )
+
+    data_files = retrosheet.retrieve_years_play_by_play_files(
+        retrosheet_client=client, year=2023, data_dir=data_dir, force_download=True
+    )
+
+    assert data_files == [data_dir / "2023TEAM.EVN"]
+    assert (data_dir / "2023TEAM.EVN").read_text() == "id,TEAM202304020\n"
+    assert not (data_dir / "2023GONE.EVN").exists()
+
+
+def test__extract_zip_archive_atomically(tmp_path):
+    data_dir = tmp_path / "data"
+    zip_archive = _zip_archive({"2023TEAM.EVN": "id,TEAM202304010\n", "TEAM2023": "TEAM,N,City,Name\n"})
+
+    extracted_files = retrosheet._extract_zip_archive_atomically(zip_archive, data_dir)
+
+    assert sorted(extracted_files) == [data_dir / "2023TEAM.EVN", data_dir / "TEAM2023"]
+    assert sorted(path.name for path in data_dir.iterdir()) == ["2023TEAM.EVN", "TEAM2023"]
+    assert (data_dir / "2023TEAM.EVN").read_text() == "id,TEAM202304010\n"
@@ -0,0 +1,92 @@
+import shutil
+
+import pytest
+
+from pyretrosheet import run_expectancy
+from pyretrosheet.models.game_state import FIRST, THIRD
+from pyretrosheet.table import PlayTable
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.run_expectancy"
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture()
+def data_dir(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+    return tmp_path
+
+
+def _get_expected_aggregates(game):
+    """Aggregate a game's plays by walking its states, summing runs to the end of each half-inning."""
+    runs = [0] * run_expectancy.NUM_BASE_OUT_STATES
+    plays = [0] * run_expectancy.NUM_BASE_OUT_STATES
+    half_inning = []
+    for play, state in zip(game.index.plays[None], game.states):
+        half_inning.append((play, state))
+        if not state.ends_half_inning:
+            continue
+
+        if state.after.outs == run_expectancy.NUM_OUTS:
+            for i, (half_inning_play, half_inning_state) in enumerate(half_inning):
+                if half_inning_play.event.description.raw == "NP":
+                    continue
+
+                base_out_state = run_expectancy.get_base_out_state(
+                    half_inning_state.before.outs, half_inning_state.before.bases
+                )
+                runs[base_out_state] += sum(s.runs for _, s in half_inning[i:])
+                plays[base_out_state] += 1
+        half_inning = []
+    return runs, plays
+
+
+def test_run_expectancy_from_table(real_game):
+    expected_runs, expected_plays = _get_expected_aggregates(real_game)
+
+    expectancy = run_expectancy.RunExpectancy.from_table(PlayTable.from_games([real_game]))
+
+    assert expectancy.runs.tolist() == expected_runs
+    assert expectancy.plays.tolist() == expected_plays
+    assert expectancy.get(0, 0) == pytest.approx(expected_runs[0] / expected_plays[0])
+    assert expectancy.to_matrix().shape == (run_expectancy.NUM_BASE_STATES, run_expectancy.NUM_OUTS)
+    assert expectancy.to_matrix()[FIRST | THIRD, 1] == expectancy.get(1, FIRST | THIRD)
+
+
+def test_run_expectancy_merge(real_game):
+    expectancy = run_expectancy.RunExpectancy.from_table(PlayTable.from_games([real_game]))
+
+    merged = expectancy + expectancy
+
+    assert merged.runs.tolist() == (2 * expectancy.runs).tolist()
+    assert np.allclose(merged.expectancy, expectancy.expectancy, equal_nan=True)
+    assert (run_expectancy.RunExpectancy.empty() + expectancy).plays.tolist() == expectancy.plays.tolist()
+
+
+def test_run_expectancy_load_by_year(data_dir):
+    by_year = run_expectancy.RunExpectancy.load_by_year([2021, 2022], data_dir, max_workers=2)
+
+    assert list(by_year) == [2021, 2022]
+    for year, expectancy in by_year.items():
+        expected = run_expectancy.RunExpectancy.from_table(PlayTable.load([year], data_dir))
+        assert expectancy.plays.tolist() == expected.plays.tolist()
+        assert expectancy.runs.tolist() == expected.runs.tolist()
+    total = run_expectancy.RunExpectancy.load([2021, 2022], data_dir, max_workers=2)
+    assert total.plays.tolist() == (by_year[2021] + by_year[2022]).plays.tolist()
+
+
+def test_re24(real_game):
+    play_table = PlayTable.from_games([real_game])
+    columns = play_table.to_numpy()
+    expectancy = run_expectancy.RunExpectancy.from_table(play_table)
+
+    re24 = expectancy.re24(columns)
+
+    assert re24.shape == (len(play_table),)
+    # over a half-inning ending with three outs, run values sum to the runs scored less the expectancy of its start
+    first_half_inning = (columns["inning"] == 1) & (columns["team_location"] == 0)
+    assert re24[first_half_inning].sum() == pytest.approx(
+        columns["runs"][first_half_inning].sum() - expectancy.get(0, 0)
+    )
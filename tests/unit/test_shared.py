@@ -0,0 +1,98 @@
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pyretrosheet.shared import SharedPlayTable
+from pyretrosheet.table import PlayTable
+
+MODULE_PATH = "pyretrosheet.shared"
+
+
+@pytest.fixture()
+def play_table(real_game):
+    return PlayTable.from_games([real_game, real_game])
+
+
+def test_publish_and_attach(play_table):
+    with SharedPlayTable.publish(play_table) as published, SharedPlayTable.attach(published.name) as attached:
+        assert len(attached) == len(play_table)
+        assert attached.game_ids == play_table.game_ids
+        assert attached.batter_ids == play_table.batter_ids
+        assert attached.team_ids == play_table.team_ids
+        for name in PlayTable.column_names():
+            assert attached.columns[name].tolist() == getattr(play_table, name).tolist()
+
+
+def test_columns_are_read_only(play_table):
+    with SharedPlayTable.publish(play_table) as published, pytest.raises(TypeError):
+        published.columns["rbi"][0] = 1
+
+
+def test_publish__empty_table():
+    with SharedPlayTable.publish(PlayTable()) as published:
+        assert len(published) == 0
+        assert published.game_ids == []
+
+
+def test_close__owner_unlinks(play_table):
+    published = SharedPlayTable.publish(play_table)
+    with SharedPlayTable.attach(published.name):
+        pass
+
+    with SharedPlayTable.attach(published.name) as attached:
+        assert len(attached) == len(play_table)
+
+    published.close()
+    published.close()
+    with pytest.raises(FileNotFoundError):
+        SharedPlayTable.attach(published.name)
+
+
+def test_attach__from_worker_processes(play_table):
+    with SharedPlayTable.publish(play_table) as published, ProcessPoolExecutor(max_workers=2) as executor:
+        rbis = list(executor.map(_sum_rbis, [published.name] * 4))
+
+    assert rbis == [sum(play_table.rbi)] * 4
+
+
+def test_owner_crash__block_is_unlinked():
+    script = (
+        "import os\n"
+        "from pyretrosheet.shared import SharedPlayTable\n"
+        "from pyretrosheet.table import PlayTable\n"
+        "published = SharedPlayTable.publish(PlayTable())\n"
+        "print(published.name, flush=True)\n"
+        "os._exit(1)\n"
+    )
+    process = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=False)
+    name = process.stdout.strip()
+    assert name
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            SharedPlayTable.attach(name).close()
+        except FileNotFoundError:
+            return
+        time.sleep(0.1)
+    pytest.fail(f"shared memory block {name} was not unlinked")
+
+
+def test_to_numpy(play_table):
+    pytest.importorskip("numpy")
+
+    with SharedPlayTable.publish(play_table) as published:
+        columns = published.to_numpy()
+
+        assert columns["rbi"].sum() == sum(play_table.rbi)
+        assert columns["fielder_put_outs"].shape == (len(play_table), 10)
+        assert not columns["rbi"].flags.writeable
+        del columns
+
+
+def _sum_rbis(name):
+    with SharedPlayTable.attach(name) as attached:
+        return sum(attached.columns["rbi"])
@@ -0,0 +1,128 @@
+import math
+import shutil
+
+import pytest
+
+from pyretrosheet import stats
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.play.flags import PlayFlag
+from pyretrosheet.table import PlayTable
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.stats"
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def plays(real_game):
+    return [event for event in real_game.chronological_events if isinstance(event, Play)]
+
+
+def test_batting_stats_from_table(real_game, plays):
+    batting_stats = stats.BattingStats.from_table(PlayTable.from_games([real_game]))
+
+    assert sorted(batting_stats.ids) == sorted({play.batter_id for play in plays})
+    for batter_id in batting_stats.ids:
+        batter_plays = [play for play in plays if play.batter_id == batter_id]
+        at_bats = sum(play.is_an_at_bat() for play in batter_plays)
+        hits = sum(play.is_hit() for play in batter_plays)
+        walks = sum(play.is_walk() for play in batter_plays)
+        hit_by_pitches = sum(play.is_hit_by_pitch() for play in batter_plays)
+        sacrifice_flies = sum(play.is_sacrifice_fly() for play in batter_plays)
+        total_bases = sum(
+            play.is_single() + 2 * play.is_double() + 3 * play.is_triple() + 4 * play.is_home_run()
+            for play in batter_plays
+        )
+
+        batter_stats = batting_stats.get(batter_id)
+
+        assert batter_stats["at_bats"] == at_bats
+        assert batter_stats["hits"] == hits
+        assert batter_stats["walks"] == walks
+        assert batter_stats["strikeouts"] == sum(play.is_strikeout() for play in batter_plays)
+        assert batter_stats["runs_batted_in"] == sum(play.num_rbis() for play in batter_plays)
+        assert batter_stats["total_bases"] == total_bases
+        if at_bats:
+            assert batter_stats["batting_average"] == pytest.approx(hits / at_bats)
+            assert batter_stats["slugging_percentage"] == pytest.approx(total_bases / at_bats)
+        else:
+            assert math.isnan(batter_stats["batting_average"])
+        assert batter_stats["on_base_percentage"] == pytest.approx(
+            (hits + walks + hit_by_pitches) / (at_bats + walks + hit_by_pitches + sacrifice_flies)
+        )
+
+
+def test_batting_stats_by_team(real_game, plays):
+    play_table = PlayTable.from_games([real_game])
+    batter_stats = stats.BattingStats.from_table(play_table)
+
+    team_stats = stats.BattingStats.from_table(play_table, by="team")
+
+    assert sorted(team_stats.ids) == sorted([real_game.home_team_id, real_game.visiting_team_id])
+    for name in stats.BattingStats.counting_stat_names():
+        assert getattr(team_stats, name).sum() == getattr(batter_stats, name).sum()
+
+
+def test_batting_stats_load(tmp_data_dir):
+    batting_stats = stats.BattingStats.load([2022], data_dir=tmp_data_dir)
+
+    play_table = PlayTable.load([2022], data_dir=tmp_data_dir)
+    assert batting_stats.at_bats.sum() == sum(1 for flags in play_table.flags if flags & PlayFlag.AT_BAT)
+
+
+def test_batting_stats_merge(real_game):
+    batter_stats = stats.BattingStats.from_table(PlayTable.from_games([real_game]))
+    other_stats = stats.BattingStats(
+        ids=["newcomer01", batter_stats.ids[0]],
+        **{name: np.array([1, 2]) for name in batter_stats.counting_stat_names()},
+    )
+
+    merged = batter_stats + other_stats
+
+    assert merged.ids == [*batter_stats.ids, "newcomer01"]
+    assert merged.hits.tolist() == [batter_stats.hits[0] + 2, *batter_stats.hits[1:].tolist(), 1]
+    assert (stats.BattingStats.empty() + batter_stats).get(batter_stats.ids[0]) == batter_stats.get(batter_stats.ids[0])
+
+
+@pytest.mark.parametrize("by", ["batter", "team"])
+def test_batting_stats_load_by_year(tmp_path, by):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+
+    by_year = stats.BattingStats.load_by_year([2021, 2022], tmp_path, by=by, max_workers=2)
+    total = stats.BattingStats.load([2021, 2022], tmp_path, by=by, max_workers=2)
+
+    assert list(by_year) == [2021, 2022]
+    for year, year_stats in by_year.items():
+        expected = stats.BattingStats.from_table(PlayTable.load([year], tmp_path), by)
+        assert year_stats.ids == expected.ids
+        assert year_stats.at_bats.tolist() == expected.at_bats.tolist()
+    expected = stats.BattingStats.from_table(PlayTable.load([2021, 2022], tmp_path), by)
+    assert total.ids == expected.ids
+    for id_ in expected.ids:
+        assert total.get(id_) == pytest.approx(expected.get(id_), nan_ok=True)
+
+
+def test_batting_stats_get__unknown_id(real_game):
+    batting_stats = stats.BattingStats.from_table(PlayTable.from_games([real_game]))
+
+    with pytest.raises(KeyError):
+        batting_stats.get("unknown")
+
+
+def test_batting_stats_leaders():
+    batting_stats = stats.BattingStats(
+        ids=["a", "b", "c", "d"],
+        at_bats=np.array([4, 0, 4, 2]),
+        hits=np.array([1, 0, 2, 2]),
+        singles=np.array([1, 0, 2, 2]),
+        **{name: np.zeros(4, dtype=int) for name in ["doubles", "triples", "home_runs", "walks", "intentional_walks"]},
+        **{name: np.zeros(4, dtype=int) for name in ["hit_by_pitches", "sacrifice_flies", "sacrifice_hits"]},
+        strikeouts=np.zeros(4, dtype=int),
+        runs_batted_in=np.array([0, 3, 1, 1]),
+    )
+
+    assert batting_stats.leaders("batting_average") == [("d", 1.0), ("c", 0.5), ("a", 0.25)]
+    assert batting_stats.leaders("batting_average", n=1, min_at_bats=3) == [("c", 0.5)]
+    assert batting_stats.leaders("runs_batted_in", n=3) == [("b", 3), ("c", 1), ("d", 1)]
@@ -0,0 +1,162 @@
+import shutil
+
+import pytest
+
+from pyretrosheet import store
+from pyretrosheet.models.play import Play
+from pyretrosheet.refresh import RefreshResult
+from pyretrosheet.table import PlayTable
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.store"
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture()
+def data_dir(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+    return tmp_path
+
+
+def test_build_and_open(data_dir):
+    store_dir = store.build([2022, 2021], data_dir)
+    play_store = store.PlayStore.open(data_dir)
+
+    expected = PlayTable.load([2021, 2022], data_dir)
+    assert store_dir == data_dir / store.STORE_DIR_NAME
+    assert len(play_store) == len(expected)
+    assert play_store.game_ids.tolist() == expected.game_ids
+    assert play_store.years.tolist() == [2021, 2022]
+    assert isinstance(play_store.columns["rbi"], np.memmap)
+    for name, column in expected.to_numpy().items():
+        assert np.array_equal(play_store.columns[name], column)
+    assert play_store.batter_ids[play_store.columns["batter"]].tolist() == [
+        expected.batter_ids[code] for code in expected.batter
+    ]
+    assert play_store.team_ids[play_store.columns["team"]].tolist() == [
+        expected.team_ids[code] for code in expected.team
+    ]
+
+
+def test_season_and_game_rows(data_dir, real_game):
+    store.build([2021, 2022], data_dir)
+    play_store = store.PlayStore.open(data_dir)
+    num_plays = len([event for event in real_game.chronological_events if isinstance(event, Play)])
+
+    assert play_store.season_games(2021) == slice(0, 1)
+    assert play_store.season_games(2022) == slice(1, 3)
+    assert play_store.season_rows(2021) == slice(0, num_plays)
+    assert play_store.game_rows(1) == slice(num_plays, 2 * num_plays)
+    assert play_store.select(play_store.game_rows(1))["rbi"].sum() == sum(
+        p.num_rbis() for p in real_game.chronological_events if isinstance(p, Play)
+    )
+    with pytest.raises(KeyError):
+        play_store.season_rows(2020)
+
+
+def test_build__replaces_existing_store(data_dir):
+    store.build([2021, 2022], data_dir)
+    old_store = store.PlayStore.open(data_dir)
+    store.build([2021], data_dir)
+    store.build([2021], data_dir)
+
+    play_store = store.PlayStore.open(data_dir)
+
+    assert play_store.years.tolist() == [2021]
+    assert len(play_store.game_ids) == 1
+    # readers of a replaced store keep their complete view of it
+    assert old_store.years.tolist() == [2021, 2022]
+    # the current and the replaced version are kept
+    store_dir = data_dir / store.STORE_DIR_NAME
+    assert len([path for path in store_dir.iterdir() if path.is_dir()]) == 2
+
+
+def test_build__failed_build_keeps_current_store(mocker, data_dir):
+    store.build([2021], data_dir)
+    mocker.patch(f"{MODULE_PATH}.PlayTable.load", side_effect=ValueError("oops"))
+
+    with pytest.raises(ValueError, match="oops"):
+        store.build([2021, 2022], data_dir)
+
+    assert store.PlayStore.open(data_dir).years.tolist() == [2021]
+    store_dir = data_dir / store.STORE_DIR_NAME
+    assert len([path for path in store_dir.iterdir() if path.is_dir()]) == 1
+
+
+def test_build__holds_data_dir_lock(mocker, data_dir):
+    lock = mocker.spy(store.retrosheet, "data_dir_lock")
+
+    store.build([2021], data_dir)
+
+    lock.assert_any_call(data_dir, store.STORE_DIR_NAME)
+
+
+def test_update__loads_only_the_updated_years(mocker, data_dir):
+    store.build([2021, 2022], data_dir)
+    old_store = store.PlayStore.open(data_dir)
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, data_dir / "2022WAS.EVN")
+    table_load = mocker.spy(store.PlayTable, "load")
+
+    store.update([2022], data_dir)
+
+    table_load.assert_called_once_with([2022], data_dir, compression=None)
+    play_store = store.PlayStore.open(data_dir)
+    expected = PlayTable.load([2021, 2022], data_dir)
+    assert play_store.years.tolist() == [2021, 2022]
+    assert play_store.game_ids.tolist() == expected.game_ids
+    assert play_store.season_games(2022) == slice(1, 2)
+    for name, column in expected.to_numpy().items():
+        if name not in {"batter", "team"}:
+            assert np.array_equal(play_store.columns[name], column)
+    assert play_store.batter_ids[play_store.columns["batter"]].tolist() == [
+        expected.batter_ids[code] for code in expected.batter
+    ]
+    assert play_store.team_ids[play_store.columns["team"]].tolist() == [
+        expected.team_ids[code] for code in expected.team
+    ]
+    # published as a new version, keeping the replaced one for its readers
+    assert old_store.season_games(2022) == slice(1, 3)
+
+
+def test_update__adds_years_not_in_store(data_dir):
+    store.build([2022], data_dir)
+
+    store.update([2021], data_dir)
+
+    play_store = store.PlayStore.open(data_dir)
+    assert play_store.years.tolist() == [2021, 2022]
+    assert play_store.game_ids.tolist() == PlayTable.load([2021, 2022], data_dir).game_ids
+
+
+def test_refresh_target(mocker, data_dir):
+    update = mocker.patch(f"{MODULE_PATH}.update")
+    target = store.refresh_target(data_dir)
+
+    # no store yet
+    target(RefreshResult(2022, removed_game_ids=["WAS202204080"]))
+    store.build([2022], data_dir)
+    target(RefreshResult(2022))
+    target(RefreshResult(2021, removed_game_ids=["WAS202104080"]))
+    target(RefreshResult(2022, removed_game_ids=["WAS202204080"]))
+
+    update.assert_called_once_with([2022], data_dir, None)
+
+
+def test_open__raises_on_store_built_with_other_columns(mocker, data_dir):
+    store.build([2021], data_dir)
+    # e.g. the `visiting_score` and `home_score` columns added to `PlayTable` after the store was built
+    mocker.patch.object(PlayTable, "column_names", return_value=[*PlayTable.column_names(), "new_column"])
+
+    with pytest.raises(store.OutdatedStoreError, match="rebuild it with store.build"):
+        store.PlayStore.open(data_dir)
+
+
+def test_open__raises_on_store_built_before_versioned_dirs(data_dir):
+    store_dir = data_dir / store.STORE_DIR_NAME
+    store_dir.mkdir()
+    np.save(store_dir / "years.npy", np.array([2021], dtype=np.uint16))
+
+    with pytest.raises(store.OutdatedStoreError):
+        store.PlayStore.open(data_dir)
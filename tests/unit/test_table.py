@@ -0,0 +1,77 @@
+import pytest
+
+from pyretrosheet import table
+from pyretrosheet.models.game_state import FIRST, SECOND, THIRD
+from pyretrosheet.models.play import Play
+from pyretrosheet.models.play.description import BatterEvent
+from pyretrosheet.models.play.flags import PlayFlag
+from pyretrosheet.models.team import TeamLocation
+
+MODULE_PATH = "pyretrosheet.table"
+
+
+def test_play_table_from_games(real_game):
+    plays = [event for event in real_game.chronological_events if isinstance(event, Play)]
+
+    play_table = table.PlayTable.from_games([real_game, real_game])
+
+    assert len(play_table) == 2 * len(plays)
+    assert play_table.game_ids == [real_game.id.raw] * 2
+    assert list(play_table.game_index) == [0] * len(plays) + [1] * len(plays)
+    assert len(play_table.batter_ids) == len({play.batter_id for play in plays})
+    assert [play_table.batter_ids[code] for code in play_table.batter[: len(plays)]] == [p.batter_id for p in plays]
+    assert list(play_table.inning[: len(plays)]) == [p.inning for p in plays]
+    assert sum(play_table.outs_on_play[: len(plays)]) == sum(p.num_outs_on_play() for p in plays)
+    assert sum(play_table.rbi[: len(plays)]) == sum(p.num_rbis() for p in plays)
+    assert list(play_table.outs_before[: len(plays)]) == [state.before.outs for state in real_game.states]
+    assert list(play_table.bases_after[: len(plays)]) == [state.after.bases for state in real_game.states]
+    assert list(play_table.home_score[: len(plays)]) == [state.before.home_score for state in real_game.states]
+    assert len(play_table.fielder_put_outs) == len(play_table) * table.NUM_FIELDER_POSITIONS
+    assert sorted(play_table.team_ids) == sorted([real_game.home_team_id, real_game.visiting_team_id])
+    assert [play_table.team_ids[code] for code in play_table.team[: len(plays)]] == [
+        real_game.home_team_id if p.team_location == TeamLocation.HOME else real_game.visiting_team_id for p in plays
+    ]
+
+
+def test_play_table_from_games__extra_inning_runner_on_second(extra_inning_game):
+    play_table = table.PlayTable.from_games([extra_inning_game])
+
+    assert play_table.bases_before.tolist() == [0, SECOND, FIRST | THIRD, SECOND]
+
+
+def test_play_table_event_codes(real_game):
+    play_table = table.PlayTable.from_games([real_game])
+    num_singles = sum(1 for event in real_game.chronological_events if isinstance(event, Play) and event.is_single())
+
+    assert list(play_table.batter_event).count(table.batter_event_code(BatterEvent.SINGLE)) == num_singles
+    assert table.batter_event_code(None) == table.NO_EVENT
+
+
+def test_play_table_load(tmp_data_dir):
+    play_table = table.PlayTable.load([2022], data_dir=tmp_data_dir)
+
+    assert len(play_table.game_ids) == 3
+
+
+def test_play_table_to_numpy(real_game):
+    np = pytest.importorskip("numpy")
+    play_table = table.PlayTable.from_games([real_game])
+
+    columns = play_table.to_numpy()
+
+    assert set(columns) == set(table.PlayTable.column_names())
+    assert columns["fielder_put_outs"].shape == (len(play_table), table.NUM_FIELDER_POSITIONS)
+    # put outs are credited on every out except for strikeouts, where the catcher's put out is implied
+    assert columns["fielder_put_outs"].sum() <= columns["outs_on_play"].sum()
+    assert np.shares_memory(columns["inning"], np.frombuffer(play_table.inning, dtype="B"))
+
+
+def test_play_table_flags(real_game):
+    np = pytest.importorskip("numpy")
+    play_table = table.PlayTable.from_games([real_game])
+    plays = [event for event in real_game.chronological_events if isinstance(event, Play)]
+
+    columns = play_table.to_numpy()
+
+    assert list(play_table.flags) == [play.flags for play in plays]
+    assert np.count_nonzero(columns["flags"] & PlayFlag.HIT) == sum(play.is_hit() for play in plays)
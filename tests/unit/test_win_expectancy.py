@@ -0,0 +1,77 @@
+import shutil
+
+import pytest
+
+from pyretrosheet import win_expectancy
+from pyretrosheet.models.play.description import BatterEvent
+from pyretrosheet.models.team import TeamLocation
+from pyretrosheet.table import PlayTable, batter_event_code
+from tests import testing_data
+
+MODULE_PATH = "pyretrosheet.win_expectancy"
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture()
+def data_dir(tmp_path):
+    shutil.copy(testing_data.WAS_2022_TWO_GAME_EXAMPLE, tmp_path / "2022WAS.EVN")
+    shutil.copy(testing_data.WAS_2022_SINGLE_GAME_EXAMPLE, tmp_path / "2021WAS.EVN")
+    return tmp_path
+
+
+def _get_columns(game_index, team_location, runs, visiting_score, home_score):
+    num_plays = len(game_index)
+    return {
+        "game_index": np.array(game_index),
+        "inning": np.full(num_plays, 9),
+        "team_location": np.array(team_location),
+        "outs_before": np.zeros(num_plays, dtype=int),
+        "bases_before": np.zeros(num_plays, dtype=int),
+        "batter_event": np.full(num_plays, batter_event_code(BatterEvent.SINGLE)),
+        "runs": np.array(runs),
+        "visiting_score": np.array(visiting_score),
+        "home_score": np.array(home_score),
+    }
+
+
+def test_win_expectancy_from_columns():
+    columns = _get_columns(
+        # a home team walk-off win, a home team loss and a tie
+        game_index=[0, 0, 1, 1, 2],
+        team_location=[0, 1, 0, 1, 1],
+        runs=[0, 1, 1, 0, 0],
+        visiting_score=[0, 0, 0, 1, 0],
+        home_score=[0, 0, 0, 0, 0],
+    )
+
+    expectancy = win_expectancy.WinExpectancy.from_columns(columns)
+
+    assert expectancy.plays.sum() == 4
+    assert expectancy.home_wins.sum() == 2
+    assert expectancy.get(9, TeamLocation.VISITING, 0, 0, 0) == 0.5
+    assert expectancy.get(9, TeamLocation.HOME, 0, 0, 0) == 1.0
+    assert expectancy.get(12, TeamLocation.HOME, 0, 0, -1) == 0.0
+    assert np.isnan(expectancy.get(1, TeamLocation.HOME, 0, 0, 0))
+
+
+def test_wpa(real_game):
+    play_table = PlayTable.from_games([real_game])
+    columns = play_table.to_numpy()
+    expectancy = win_expectancy.WinExpectancy.from_table(play_table)
+
+    wpa = expectancy.wpa(columns)
+
+    assert wpa.shape == (len(play_table),)
+    # the home team's WPA over a game sums to its outcome less its win expectancy before the first play
+    home_wpa = np.where(columns["team_location"] == TeamLocation.HOME.value, wpa, -wpa)
+    home_won = real_game.states[-1].after.home_score > real_game.states[-1].after.visiting_score
+    assert home_wpa.sum() == pytest.approx(home_won - expectancy.win_expectancy(columns)[0])
+
+
+def test_win_expectancy_load(data_dir):
+    expectancy = win_expectancy.WinExpectancy.load([2021, 2022], data_dir, max_workers=2)
+
+    expected = win_expectancy.WinExpectancy.from_table(PlayTable.load([2021, 2022], data_dir))
+    assert expectancy.plays.tolist() == expected.plays.tolist()
+    assert expectancy.home_wins.tolist() == expected.home_wins.tolist()